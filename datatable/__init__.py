@@ -14,11 +14,12 @@
 
 from .widgets.datatable import DataTable
 from .widgets.utils import DataTableView
-from .models.datatable_model import DataTableModel, DataType, SortOrder
+from .models.datatable_model import DataTableModel, DataType, ScrollMode, SearchMode, SortOrder
+from .models.filter_expression import FilterExpression, FilterExpressionError
 from .models.delegates import CellDelegate, NumericDelegate, DateDelegate, BooleanDelegate, IconBooleanDelegate, ProgressBarDelegate, LineDelegate, ActionButtonsDelegate
 
 __version__ = "1.2.2"
 __author__ = 'Zuko'
 __email__ = 'tansautn@gmail.com'
-__all__ = ['DataTable', 'DataTableModel', 'DataType', 'SortOrder', 'DataTableView', 'CellDelegate', 'NumericDelegate', 'DateDelegate', 'BooleanDelegate', 'IconBooleanDelegate', 'ProgressBarDelegate', 'LineDelegate',
+__all__ = ['DataTable', 'DataTableModel', 'DataType', 'SearchMode', 'ScrollMode', 'SortOrder', 'FilterExpression', 'FilterExpressionError', 'DataTableView', 'CellDelegate', 'NumericDelegate', 'DateDelegate', 'BooleanDelegate', 'IconBooleanDelegate', 'ProgressBarDelegate', 'LineDelegate',
            'ActionButtonsDelegate']
@@ -11,14 +11,19 @@
 #                      * -  Copyright © 2026 (Z) Programing  - *
 #                      *    -  -  All Rights Reserved  -  -    *
 #                      * * * * * * * * * * * * * * * * * * * * *
-from .datatable_model import DataTableModel, DataType, SortOrder
+from .datatable_model import DataTableModel, DataType, ScrollMode, SearchMode, SortOrder
+from .filter_expression import FilterExpression, FilterExpressionError
 from .delegates import CellDelegate, NumericDelegate, DateDelegate, BooleanDelegate, ProgressBarDelegate, IconBooleanDelegate, LineDelegate, TextDelegate, ProgressDelegate, \
     ActionButtonsDelegate
 
 __all__ = [
     'DataTableModel',
     'DataType',
+    'SearchMode',
+    'ScrollMode',
     'SortOrder',
+    'FilterExpression',
+    'FilterExpressionError',
     'CellDelegate',
     'NumericDelegate',
     'DateDelegate',
@@ -11,11 +11,19 @@
 #                      * -  Copyright © 2026 (Z) Programing  - *
 #                      *    -  -  All Rights Reserved  -  -    *
 #                      * * * * * * * * * * * * * * * * * * * * *
+from bisect import bisect_left, bisect_right
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Callable, Union, Tuple
+from itertools import compress
+from typing import Any, Dict, List, Optional, Callable, Sequence, Set, Union, Tuple
 import datetime
+import operator
 
-from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal, QObject, QSortFilterProxyModel
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; structured filters fall back to Python lists
+    np = None
+
+from PySide6.QtCore import QAbstractTableModel, QCollator, QLocale, QModelIndex, Qt, Signal, QObject, QSortFilterProxyModel
 
 
 class DataType(Enum):
@@ -32,6 +40,19 @@ class DataType(Enum):
     ACTION_BUTTONS = auto()  # Inline action buttons per row
 
 
+# Column types that structured (range/comparison) filters evaluate as numbers; DATE as day ordinals
+NUMERIC_FILTER_TYPES = (DataType.NUMERIC, DataType.PROGRESS, DataType.PROGRESS_BAR, DataType.DATE)
+
+COMPARISON_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+
 class SortOrder(Enum):
     """Enum representing sort order"""
 
@@ -40,6 +61,21 @@ class SortOrder(Enum):
     NONE = -1
 
 
+class SearchMode(Enum):
+    """Enum representing how the search box text is matched"""
+
+    TEXT = 'text'  # case-insensitive substring, with column:term syntax
+    REGEX = 'regex'  # case-insensitive regular expression over the display text
+    FUZZY = 'fuzzy'  # typo-tolerant, best matches first (top-K)
+
+
+class ScrollMode(Enum):
+    """Enum representing how rows past the first screen are reached"""
+
+    PAGED = 'paged'  # page buttons, one page of rows at a time
+    INFINITE = 'infinite'  # the next chunk of rows is fetched when the view scrolls to the end
+
+
 class DataTableModel(QAbstractTableModel):
     """Model for the DataTable widget"""
 
@@ -56,12 +92,27 @@ class DataTableModel(QAbstractTableModel):
         self._editable_columns: Dict[str, bool] = {}
         self._visible_columns: List[str] = []
         self._search_funcs: Dict[str, Callable] = {}
+        self._default_search_columns: set = set()  # columns still using the built-in search function
+        self._search_text_cache: Dict[str, List[str]] = {}  # key -> lowercased display string per row
+        self._trigram_index: Optional[Dict[str, Set[int]]] = None  # trigram -> rows containing it (any column)
+        self._sorted_text_index: Dict[str, Tuple[List[str], List[int]]] = {}  # key -> (sorted texts, their rows)
+        self._numeric_cache: Dict[str, Any] = {}  # key -> float64 buffer (NaN = missing, spare capacity past the row count), or list without NumPy
+        self._facet_index: Dict[str, Dict[str, Set[int]]] = {}  # key -> display text -> rows showing it
+        self._facet_values: Dict[str, List[str]] = {}  # key -> display text per row (built with the facet index)
+        self._non_empty_cache: Dict[str, bytearray] = {}  # key -> 1 per row whose display text is non-blank
+        self._type_mask_cache: Dict[Tuple[DataType, Tuple[str, ...]], bytearray] = {}  # OR of non-empty masks per type
         self._sort_funcs: Dict[str, Callable] = {}
+        self._default_sort_columns: set = set()  # columns still using the built-in sort function
+        self._sort_key_cache: Dict[str, List[Any]] = {}  # key -> sort function result per row
+        self._sort_rank_cache: Dict[str, Tuple[int, List[int]]] = {}  # key -> (data version, rank per row)
         self._aggregation_funcs: Dict[str, Dict[str, Callable]] = {}
         self._expanded_rows: Dict[int, bool] = {}
         self._child_rows: Dict[int, List[Dict[str, Any]]] = {}
+        # Bumped on every change that can affect filtering or sorting (data, columns, formatters, search/sort funcs)
+        self._data_version = 0
 
         # Flags
+        self._search_index_enabled = False
         self._row_collapsing_enabled = False
         self._child_row_key = ''  # Key for child rows in parent row
 
@@ -106,6 +157,10 @@ class DataTableModel(QAbstractTableModel):
 
         return None
 
+    def dataVersion(self) -> int:
+        """Return a counter that changes whenever data or filter-relevant config changes"""
+        return self._data_version
+
     def getRowData(self, row: int) -> Optional[Dict[str, Any]]:
         """Get the entire data for a specific row."""
         if 0 <= row < len(self._data):
@@ -131,7 +186,25 @@ class DataTableModel(QAbstractTableModel):
             if not self._editable_columns.get(col_key, False):
                 return False
 
+            oldTrigrams = self._rowTrigrams(row) if self._trigram_index is not None else None
+            oldText = self._search_text_cache[col_key][row] if col_key in self._search_text_cache else None
+            oldFacet = self._facet_values[col_key][row] if col_key in self._facet_index else None
             self._data[row][col_key] = value
+            if oldFacet is not None:
+                self._moveFacetRow(col_key, row, oldFacet)
+            if oldText is not None:
+                self._search_text_cache[col_key][row] = self._toSearchText(col_key, value)
+                self._moveSortedText(col_key, row, oldText)
+            else:
+                self._sorted_text_index.pop(col_key, None)
+            self._updatePresenceBits(col_key, row)
+            if col_key in self._numeric_cache:
+                self._numeric_cache[col_key][row] = self._numericCell(col_key, value)
+            if col_key in self._sort_key_cache:
+                self._sort_key_cache[col_key][row] = self._sortKey(col_key, value)
+            if oldTrigrams is not None:
+                self._updateRowTrigrams(row, oldTrigrams)
+            self._data_version += 1
             self.dataChanged.emit(index, index, [role])  # TopLeft, BottomRight, Roles args
             return True
 
@@ -174,6 +247,19 @@ class DataTableModel(QAbstractTableModel):
         
         self._expanded_rows = {}
         self._child_rows = {}
+        # Per-column display text is built on first search of that column
+        self._search_text_cache = {}
+        # Non-empty and type bitmaps are built on the first type filter
+        self._non_empty_cache = {}
+        self._type_mask_cache = {}
+        self._trigram_index = self._buildTrigramIndex() if self._search_index_enabled else None
+        self._sorted_text_index = {}
+        self._numeric_cache = {}
+        self._facet_index = {}
+        self._facet_values = {}
+        self._sort_key_cache = {}
+        self._sort_rank_cache = {}
+        self._data_version += 1
         self.endResetModel()
     
     def _flattenData(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -230,6 +316,18 @@ class DataTableModel(QAbstractTableModel):
         self._column_types = {}
         self._header_map = {}
         self._visible_columns = []
+        self._default_search_columns = set()
+        self._default_sort_columns = set()
+        self._search_text_cache = {}
+        self._trigram_index = None
+        self._sorted_text_index = {}
+        self._numeric_cache = {}
+        self._facet_index = {}
+        self._facet_values = {}
+        self._non_empty_cache = {}
+        self._type_mask_cache = {}
+        self._sort_key_cache = {}
+        self._sort_rank_cache = {}
 
         for key, header, data_type in columns:
             self._headers.append(header)
@@ -254,6 +352,7 @@ class DataTableModel(QAbstractTableModel):
             # Set default sort functions
             self._setupDefaultSortFunctions(key, data_type)
 
+        self._data_version += 1
         self.endResetModel()
 
     def setFormattingFunction(self, column_key: str, func: Callable) -> None:
@@ -265,6 +364,15 @@ class DataTableModel(QAbstractTableModel):
         """
         if column_key in self._column_keys:
             self._formatting_funcs[column_key] = func
+            # Display text changed — rebuilt lazily on next search
+            self._search_text_cache.pop(column_key, None)
+            self._trigram_index = None
+            self._sorted_text_index.pop(column_key, None)
+            self._facet_index.pop(column_key, None)
+            self._facet_values.pop(column_key, None)
+            self._non_empty_cache.pop(column_key, None)
+            self._type_mask_cache = {}
+            self._data_version += 1
             # Force refresh display of this column
             if column_key in self._visible_columns:
                 col_index = self._visible_columns.index(column_key)
@@ -297,6 +405,7 @@ class DataTableModel(QAbstractTableModel):
         # Rebuild headers using permanent _header_map (avoids truncation bug)
         self._headers = [self._header_map.get(col, col) for col in visible_columns]
 
+        self._data_version += 1
         self.endResetModel()
 
     def setSearchFunction(self, column_key: str, func: Callable) -> None:
@@ -304,10 +413,14 @@ class DataTableModel(QAbstractTableModel):
 
         Args:
             column_key: Column key
-            func: Search function that takes (value, search_term) and returns boolean
+            func: Search function that takes (value, search_term) and returns boolean.
+                Searches over this column always test every row (no narrowing or
+                trigram pruning), since the function need not match substrings
         """
         if column_key in self._column_keys:
             self._search_funcs[column_key] = func
+            self._default_search_columns.discard(column_key)
+            self._data_version += 1
 
     def setSortFunction(self, column_key: str, func: Callable) -> None:
         """Set sort function for a column
@@ -318,6 +431,38 @@ class DataTableModel(QAbstractTableModel):
         """
         if column_key in self._column_keys:
             self._sort_funcs[column_key] = func
+            self._default_sort_columns.discard(column_key)
+            self._sort_key_cache.pop(column_key, None)
+            self._sort_rank_cache.pop(column_key, None)
+            self._data_version += 1
+
+    def enableSortCollation(self, column_key: str, enabled: bool = True, locale: Union[QLocale, str, None] = None, numeric: bool = False) -> None:
+        """Sort a column in the collation order of a locale
+
+        Accented text (e.g. Vietnamese) is ordered as the locale's alphabet,
+        case-insensitively. Each value's QCollator sort key is computed once
+        per row and cached like any sort key, so sorting compares the
+        precomputed keys instead of collating every pair of strings.
+
+        Args:
+            column_key: Column key
+            enabled: False restores the column type's default sort function
+            locale: QLocale or locale name, example: 'vi_VN' (default: the system locale)
+            numeric: Compare digit runs by value ('item2' before 'item10')
+        """
+        if column_key not in self._column_keys:
+            return
+        if not enabled:
+            self._setupDefaultSortFunctions(column_key, self._column_types.get(column_key, DataType.STRING))
+        else:
+            collator = QCollator(QLocale(locale) if isinstance(locale, str) else locale or QLocale())
+            collator.setCaseSensitivity(Qt.CaseInsensitive)
+            collator.setNumericMode(numeric)
+            self._sort_funcs[column_key] = lambda val: collator.sortKey('' if val is None else str(val))
+            self._default_sort_columns.discard(column_key)
+        self._sort_key_cache.pop(column_key, None)
+        self._sort_rank_cache.pop(column_key, None)
+        self._data_version += 1
 
     def setAggregationFunction(self, column_key: str, agg_type: str, func: Callable) -> None:
         """Set aggregation function for a column
@@ -333,6 +478,8 @@ class DataTableModel(QAbstractTableModel):
 
     def _setupDefaultSearchFunctions(self, key: str, data_type: DataType) -> None:
         """Set up default search functions based on data type"""
+        # Table search answers these columns from the cached display text instead
+        self._default_search_columns.add(key)
         if data_type == DataType.STRING:
             self._search_funcs[key] = lambda val, term: term.lower() in str(val).lower()
         elif data_type == DataType.NUMERIC:
@@ -348,6 +495,8 @@ class DataTableModel(QAbstractTableModel):
 
     def _setupDefaultSortFunctions(self, key: str, data_type: DataType) -> None:
         """Set up default sort functions based on data type"""
+        # NUMERIC/PROGRESS/DATE columns then sort from the numeric column with NumPy
+        self._default_sort_columns.add(key)
         if data_type == DataType.STRING:
             self._sort_funcs[key] = lambda val: str(val).lower() if val is not None else ''
         elif data_type == DataType.NUMERIC:
@@ -361,6 +510,124 @@ class DataTableModel(QAbstractTableModel):
         else:
             self._sort_funcs[key] = lambda val: str(val) if val is not None else ''
 
+    def sortKeys(self, column_key: str) -> List[Any]:
+        """Get the column's sort function result for every row
+
+        Computed once per load and kept in sync by edits and inserts.
+
+        Args:
+            column_key: Column key
+
+        Returns:
+            List with one sort key per row
+        """
+        keys = self._sort_key_cache.get(column_key)
+        if keys is None:
+            keys = [self._sortKey(column_key, row.get(column_key)) for row in self._data]
+            self._sort_key_cache[column_key] = keys
+        return keys
+
+    def sortRanks(self, column_key: str) -> Any:
+        """Get each row's rank in ascending order of the column's sort keys
+
+        Rows with equal keys share a rank, so a stable sort by rank keeps their
+        order in both directions. Cached until the data changes. NUMERIC,
+        PROGRESS and DATE columns with the built-in sort function are ranked
+        from numericColumn with a stable NumPy argsort.
+
+        Args:
+            column_key: Column key
+
+        Returns:
+            int64 NumPy array with one rank per row, or a list of int when
+            NumPy is not installed
+        """
+        cached = self._sort_rank_cache.get(column_key)
+        if cached is not None and cached[0] == self._data_version:
+            return cached[1]
+        if self._ranksNumerically(column_key):
+            ranks = self._numericSortRanks(column_key)
+        else:
+            keys = self.sortKeys(column_key)
+            ranks = [0] * len(keys)
+            rank = -1
+            previous = None
+            for row in self._sortedRows(keys):
+                key = keys[row]
+                if rank < 0 or key != previous:
+                    rank += 1
+                    previous = key
+                ranks[row] = rank
+            if np is not None:
+                ranks = np.array(ranks, dtype=np.int64)
+        self._sort_rank_cache[column_key] = (self._data_version, ranks)
+        return ranks
+
+    def rowSortKey(self, column_key: str, row: int) -> Any:
+        """Get the key that places a row in sortRanks order
+
+        Comparing two rows' keys orders them as their ranks do, without
+        re-ranking the column (used to insert a row into a sorted view).
+
+        Args:
+            column_key: Column key
+            row: Source row index
+
+        Returns:
+            float for columns ranked from numericColumn, else the cached sort function result
+        """
+        if self._ranksNumerically(column_key):
+            value = float(self.numericColumn(column_key)[row])
+            if value != value:
+                # NaN: missing values are ranked as _numericSortRanks fills them
+                return 1.0 if self._column_types.get(column_key) == DataType.DATE else 0.0
+            return value
+        return self.sortKeys(column_key)[row]
+
+    def _ranksNumerically(self, column_key: str) -> bool:
+        return np is not None and column_key in self._default_sort_columns and self.isNumericFilterColumn(column_key)
+
+    def _numericSortRanks(self, column_key: str) -> Any:
+        """Dense ranks of a numeric/date column (float64 keys, missing values as the default sort function places them)"""
+        values = self.numericColumn(column_key)
+        missing = np.isnan(values)
+        if missing.any():
+            # Built-in sort functions map a missing value to 0, or to date.min (ordinal 1) for dates
+            values = np.where(missing, 1.0 if self._column_types.get(column_key) == DataType.DATE else 0.0, values)
+        order = np.argsort(values, kind='stable')
+        ordered = values[order]
+        starts = np.empty(len(values), dtype=bool)
+        starts[:1] = True
+        np.not_equal(ordered[1:], ordered[:-1], out=starts[1:])
+        ranks = np.empty(len(values), dtype=np.int64)
+        ranks[order] = np.cumsum(starts) - 1
+        return ranks
+
+    @staticmethod
+    def _sortedRows(keys: List[Any]) -> List[int]:
+        """Row indices in ascending key order (decorate-sort-undecorate)"""
+        try:
+            return sorted(range(len(keys)), key=keys.__getitem__)
+        except TypeError:
+            # Custom sort function returned mixed types: group by type, then by value or text
+            try:
+                return sorted(range(len(keys)), key=lambda row: (type(keys[row]).__name__, keys[row]))
+            except TypeError:
+                return sorted(range(len(keys)), key=lambda row: (type(keys[row]).__name__, str(keys[row])))
+
+    def _sortKey(self, column_key: str, value: Any) -> Any:
+        func = self._sort_funcs.get(column_key)
+        if func is None:
+            return '' if value is None else str(value)
+        try:
+            return func(value)
+        except Exception:
+            # Value the sort function cannot handle (e.g. text in a NUMERIC column): sort it like a missing one
+            try:
+                return func(None)
+            except Exception:
+                return ''
+
     # Row Collapsing Methods
     def enableRowCollapsing(self, enabled: bool = True, child_row_key: str = 'children') -> None:
         """Enable or disable row collapsing
@@ -502,6 +769,468 @@ class DataTableModel(QAbstractTableModel):
         
         return child_indices
 
+    # Search Text Cache
+    def searchTextColumn(self, column_key: str) -> List[str]:
+        """Get the lowercased display text of every row for a column
+
+        Built on first use after a load (or a formatter change) and kept in sync
+        by setData and row inserts, so repeated searches never re-run formatters
+        and columns that are never searched are never formatted.
+
+        Args:
+            column_key: Column key
+
+        Returns:
+            List of lowercased display strings, indexed by row
+        """
+        texts = self._search_text_cache.get(column_key)
+        if texts is None:
+            texts = self._buildSearchTextColumn(column_key)
+            self._search_text_cache[column_key] = texts
+        return texts
+
+    def nonEmptyColumn(self, column_key: str) -> bytearray:
+        """Get a per-row flag (1/0) telling whether the column's display text is non-blank
+
+        Args:
+            column_key: Column key
+
+        Returns:
+            bytearray with one byte per row
+        """
+        mask = self._non_empty_cache.get(column_key)
+        if mask is None:
+            mask = bytearray(1 if text.strip() else 0 for text in self.searchTextColumn(column_key))
+            self._non_empty_cache[column_key] = mask
+        return mask
+
+    def typePresenceMask(self, data_type: DataType, columns: Optional[List[str]] = None) -> bytearray:
+        """Get a per-row flag (1/0): the row has a non-blank value in at least one column of data_type
+
+        Built on the first call for a type after a load and kept up to date by
+        edits and inserts, so later DataType filters are a bitmap lookup
+        instead of a formatting pass.
+
+        Args:
+            data_type: Column data type
+            columns: Columns to consider (default: visible columns)
+
+        Returns:
+            bytearray with one byte per row
+        """
+        if columns is None:
+            columns = self._visible_columns
+        typed = tuple(key for key in columns if self._column_types.get(key) == data_type)
+        cacheKey = (data_type, typed)
+        mask = self._type_mask_cache.get(cacheKey)
+        if mask is None:
+            combined = 0
+            for key in typed:
+                # Bytes are 0/1, so OR-ing the little-endian integers ORs row by row
+                combined |= int.from_bytes(self.nonEmptyColumn(key), 'little')
+            mask = bytearray(combined.to_bytes(len(self._data), 'little'))
+            self._type_mask_cache[cacheKey] = mask
+        return mask
+
+    @staticmethod
+    def maskedRows(mask: bytes, rows: Optional[List[int]] = None) -> List[int]:
+        """Rows whose flag is set in mask (all rows when rows is None)"""
+        if rows is None:
+            return list(compress(range(len(mask)), mask))
+        return [row for row in rows if mask[row]]
+
+    def _updatePresenceBits(self, column_key: str, row: int) -> None:
+        """Refresh one row's non-empty flags after a cell edit"""
+        mask = self._non_empty_cache.get(column_key)
+        if mask is None:
+            return
+        mask[row] = 1 if self.searchTextColumn(column_key)[row].strip() else 0
+        for (data_type, columns), typeMask in self._type_mask_cache.items():
+            if column_key in columns:
+                typeMask[row] = 1 if any(self._non_empty_cache[key][row] for key in columns) else 0
+
+    def isDefaultSearchColumn(self, column_key: str) -> bool:
+        """Check whether a column still uses the built-in (substring) search function"""
+        return column_key in self._default_search_columns
+
+    def enableSearchIndex(self, enabled: bool = True) -> None:
+        """Enable or disable the trigram index used to answer substring searches
+
+        The index maps every 3-character sequence of the display text to the rows
+        containing it, so a search term of 3+ characters only has to verify the
+        rows present in all of its trigrams' posting lists.
+
+        Args:
+            enabled: Whether the index is built and maintained
+        """
+        self._search_index_enabled = enabled
+        self._trigram_index = self._buildTrigramIndex() if enabled else None
+
+    def searchIndexCandidates(self, term: str) -> Optional[Set[int]]:
+        """Get the rows that may contain term in any column, using the trigram index
+
+        Args:
+            term: Search term
+
+        Returns:
+            Superset of the rows whose display text contains term, or None when the
+            index is disabled or the term is shorter than 3 characters
+        """
+        if not self._search_index_enabled or len(term) < 3:
+            return None
+        if self._trigram_index is None:
+            self._trigram_index = self._buildTrigramIndex()
+        postings = []
+        for trigram in self._trigrams(term.lower()):
+            rows = self._trigram_index.get(trigram)
+            if not rows:
+                return set()
+            postings.append(rows)
+        # Intersect smallest posting lists first
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for rows in postings[1:]:
+            candidates &= rows
+            if not candidates:
+                break
+        return candidates
+
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def _rowTrigrams(self, row: int) -> Set[str]:
+        """All trigrams of a row's display text across every column"""
+        trigrams: Set[str] = set()
+        for col_key in self._column_keys:
+            trigrams |= self._trigrams(self.searchTextColumn(col_key)[row])
+        return trigrams
+
+    def _updateRowTrigrams(self, row: int, oldTrigrams: Set[str]) -> None:
+        """Move a row between posting lists after its display text changed"""
+        newTrigrams = self._rowTrigrams(row)
+        for trigram in oldTrigrams - newTrigrams:
+            rows = self._trigram_index.get(trigram)
+            if rows is not None:
+                rows.discard(row)
+                if not rows:
+                    del self._trigram_index[trigram]
+        for trigram in newTrigrams - oldTrigrams:
+            self._trigram_index.setdefault(trigram, set()).add(row)
+
+    def _buildTrigramIndex(self) -> Dict[str, Set[int]]:
+        """Build the trigram -> rows index over every column's display text"""
+        index: Dict[str, Set[int]] = {}
+        for col_key in self._column_keys:
+            for row, text in enumerate(self.searchTextColumn(col_key)):
+                for i in range(len(text) - 2):
+                    rows = index.get(text[i:i + 3])
+                    if rows is None:
+                        index[text[i:i + 3]] = {row}
+                    else:
+                        rows.add(row)
+        return index
+
+    # Column-Scoped Search
+    def resolveSearchColumn(self, name: str) -> Optional[str]:
+        """Resolve a name typed in the search box to a visible column key
+
+        Args:
+            name: Column key or header text (case-insensitive, spaces optional)
+
+        Returns:
+            Column key, or None if no visible column matches
+        """
+        name = name.lower()
+        for col_key in self._visible_columns:
+            if col_key.lower() == name:
+                return col_key
+        for col_key in self._visible_columns:
+            if self._header_map.get(col_key, '').lower().replace(' ', '') == name:
+                return col_key
+        return None
+
+    def searchColumnIndex(self, column_key: str, term: str, prefix: bool = False) -> List[int]:
+        """Get the rows whose display text in a column equals (or starts with) term
+
+        Uses a per-column sorted index of the lowercased display text, built on
+        first use and kept in sync by setData and appended rows, so an exact or
+        prefix lookup is two binary searches instead of a column scan.
+
+        Args:
+            column_key: Column key
+            term: Lowercased display text to look up
+            prefix: Match rows whose text starts with term instead of equals it
+
+        Returns:
+            Matching row indices in ascending order
+        """
+        texts, rows = self._sortedTextColumn(column_key)
+        lo = bisect_left(texts, term)
+        if prefix:
+            hi = bisect_left(texts, term[:-1] + chr(ord(term[-1]) + 1), lo) if term else len(texts)
+        else:
+            hi = bisect_right(texts, term, lo)
+        return sorted(rows[lo:hi])
+
+    def _sortedTextColumn(self, column_key: str) -> Tuple[List[str], List[int]]:
+        index = self._sorted_text_index.get(column_key)
+        if index is None:
+            pairs = sorted((text, row) for row, text in enumerate(self.searchTextColumn(column_key)))
+            index = ([text for text, _ in pairs], [row for _, row in pairs])
+            self._sorted_text_index[column_key] = index
+        return index
+
+    def _moveSortedText(self, column_key: str, row: int, oldText: Optional[str]) -> None:
+        """Reposition a row in a column's sorted index after its text changed (oldText None = new row)"""
+        index = self._sorted_text_index.get(column_key)
+        if index is None:
+            return
+        texts, rows = index
+        if oldText is not None:
+            pos = bisect_left(texts, oldText)
+            while pos < len(texts) and rows[pos] != row:
+                pos += 1
+            if pos < len(texts):
+                del texts[pos]
+                del rows[pos]
+        newText = self.searchTextColumn(column_key)[row]
+        pos = bisect_right(texts, newText)
+        texts.insert(pos, newText)
+        rows.insert(pos, row)
+
+    # Facets
+    def facetIndex(self, column_key: str) -> Dict[str, Set[int]]:
+        """Get the value -> rows hash index of a column
+
+        Keys are the display text (formatter applied). Built on first use and
+        kept in sync by setData and appended rows; inserting in the middle
+        drops it to be rebuilt on next use.
+
+        Args:
+            column_key: Column key
+
+        Returns:
+            Dict of display text -> set of row indices
+        """
+        index = self._facet_index.get(column_key)
+        if index is None:
+            index = {}
+            values = [self._displayText(column_key, row_data.get(column_key)) for row_data in self._data]
+            for row, text in enumerate(values):
+                rows = index.get(text)
+                if rows is None:
+                    index[text] = {row}
+                else:
+                    rows.add(row)
+            self._facet_index[column_key] = index
+            self._facet_values[column_key] = values
+        return index
+
+    def facetValueColumn(self, column_key: str) -> List[str]:
+        """Get the display text of every row for a column (the facet index's inverse)
+
+        Args:
+            column_key: Column key
+
+        Returns:
+            List of display strings, indexed by row
+        """
+        self.facetIndex(column_key)
+        return self._facet_values[column_key]
+
+    def facetValues(self, column_key: str) -> List[str]:
+        """Get the distinct display values of a column, sorted"""
+        return sorted(self.facetIndex(column_key))
+
+    def facetRows(self, column_key: str, values: Any) -> Set[int]:
+        """Get the rows whose display value in a column is one of values
+
+        Args:
+            column_key: Column key
+            values: Display values to match
+
+        Returns:
+            New set of row indices (union of the values' posting sets)
+        """
+        index = self.facetIndex(column_key)
+        rows: Set[int] = set()
+        for value in values:
+            rows |= index.get(value, set())
+        return rows
+
+    def _moveFacetRow(self, column_key: str, row: int, oldText: Optional[str]) -> None:
+        """Move a row between value sets after its display value changed (oldText None = new row)"""
+        index = self._facet_index[column_key]
+        if oldText is not None:
+            rows = index.get(oldText)
+            if rows is not None:
+                rows.discard(row)
+                if not rows:
+                    del index[oldText]
+        text = self._displayText(column_key, self._data[row].get(column_key))
+        self._facet_values[column_key][row] = text
+        index.setdefault(text, set()).add(row)
+
+    def _displayText(self, column_key: str, value: Any) -> str:
+        """Display string of a raw value (what data(DisplayRole) shows)"""
+        formatter = self._formatting_funcs.get(column_key)
+        if formatter is not None:
+            value = formatter(value)
+        return '' if value is None else str(value)
+
+    # Structured Column Filters
+    def isNumericFilterColumn(self, column_key: str) -> bool:
+        """Check whether range/comparison filters can be applied to a column"""
+        return self._column_types.get(column_key) in NUMERIC_FILTER_TYPES
+
+    def toFilterNumber(self, column_key: str, value: Any) -> Optional[float]:
+        """Convert a raw value of a numeric/date column to the number filters compare
+
+        Args:
+            column_key: Column key
+            value: Raw cell value (or filter bound)
+
+        Returns:
+            float (DATE: proleptic day ordinal), or None if the value is not comparable
+        """
+        if isinstance(value, datetime.datetime):
+            return value.toordinal() + (value.hour * 3600 + value.minute * 60 + value.second) / 86400
+        if isinstance(value, datetime.date):
+            return float(value.toordinal())
+        if value is None or isinstance(value, bool):
+            return None
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, str):
+            try:
+                if self._column_types.get(column_key) == DataType.DATE:
+                    return self.toFilterNumber(column_key, datetime.date.fromisoformat(value.strip()))
+                return float(value)
+            except ValueError:
+                return None
+        return None
+
+    def numericColumn(self, column_key: str) -> Any:
+        """Get a column's values as numbers for structured filters
+
+        Materialized once per load and kept in sync by edits and inserts.
+
+        Args:
+            column_key: Column key
+
+        Returns:
+            float64 NumPy array with NaN for missing values, or a list of
+            Optional[float] when NumPy is not installed
+        """
+        values = self._numeric_cache.get(column_key)
+        if values is None:
+            numbers = [self.toFilterNumber(column_key, row.get(column_key)) for row in self._data]
+            if np is not None:
+                values = np.array([np.nan if number is None else number for number in numbers], dtype=np.float64)
+            else:
+                values = numbers
+            self._numeric_cache[column_key] = values
+        if np is not None:
+            # The buffer may hold spare capacity for inserted rows
+            return values[:len(self._data)]
+        return values
+
+    def columnFilterMask(self, filters: Sequence[Tuple[str, str, Any]]) -> Optional[bytes]:
+        """Evaluate AND-ed comparison filters to a per-row flag mask
+
+        Args:
+            filters: (column_key, operator, value) tuples; operators are the keys
+                of COMPARISON_OPERATORS and value a number (or date for DATE columns)
+
+        Returns:
+            bytes with one 0/1 flag per row, or None if filters is empty.
+            Rows with a missing/non-numeric value never match.
+        """
+        if not filters:
+            return None
+        if np is not None:
+            mask = np.ones(len(self._data), dtype=bool)
+            for column_key, op, value in filters:
+                values = self.numericColumn(column_key)
+                with np.errstate(invalid='ignore'):
+                    mask &= COMPARISON_OPERATORS[op](values, self.toFilterNumber(column_key, value))
+                if op == '!=':
+                    mask &= ~np.isnan(values)
+            return mask.tobytes()
+        combined = -1
+        for column_key, op, value in filters:
+            compare = COMPARISON_OPERATORS[op]
+            bound = self.toFilterNumber(column_key, value)
+            flags = bytes(1 if number is not None and compare(number, bound) else 0 for number in self.numericColumn(column_key))
+            # Bytes are 0/1, so AND-ing the little-endian integers ANDs row by row
+            combined &= int.from_bytes(flags, 'little')
+        return (combined & ((1 << (8 * len(self._data))) - 1)).to_bytes(len(self._data), 'little')
+
+    def columnFilterRows(self, filters: Sequence[Tuple[str, str, Any]], rows: Sequence[int]) -> List[int]:
+        """Keep the rows passing every comparison filter, testing only those rows
+
+        Same semantics as columnFilterMask without evaluating the whole table
+        (e.g. for a few inserted rows).
+
+        Args:
+            filters: (column_key, operator, value) tuples, as for columnFilterMask
+            rows: Row indices to test
+
+        Returns:
+            The rows of rows that match, in order
+        """
+        tests = [(column_key, COMPARISON_OPERATORS[op], self.toFilterNumber(column_key, value)) for column_key, op, value in filters]
+        matched = []
+        for row in rows:
+            row_data = self._data[row]
+            for column_key, compare, bound in tests:
+                number = self.toFilterNumber(column_key, row_data.get(column_key))
+                if number is None or bound is None or not compare(number, bound):
+                    break
+            else:
+                matched.append(row)
+        return matched
+
+    @staticmethod
+    def _insertNumber(values: Any, row_index: int, number: float, count: int) -> Any:
+        """Insert into a numeric cache buffer, doubling its capacity when full
+
+        Args:
+            values: float64 buffer holding count - 1 rows
+            row_index: Index of the new row
+            number: Value of the new row (NaN = missing)
+            count: Row count after the insert
+
+        Returns:
+            The buffer (a new one when it had to grow)
+        """
+        if len(values) < count:
+            grown = np.empty(max(2 * len(values), 16), dtype=np.float64)
+            grown[:count - 1] = values[:count - 1]
+            values = grown
+        # Overlapping slice assignment: NumPy shifts the tail like a memmove
+        values[row_index + 1:count] = values[row_index:count - 1]
+        values[row_index] = number
+        return values
+
+    def _numericCell(self, column_key: str, value: Any) -> Any:
+        number = self.toFilterNumber(column_key, value)
+        if np is not None and number is None:
+            return np.nan
+        return number
+
+    def _toSearchText(self, column_key: str, value: Any) -> str:
+        """Normalize a raw value to its lowercased display string"""
+        if self._column_types.get(column_key) == DataType.ICON_BOOLEAN and column_key not in self._formatting_funcs:
+            # Shown as an icon: searched by the Yes/No text of BOOLEAN columns
+            return 'yes' if value else 'no'
+        return self._displayText(column_key, value).lower()
+
+    def _buildSearchTextColumn(self, column_key: str) -> List[str]:
+        """Build the lowercased display strings for one column"""
+        return [self._toSearchText(column_key, row.get(column_key)) for row in self._data]
+
     # Search and Filter Methods
     def search(self, term: str) -> List[int]:
         """Search all rows for term
@@ -634,6 +1363,38 @@ class DataTableModel(QAbstractTableModel):
         # Insert the row at the specified index
         self.beginInsertRows(QModelIndex(), row_index, row_index)
         self._data.insert(row_index, row_data)
+        for col_key, texts in self._search_text_cache.items():
+            texts.insert(row_index, self._toSearchText(col_key, row_data.get(col_key)))
+        for col_key, mask in self._non_empty_cache.items():
+            text = self._search_text_cache[col_key][row_index] if col_key in self._search_text_cache else self._toSearchText(col_key, row_data.get(col_key))
+            mask.insert(row_index, 1 if text.strip() else 0)
+        for (data_type, columns), mask in self._type_mask_cache.items():
+            mask.insert(row_index, 1 if any(self._non_empty_cache[key][row_index] for key in columns) else 0)
+        if self._trigram_index is not None:
+            if row_index == len(self._data) - 1:
+                self._updateRowTrigrams(row_index, set())
+            else:
+                # Row ids after row_index shift — rebuilt lazily on next search
+                self._trigram_index = None
+        for col_key, values in self._numeric_cache.items():
+            number = self._numericCell(col_key, row_data.get(col_key))
+            if np is not None:
+                self._numeric_cache[col_key] = self._insertNumber(values, row_index, number, len(self._data))
+            else:
+                values.insert(row_index, number)
+        for col_key, keys in self._sort_key_cache.items():
+            keys.insert(row_index, self._sortKey(col_key, row_data.get(col_key)))
+        if row_index == len(self._data) - 1:
+            for col_key in self._sorted_text_index:
+                self._moveSortedText(col_key, row_index, None)
+            for col_key in self._facet_index:
+                self._facet_values[col_key].append('')
+                self._moveFacetRow(col_key, row_index, None)
+        else:
+            self._sorted_text_index = {}
+            self._facet_index = {}
+            self._facet_values = {}
+        self._data_version += 1
         self.endInsertRows()
 
         # Emit signals with proper parameters
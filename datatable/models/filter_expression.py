@@ -0,0 +1,234 @@
+#                      M""""""""`M            dP
+#                      Mmmmmm   .M            88
+#                      MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                      MMP  .MMMMM  88    88  88888"    88'  `88
+#                      M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                      M         M  `88888P'  dP   `YP  `88888P'
+#                      MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                      * * * * * * * * * * * * * * * * * * * * *
+#                      * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                      * -  Copyright © 2026 (Z) Programing  - *
+#                      *    -  -  All Rights Reserved  -  -    *
+#                      * * * * * * * * * * * * * * * * * * * * *
+import ast
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+from .datatable_model import COMPARISON_OPERATORS, np
+
+if TYPE_CHECKING:
+    from .datatable_model import DataTableModel
+
+
+class FilterExpressionError(ValueError):
+    """Raised when a filter expression cannot be parsed or references unknown columns"""
+
+
+_AST_OPERATORS = {
+    ast.Lt: '<',
+    ast.LtE: '<=',
+    ast.Gt: '>',
+    ast.GtE: '>=',
+    ast.Eq: '==',
+    ast.NotEq: '!=',
+}
+_SWAPPED = {'<': '>', '<=': '>=', '>': '<', '>=': '<=', '==': '==', '!=': '!='}
+
+RowPredicate = Callable[[Dict[str, Any]], bool]
+
+
+class FilterExpression:
+    """A boolean filter expression compiled once against the model's column schema
+
+    Grammar (a safe subset of Python expressions):
+        amount > 1000 and status == 'open' and not archived
+        0 <= progress < 50 or due < '2024-01-01'
+        status in ('open', 'pending')
+
+    Names are column keys, literals are numbers, strings, True/False/None and
+    tuples/lists of those. Comparisons on NUMERIC/PROGRESS/DATE columns compare
+    numbers (DATE literals may be ISO date strings) and run as vectorized NumPy
+    masks when NumPy is installed; everything else compares the raw cell value.
+    A row with a missing value never satisfies a comparison.
+    """
+
+    def __init__(self, text: str, model: 'DataTableModel'):
+        """Parse and compile text
+
+        Args:
+            text: Expression source
+            model: Model whose column schema resolves names and literals
+
+        Raises:
+            FilterExpressionError: On syntax errors, unsupported constructs or unknown columns
+        """
+        self.text = text
+        self._model = model
+        try:
+            tree = ast.parse(text.strip(), mode='eval')
+        except SyntaxError as e:
+            raise FilterExpressionError(f'Invalid filter expression: {e.msg}') from e
+        self.predicate: RowPredicate = self._compilePredicate(tree.body)
+        self._maskFn = self._compileMask(tree.body) if np is not None else None
+
+    def mask(self) -> bytes:
+        """Evaluate the expression over every row of the model
+
+        Returns:
+            bytes with one 0/1 flag per row
+        """
+        if self._maskFn is not None:
+            return self._maskFn().tobytes()
+        predicate = self.predicate
+        return bytes(1 if predicate(row) else 0 for row in self._model._data)
+
+    # Compilation to a row predicate
+    def _compilePredicate(self, node: ast.AST) -> RowPredicate:
+        if isinstance(node, ast.BoolOp):
+            parts = [self._compilePredicate(value) for value in node.values]
+            if isinstance(node.op, ast.And):
+                return lambda row: all(part(row) for part in parts)
+            return lambda row: any(part(row) for part in parts)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            operand = self._compilePredicate(node.operand)
+            return lambda row: not operand(row)
+        if isinstance(node, ast.Compare):
+            parts = [self._comparePredicate(left, op, right) for left, op, right in self._comparisons(node)]
+            return parts[0] if len(parts) == 1 else (lambda row: all(part(row) for part in parts))
+        if isinstance(node, ast.Name):
+            key = self._column(node)
+            return lambda row: bool(row.get(key))
+        raise self._unsupported(node)
+
+    def _comparePredicate(self, left: ast.AST, op: ast.cmpop, right: ast.AST) -> RowPredicate:
+        if isinstance(op, (ast.In, ast.NotIn)):
+            key = self._column(left)
+            members = self._literal(right)
+            if not isinstance(members, (tuple, list)):
+                raise FilterExpressionError('Right side of "in" must be a tuple or list of literals')
+            members = frozenset(members)
+            negate = isinstance(op, ast.NotIn)
+            return lambda row: (row.get(key) in members) != negate
+        compare = COMPARISON_OPERATORS[self._operator(op)]
+        leftValue = self._valueGetter(left, right)
+        rightValue = self._valueGetter(right, left)
+        if not isinstance(left, ast.Name) and not isinstance(right, ast.Name):
+            raise FilterExpressionError('A comparison needs a column name on one side')
+
+        def predicate(row: Dict[str, Any]) -> bool:
+            a, b = leftValue(row), rightValue(row)
+            if a is None or b is None:
+                return False
+            try:
+                return bool(compare(a, b))
+            except TypeError:
+                return False
+
+        return predicate
+
+    def _valueGetter(self, node: ast.AST, other: ast.AST) -> Callable[[Dict[str, Any]], Any]:
+        """Row -> comparable value for one operand (numbers for numeric/date columns)"""
+        model = self._model
+        if isinstance(node, ast.Name):
+            key = self._column(node)
+            if model.isNumericFilterColumn(key):
+                return lambda row: model.toFilterNumber(key, row.get(key))
+            return lambda row: row.get(key)
+        value = self._literal(node)
+        if isinstance(other, ast.Name):
+            value = self._bound(self._column(other), value)
+        return lambda row: value
+
+    # Compilation to NumPy masks
+    def _compileMask(self, node: ast.AST) -> Callable[[], Any]:
+        if isinstance(node, ast.BoolOp):
+            parts = [self._compileMask(value) for value in node.values]
+            if isinstance(node.op, ast.And):
+                return lambda: np.logical_and.reduce([part() for part in parts])
+            return lambda: np.logical_or.reduce([part() for part in parts])
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            operand = self._compileMask(node.operand)
+            return lambda: ~operand()
+        if isinstance(node, ast.Compare):
+            parts = [self._compareMask(left, op, right) for left, op, right in self._comparisons(node)]
+            return parts[0] if len(parts) == 1 else (lambda: np.logical_and.reduce([part() for part in parts]))
+        return self._rowMask(self._compilePredicate(node))
+
+    def _compareMask(self, left: ast.AST, op: ast.cmpop, right: ast.AST) -> Callable[[], Any]:
+        model = self._model
+        if isinstance(op, (ast.In, ast.NotIn)) or not all(
+            not isinstance(side, ast.Name) or model.isNumericFilterColumn(side.id) for side in (left, right)
+        ):
+            return self._rowMask(self._comparePredicate(left, op, right))
+        symbol = self._operator(op)
+        if not isinstance(left, ast.Name):
+            left, right, symbol = right, left, _SWAPPED[symbol]
+        compare = COMPARISON_OPERATORS[symbol]
+        leftKey = self._column(left)
+        if isinstance(right, ast.Name):
+            rightKey = self._column(right)
+            rightValue = lambda: model.numericColumn(rightKey)
+        else:
+            bound = self._bound(leftKey, self._literal(right))
+            if not isinstance(bound, float):
+                return self._rowMask(self._comparePredicate(left, op, right))
+            rightValue = lambda: bound
+
+        def mask() -> Any:
+            values = model.numericColumn(leftKey)
+            other = rightValue()
+            with np.errstate(invalid='ignore'):
+                result = compare(values, other)
+            # NaN (missing) compares False except for '!='
+            return result & ~np.isnan(values) & ~np.isnan(other) if symbol == '!=' else result
+
+        return mask
+
+    def _rowMask(self, predicate: RowPredicate) -> Callable[[], Any]:
+        model = self._model
+        return lambda: np.fromiter((predicate(row) for row in model._data), dtype=bool, count=len(model._data))
+
+    # Helpers
+    @staticmethod
+    def _comparisons(node: ast.Compare):
+        """Split a chained comparison (a < b < c) into pairwise comparisons"""
+        operands = [node.left] + node.comparators
+        return [(operands[i], op, operands[i + 1]) for i, op in enumerate(node.ops)]
+
+    def _operator(self, op: ast.cmpop) -> str:
+        symbol = _AST_OPERATORS.get(type(op))
+        if symbol is None:
+            raise self._unsupported(op)
+        return symbol
+
+    def _column(self, node: ast.AST) -> str:
+        if not isinstance(node, ast.Name):
+            raise FilterExpressionError('Expected a column name')
+        if node.id not in self._model._column_types:
+            raise FilterExpressionError(f'Unknown column: {node.id}')
+        return node.id
+
+    def _literal(self, node: ast.AST) -> Any:
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) and isinstance(node.operand, ast.Constant):
+            if isinstance(node.operand.value, (int, float)):
+                return -node.operand.value
+        if isinstance(node, (ast.Tuple, ast.List)):
+            return tuple(self._literal(element) for element in node.elts)
+        if isinstance(node, ast.Name):
+            raise FilterExpressionError(f'Cannot compare column {node.id} here')
+        raise self._unsupported(node)
+
+    def _bound(self, column_key: str, value: Any) -> Any:
+        """Convert a literal compared against a numeric/date column to a number"""
+        if value is None or not self._model.isNumericFilterColumn(column_key):
+            return value
+        number = self._model.toFilterNumber(column_key, value)
+        if number is None:
+            raise FilterExpressionError(f'Invalid value for column {column_key}: {value!r}')
+        return number
+
+    @staticmethod
+    def _unsupported(node: ast.AST) -> FilterExpressionError:
+        return FilterExpressionError(f'Unsupported syntax in filter expression: {type(node).__name__}')
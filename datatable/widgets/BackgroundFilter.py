@@ -0,0 +1,124 @@
+#                      M""""""""`M            dP
+#                      Mmmmmm   .M            88
+#                      MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                      MMP  .MMMMM  88    88  88888"    88'  `88
+#                      M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                      M         M  `88888P'  dP   `YP  `88888P'
+#                      MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                      * * * * * * * * * * * * * * * * * * * * *
+#                      * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                      * -  Copyright © 2026 (Z) Programing  - *
+#                      *    -  -  All Rights Reserved  -  -    *
+#                      * * * * * * * * * * * * * * * * * * * * *
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
+
+if TYPE_CHECKING:
+    from .FilterSnapshot import FilterSnapshot
+    from .handlers.DataTableHandler import DataTableProxyModel
+
+
+class _WorkerSignals(QObject):
+    done = Signal(object, object)  # snapshot, rows (None when cancelled)
+
+
+class _FilterWorker(QRunnable):
+    '''Evaluates one FilterSnapshot on a QThreadPool thread.'''
+
+    def __init__(self, snapshot: 'FilterSnapshot', signals: _WorkerSignals):
+        super().__init__()
+        self._snapshot = snapshot
+        self._signals = signals
+
+    def run(self) -> None:
+        rows = self._snapshot.evaluate()
+        self._signals.done.emit(self._snapshot, rows)
+
+
+class BackgroundFilter(QObject):
+    '''Runs search + type evaluation on a worker thread over a copied snapshot.
+
+    While a worker runs, the proxy keeps serving its previous result set and
+    the UI stays responsive; `busyChanged` reports the state. A newer request
+    cancels the running snapshot cooperatively. When the latest worker
+    finishes, its row array is installed into the proxy and `onReady` lets
+    FilterFacade swap it in with a single layout change; `busyChanged(False)`
+    follows once the new rows are shown.
+    '''
+
+    busyChanged = Signal(bool)
+
+    def __init__(self, proxy: 'DataTableProxyModel', parent: Optional[QObject] = None, threadPool: Optional[QThreadPool] = None):
+        super().__init__(parent)
+        self._proxy = proxy
+        self._threadPool = threadPool or QThreadPool.globalInstance()
+        self._signals = _WorkerSignals(self)
+        self._signals.done.connect(self._onWorkerDone, Qt.QueuedConnection)
+        self._current: Optional['FilterSnapshot'] = None
+        self._onReady: Optional[Callable[[], None]] = None
+        self._finishing = False  # swapping a result in; busyChanged(False) follows
+
+    def isBusy(self) -> bool:
+        return self._current is not None
+
+    def start(self, onReady: Callable[[], None]) -> bool:
+        '''Start evaluating the current filters in the background.
+
+        Returns False when there is nothing to evaluate off-thread (no source
+        model, or the result is already cached); the caller then continues
+        synchronously.
+        '''
+        if not self._needsEvaluation():
+            self.cancel()
+            return False
+        proxy = self._proxy
+        wasBusy = self.isBusy() or self._finishing
+        if self._current is not None:
+            self._current.cancel()
+        snapshot = proxy.createFilterSnapshot(copy=True)
+        self._current = snapshot
+        self._onReady = onReady
+        proxy.holdFilterResult()
+        self._threadPool.start(_FilterWorker(snapshot, self._signals))
+        if not wasBusy:
+            self.busyChanged.emit(True)
+        return True
+
+    def _needsEvaluation(self) -> bool:
+        proxy = self._proxy
+        return proxy.sourceModel() is not None and not proxy._filterState.hasFilterResult(proxy.dataVersion())
+
+    def cancel(self) -> None:
+        '''Abandon the running evaluation, if any.'''
+        if self._current is None:
+            return
+        self._current.cancel()
+        self._current = None
+        self._onReady = None
+        self.busyChanged.emit(False)
+
+    def _onWorkerDone(self, snapshot: 'FilterSnapshot', rows: Optional[List[int]]) -> None:
+        if snapshot is not self._current:
+            return  # superseded by a newer request
+        onReady = self._onReady
+        if rows is None or not self._proxy.installFilterResult(snapshot, rows):
+            # Data changed under the worker — evaluate again from a fresh snapshot
+            # (or finish synchronously when the current result is already cached)
+            if self._needsEvaluation():
+                self.start(onReady)
+                return
+        self._current = None
+        self._onReady = None
+        # Single completion point: the result is swapped in (and the search settled) before reporting idle
+        self._finishing = True
+        try:
+            onReady()
+        finally:
+            self._finishing = False
+        # A listener may have started a newer evaluation meanwhile; stay busy for it
+        if self._current is None:
+            self.busyChanged.emit(False)
@@ -0,0 +1,462 @@
+#                      M""""""""`M            dP
+#                      Mmmmmm   .M            88
+#                      MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                      MMP  .MMMMM  88    88  88888"    88'  `88
+#                      M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                      M         M  `88888P'  dP   `YP  `88888P'
+#                      MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                      * * * * * * * * * * * * * * * * * * * * *
+#                      * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                      * -  Copyright © 2026 (Z) Programing  - *
+#                      *    -  -  All Rights Reserved  -  -    *
+#                      * * * * * * * * * * * * * * * * * * * * *
+from __future__ import annotations
+
+import heapq
+from collections import Counter
+from itertools import filterfalse
+from typing import Dict, Iterator, List, Optional, Set, TYPE_CHECKING, Tuple
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+from ..models.datatable_model import DataTableModel, SearchMode, SortOrder, np
+from .FilterSnapshot import FilterSnapshot
+from .SearchQuery import SearchQuery, compileFuzzyPattern, compileSearchPattern
+
+if TYPE_CHECKING:
+    from .FilterState import FilterState
+
+
+class FilterEngineMixin:
+    '''Filter evaluation shared by the proxy models.
+
+    Keeps the FilterState result cache in step with the source model and
+    evaluates search, facet, column and type filters into the cached list of
+    filtered source rows. Proxies only decide how those rows are exposed to
+    the view (per-row filterAcceptsRow callbacks or an index array).
+    '''
+
+    # A window ending within this fraction of the result set is served by a top-K sort
+    PARTIAL_SORT_FRACTION = 0.25
+
+    def _initFilterEngine(self, filterState: 'FilterState') -> None:
+        self._filterState = filterState
+        # Bumped by source model change signals; combined with DataTableModel.dataVersion()
+        # to key the FilterState result cache.
+        self._sourceRevision = 0
+        # Background filtering: serve the old result while a worker runs, swap in one layout change
+        self._holdResult = False
+        self._swapPending = False
+        # Data version whose cached result the rows being inserted can be spliced into
+        self._spliceVersion: Optional[Tuple[int, int]] = None
+
+    def _trackSourceModel(self, oldModel: Optional[QAbstractItemModel], newModel: Optional[QAbstractItemModel]) -> None:
+        '''Move the result cache invalidation from oldModel's change signals to newModel's.'''
+        if oldModel is not None:
+            for signal, slot in self._sourceChangeSignals(oldModel):
+                try:
+                    signal.disconnect(slot)
+                except (RuntimeError, TypeError):
+                    pass
+        if newModel is not None:
+            for signal, slot in self._sourceChangeSignals(newModel):
+                signal.connect(slot)
+        self._onSourceChanged()
+
+    def _sourceChangeSignals(self, model: QAbstractItemModel) -> list:
+        # "AboutTo" signals fire before the proxy re-filters inserted rows
+        return [
+            (model.modelAboutToBeReset, self._onSourceChanged),
+            (model.rowsAboutToBeInserted, self._onSourceRowsAboutToBeInserted),
+            (model.rowsInserted, self._onSourceRowsInserted),
+            (model.rowsAboutToBeRemoved, self._onSourceChanged),
+            (model.layoutAboutToBeChanged, self._onSourceChanged),
+            (model.dataChanged, self._onSourceEdited),
+        ]
+
+    def _onSourceChanged(self, *args) -> None:
+        self._sourceRevision += 1
+        self._filterState._invalidateCache()
+
+    def _onSourceEdited(self, *args) -> None:
+        # DataTableModel bumps its data version on every edit (and repaints inserted rows
+        # without changing them), so only other models need a revision bump
+        if not isinstance(self.sourceModel(), DataTableModel):
+            self._onSourceChanged()
+
+    def _onSourceRowsAboutToBeInserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        state = self._filterState
+        version = self.dataVersion()
+        # A current result in source order can take the new rows without re-filtering or re-sorting
+        spliceable = (
+            not parent.isValid()
+            and isinstance(self.sourceModel(), DataTableModel)
+            and not self._holdResult
+            and not self._resultIsRanked()
+            and state.hasFilterResult(version)
+        )
+        self._spliceVersion = version if spliceable else None
+        self._onSourceChanged()
+
+    def _resultIsRanked(self) -> bool:
+        '''Whether the result set is in fuzzy rank order (best first) instead of source order.'''
+        state = self._filterState
+        return bool(state.searchText) and state.searchMode == SearchMode.FUZZY
+
+    def _onSourceRowsInserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        version, self._spliceVersion = self._spliceVersion, None
+        spliced = version is not None and self._spliceInsertedRows(version, first, last)
+        self._sourceRowsInserted(first, last, spliced)
+
+    def _sourceRowsInserted(self, first: int, last: int, spliced: bool) -> None:
+        '''Hook: source rows first..last were inserted; spliced tells whether the cached result took them.'''
+
+    def _spliceInsertedRows(self, version: Tuple[int, int], first: int, last: int) -> bool:
+        '''Add source rows first..last to the cached result (and its sorted order) for the new data version.
+
+        Earlier rows are renumbered, only the new rows are filtered, and each
+        matching row is placed in the sorted order by binary search on the
+        model's cached sort keys: O(log n) comparisons plus a list shift instead
+        of a full re-filter and re-sort. Returns False (cache dropped) on failure.
+        '''
+        state = self._filterState
+        if not state.hasFilterResult(version):
+            return False
+        newVersion = self.dataVersion()
+        state.spliceSourceRows(newVersion, first, last - first + 1)
+        snapshot = FilterSnapshot(self.sourceModel(), state, newVersion, perRow=True)
+        sortSpec = state.sortSpec if state.hasOrderedResult() else ()
+        try:
+            for row in snapshot.filterRows(list(range(first, last + 1))):
+                state.insertResultRow(row, self._orderedInsertPosition(row, sortSpec) if sortSpec else None)
+        except TypeError:
+            # Sort keys that do not compare (mixed types): fall back to a full evaluation
+            state.clearFilterResult()
+            return False
+        return True
+
+    def _orderedInsertPosition(self, sourceRow: int, sortSpec: Tuple[Tuple[str, SortOrder], ...]) -> Optional[int]:
+        '''Index in orderedRows where sourceRow belongs; rows with equal keys stay in source order.
+
+        None when it sorts after every row of a partial order.
+        '''
+        model = self.sourceModel()
+        rows = self._filterState.orderedRows
+        columns = [(columnKey, order == SortOrder.DESCENDING, model.rowSortKey(columnKey, sourceRow)) for columnKey, order in sortSpec]
+        low, high = 0, len(rows)
+        while low < high:
+            middle = (low + high) // 2
+            other = rows[middle]
+            for columnKey, descending, key in columns:
+                otherKey = model.rowSortKey(columnKey, other)
+                if otherKey != key:
+                    before = (otherKey < key) != descending
+                    break
+            else:
+                before = other < sourceRow
+            if before:
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(rows) and not self._filterState.orderComplete:
+            return None
+        return low
+
+    def dataVersion(self) -> Tuple[int, int]:
+        '''Version of the source data as seen by this proxy.'''
+        model = self.sourceModel()
+        modelVersion = model.dataVersion() if isinstance(model, DataTableModel) else 0
+        return (modelVersion, self._sourceRevision)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        '''Infinite scroll: more filtered rows exist past the loaded window.'''
+        return not parent.isValid() and self._filterState.canFetchMore()
+
+    def countFilteredRows(self) -> int:
+        '''Count rows matching search + type filters ONLY (ignoring pagination).
+
+        Used by FilterState.filteredCountFn to compute totalPages correctly.
+        '''
+        self._ensureFilteredRows()
+        return len(self._filterState.filteredRows)
+
+    def filteredRows(self) -> List[int]:
+        '''Source rows matching search + type filters, in source order.'''
+        self._ensureFilteredRows()
+        return self._filterState.filteredRows
+
+    def facetCounts(self, columnKey: str) -> Dict[str, int]:
+        '''Row count per display value of columnKey over the current filtered rows.
+
+        Cached per data version + filter fingerprint. When the search only
+        narrowed since the last count, the removed rows are subtracted instead
+        of recounting (if fewer rows were removed than remain).
+        '''
+        self._ensureFilteredRows()
+        state = self._filterState
+        model = self.sourceModel()
+        if not isinstance(model, DataTableModel):
+            return {}
+        resultKey = (self.dataVersion(), state.filterFingerprint)
+        rows = state.filteredRows
+        cached = state.cachedFacetCounts(columnKey)
+        if cached is not None and cached[0] == resultKey:
+            return dict(cached[2])
+        values = model.facetValueColumn(columnKey)
+        counts = None
+        if cached is not None and cached[0][0] == resultKey[0] and state.narrowsFingerprint(cached[0][1], resultKey[1], self._searchNarrows):
+            # Result is a subset of the counted rows: subtract what the narrower search removed
+            removed = list(filterfalse(state.isFilteredRow, cached[1]))
+            if len(removed) < len(rows):
+                counts = Counter(cached[2])
+                counts.subtract(map(values.__getitem__, removed))
+                counts = +counts
+        if counts is None:
+            counts = Counter(map(values.__getitem__, rows))
+        counts = dict(counts)
+        state.rememberFacetCounts(columnKey, resultKey, rows, counts)
+        return dict(counts)
+
+    def _ensureFilteredRows(self) -> None:
+        '''Compute the search+type result set in one O(n) pass unless it is cached.'''
+        state = self._filterState
+        version = self.dataVersion()
+        if state.hasFilterResult(version):
+            return
+        # A background evaluation is running — keep serving the previous result until it is swapped in
+        if self._holdResult:
+            return
+        model = self.sourceModel()
+        if model is None:
+            state.setFilterResult(version, [])
+            return
+        snapshot = self.createFilterSnapshot()
+        self._storeSnapshotResult(snapshot, snapshot.evaluate())
+
+    def _ensureOrderedRows(self) -> None:
+        '''Sort the result set by FilterState.sortSpec unless that permutation is cached.
+
+        While the page window ends early in the result set (the first pages),
+        only its first rows are selected and sorted; a deeper page or fetch
+        selects again, at least doubling the sorted rows, until a full sort
+        is cheaper.
+        '''
+        self._ensureFilteredRows()
+        state = self._filterState
+        needed = state.paginationRange[1]
+        if state.hasOrderedResult(needed):
+            return
+        rows = state.filteredRows
+        if state.hasOrderedResult():
+            needed = max(needed, 2 * len(state.orderedRows))
+        limit = needed if 0 < needed <= len(rows) * self.PARTIAL_SORT_FRACTION else None
+        state.setOrderedResult(self._sortRows(rows, state.sortSpec, limit), complete=limit is None)
+
+    def _sortRows(self, rows: List[int], sortSpec: Tuple[Tuple[str, SortOrder], ...], limit: Optional[int] = None) -> List[int]:
+        '''rows ordered by sortSpec in one stable pass; ties keep their order in rows.
+
+        Each column contributes its cached dense ranks (see DataTableModel.sortRanks),
+        so changing the spec or a direction never recomputes sort keys. With a
+        limit only the first limit rows of that order are returned: a partial
+        selection (np.partition / heapq.nsmallest) replaces the full sort.
+        '''
+        model = self.sourceModel()
+        if not sortSpec or not isinstance(model, DataTableModel):
+            return list(rows)
+        if limit is not None and limit >= len(rows):
+            limit = None
+        if np is not None:
+            rowArray = np.fromiter(rows, dtype=np.int64, count=len(rows))
+            # Descending = negated ranks, so ties still keep their order in rows
+            columns = [-model.sortRanks(columnKey)[rowArray] if order == SortOrder.DESCENDING else model.sortRanks(columnKey)[rowArray] for columnKey, order in sortSpec]
+            if limit is not None:
+                # The first limit rows all have a primary key <= the limit-th smallest; sort only those
+                threshold = np.partition(columns[0], limit - 1)[limit - 1]
+                candidates = np.flatnonzero(columns[0] <= threshold)
+                rowArray = rowArray[candidates]
+                columns = [column[candidates] for column in columns]
+            # lexsort is stable and treats its last key as the primary one
+            positions = np.argsort(columns[0], kind='stable') if len(columns) == 1 else np.lexsort(columns[::-1])
+            return rowArray[positions[:limit]].tolist()
+        if len(sortSpec) == 1:
+            columnKey, order = sortSpec[0]
+            ranks = model.sortRanks(columnKey)
+            if limit is not None:
+                # nsmallest keeps ties in their order in rows, like a stable sort
+                key = (lambda row: -ranks[row]) if order == SortOrder.DESCENDING else ranks.__getitem__
+                return heapq.nsmallest(limit, rows, key=key)
+            # reverse=True keeps ties in their original order too
+            return sorted(rows, key=ranks.__getitem__, reverse=order == SortOrder.DESCENDING)
+        # Ranks are < row count, so the row count is a safe radix for one packed integer key per row
+        radix = max(model.rowCount(), 1)
+        keys = [0] * len(rows)
+        for columnKey, order in sortSpec:
+            ranks = model.sortRanks(columnKey)
+            if order == SortOrder.DESCENDING:
+                keys = [key * radix + radix - 1 - ranks[row] for key, row in zip(keys, rows)]
+            else:
+                keys = [key * radix + ranks[row] for key, row in zip(keys, rows)]
+        if limit is not None:
+            positions = heapq.nsmallest(limit, range(len(rows)), key=keys.__getitem__)
+        else:
+            positions = sorted(range(len(rows)), key=keys.__getitem__)
+        return [rows[i] for i in positions]
+
+    def _sortSpecFor(self, column: int, order: Qt.SortOrder) -> Tuple[Tuple[str, SortOrder], ...]:
+        '''Sort spec for a view column (empty for column < 0, i.e. unsorted).
+
+        Sorting by the spec's primary column in its current direction keeps the
+        secondary columns.
+        '''
+        model = self.sourceModel()
+        if not isinstance(model, DataTableModel) or not 0 <= column < len(model._visible_columns):
+            return ()
+        primary = (model._visible_columns[column], SortOrder.DESCENDING if order == Qt.DescendingOrder else SortOrder.ASCENDING)
+        sortSpec = self._filterState.sortSpec
+        if sortSpec and sortSpec[0] == primary:
+            return sortSpec
+        return (primary,)
+
+    def _sortColumn(self, sortSpec: Tuple[Tuple[str, SortOrder], ...]) -> int:
+        '''View column of the spec's primary key (0 when that column is hidden, -1 when unsorted).'''
+        model = self.sourceModel()
+        if not sortSpec or not isinstance(model, DataTableModel):
+            return -1
+        columnKey = sortSpec[0][0]
+        return model._visible_columns.index(columnKey) if columnKey in model._visible_columns else 0
+
+    def createFilterSnapshot(self, copy: bool = False) -> FilterSnapshot:
+        '''Capture the current data + filters for evaluation (copy=True for another thread).'''
+        state = self._filterState
+        version = self.dataVersion()
+        searchBase = None
+        if state.searchText and state.cachedSearchMatches(version, state.searchText) is None:
+            searchBase = self.searchBaseRows(version, state.searchText)
+        return FilterSnapshot(self.sourceModel(), state, version, searchBase=searchBase, copy=copy)
+
+    def installFilterResult(self, snapshot: FilterSnapshot, rows: List[int]) -> bool:
+        '''Install a result computed off-thread; the next invalidatePagination swaps it in.
+
+        Returns False (nothing installed) if data or filters changed since the snapshot.
+        '''
+        self._holdResult = False
+        if snapshot.version != self.dataVersion() or snapshot.fingerprint != self._filterState.filterFingerprint:
+            return False
+        self._storeSnapshotResult(snapshot, rows)
+        self._swapPending = True
+        return True
+
+    def holdFilterResult(self) -> None:
+        '''Keep serving the current result set until installFilterResult is called.'''
+        self._holdResult = True
+
+    def _storeSnapshotResult(self, snapshot: FilterSnapshot, rows: List[int]) -> None:
+        state = self._filterState
+        if snapshot.searchMatches is not None:
+            state.rememberSearchMatches(snapshot.searchKey, snapshot.searchText, snapshot.searchMatches)
+        state.setFilterResult(snapshot.version, rows)
+
+    def searchBaseRows(self, version: Tuple[int, int], term: str) -> Optional[List[int]]:
+        '''Smallest known row set that can contain every match of term (None = all rows).'''
+        state = self._filterState
+        if state.searchMode == SearchMode.REGEX:
+            # Any regex match contains the pattern's literal prefix; no narrowing (patterns can widen)
+            model = self.sourceModel()
+            prefix = compileSearchPattern(term)[1]
+            indexed = model.searchIndexCandidates(prefix) if isinstance(model, DataTableModel) else None
+            return sorted(indexed) if indexed is not None else None
+        if state.searchMode == SearchMode.FUZZY:
+            return self._fuzzyIndexCandidates(term)
+        query = self.parseSearch(term)
+        # Narrowing search: only re-test the previous term's matches
+        candidates = state.searchCandidates(version, term, self._searchNarrows)
+        # Sorted column index (exact/prefix terms), then trigram index: only verify rows they allow
+        for indexed in (self._scopedIndexCandidates(query), self._searchIndexCandidates(query)):
+            if indexed is not None:
+                candidates = [row for row in candidates if row in indexed] if candidates is not None else sorted(indexed)
+        return candidates
+
+    def parseSearch(self, term: str) -> SearchQuery:
+        '''Split term into free text and column-scoped terms for the current columns.'''
+        model = self.sourceModel()
+        if not isinstance(model, DataTableModel):
+            return SearchQuery(term)
+        return SearchQuery.parse(term, model.resolveSearchColumn)
+
+    def _searchNarrows(self, previous: str, term: str) -> bool:
+        query, previousQuery = self.parseSearch(term), self.parseSearch(previous)
+        # Narrowing only holds for substring matching; custom search functions (e.g. exact match) get a full scan
+        return self._searchesDefaultColumns(previousQuery) and self._searchesDefaultColumns(query) and query.narrows(previousQuery)
+
+    def _searchesDefaultColumns(self, query: SearchQuery) -> bool:
+        '''Whether every column query searches still uses the built-in search function.'''
+        model = self.sourceModel()
+        if not isinstance(model, DataTableModel):
+            return True
+        columns = [term.columnKey for term in query.scoped]
+        if query.free:
+            columns.extend(model._visible_columns)
+        return all(model.isDefaultSearchColumn(colKey) for colKey in columns)
+
+    def iterSearchMatches(self, term: str, chunkSize: int = 5000) -> Iterator[None]:
+        '''Evaluate term chunk by chunk, yielding between chunks.
+
+        The caller may stop iterating at any yield to abandon the evaluation.
+        When it runs to completion against unchanged data, the matches are stored
+        in FilterState so applying the same term afterwards does not rescan.
+        '''
+        state = self._filterState
+        version = self.dataVersion()
+        if not term or self.sourceModel() is None or state.cachedSearchMatches(version, term) is not None:
+            return
+        snapshot = FilterSnapshot(self.sourceModel(), state, version, searchText=term)
+        rows = self.searchBaseRows(version, term)
+        if rows is None:
+            rows = range(self.sourceModel().rowCount())
+        matched: List[int] = []
+        for start in range(0, len(rows), chunkSize):
+            matched.extend(snapshot.filterSearch(rows[start:start + chunkSize]))
+            yield
+            if self.dataVersion() != version:
+                return
+        state.rememberSearchMatches(snapshot.searchKey, term, snapshot.rankMatches(matched))
+
+    def _searchIndexCandidates(self, query: SearchQuery) -> Optional[Set[int]]:
+        '''Rows the model's trigram index allows for query, or None when it cannot prune.'''
+        model = self.sourceModel()
+        if not isinstance(model, DataTableModel):
+            return None
+        # Custom search functions may match without a substring hit
+        terms = [term.value for term in query.scoped if model.isDefaultSearchColumn(term.columnKey)]
+        if query.free and all(model.isDefaultSearchColumn(colKey) for colKey in model._visible_columns):
+            terms.append(query.free)
+        candidates = None
+        for term in terms:
+            rows = model.searchIndexCandidates(term)
+            if rows is not None:
+                candidates = rows if candidates is None else candidates & rows
+        return candidates
+
+    def _fuzzyIndexCandidates(self, term: str) -> Optional[List[int]]:
+        '''Rows containing one of the fuzzy term's exact pieces per the trigram index, or None.'''
+        model = self.sourceModel()
+        if not isinstance(model, DataTableModel) or not term.strip():
+            return None
+        candidates: Set[int] = set()
+        pattern = compileFuzzyPattern(term)
+        for piece in pattern.pieces[pattern.maxEdits]:
+            rows = model.searchIndexCandidates(piece)
+            if rows is None:
+                return None
+            candidates |= rows
+        return sorted(candidates)
+
+    def _scopedIndexCandidates(self, query: SearchQuery) -> Optional[Set[int]]:
+        '''Rows allowed by the exact/prefix column terms of query, or None if it has none.'''
+        candidates = None
+        for term in query.scoped:
+            if term.mode != SearchQuery.CONTAINS:
+                rows = set(self.sourceModel().searchColumnIndex(term.columnKey, term.value, prefix=term.mode == SearchQuery.PREFIX))
+                candidates = rows if candidates is None else candidates & rows
+        return candidates
@@ -13,11 +13,12 @@
 #                      * * * * * * * * * * * * * * * * * * * * *
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Tuple
 
-from ..models.datatable_model import DataType
+from ..models.datatable_model import DataType, ScrollMode, SearchMode
 
 if TYPE_CHECKING:
+    from ..models.filter_expression import FilterExpression
     from .FilterState import FilterState
 
 
@@ -26,7 +27,7 @@ class FilterFacade:
 
     Every filter action goes through this facade:
     1. Update FilterState properties
-    2. Invalidate proxy model
+    2. Invalidate proxy model (or only re-slice the page window for pagination changes)
     3. Trigger UI callback to refresh pagination controls
 
     Handler/Widget should never manipulate proxy or pagination directly.
@@ -37,14 +38,40 @@ class FilterFacade:
         state: 'FilterState',
         invalidateProxy: Callable[[], None],
         onStateChanged: Callable[[], None],
+        invalidatePagination: Optional[Callable[[], None]] = None,
+        filterInBackground: Optional[Callable[[Callable[[], None]], bool]] = None,
+        onApplied: Optional[Callable[[], None]] = None,
     ):
         self._state = state
         self._invalidateProxy = invalidateProxy
         self._onStateChanged = onStateChanged
+        self._invalidatePagination = invalidatePagination or invalidateProxy
+        # Starts an off-thread evaluation and calls back when its result is installed;
+        # returns False when it declines and the facade should run synchronously.
+        self._filterInBackground = filterInBackground
+        self._backgroundFiltering = False
+        # Called once a recomputed result is live (after a background result is swapped in)
+        self._onApplied = onApplied
 
-    def setSearch(self, text: str) -> None:
-        '''Update search text and refresh.'''
+    def setBackgroundFiltering(self, enabled: bool) -> None:
+        '''Evaluate search/type filters on a worker thread instead of the GUI thread.'''
+        self._backgroundFiltering = enabled and self._filterInBackground is not None
+
+    def setSearch(self, text: str, mode: Optional[SearchMode] = None) -> None:
+        '''Update search text (and optionally the search mode) and refresh.'''
         self._state.searchText = text
+        if mode is not None:
+            self._state.searchMode = mode
+        self._applyAndRefreshUI(resetPage=True)
+
+    def setSearchMode(self, mode: SearchMode) -> None:
+        '''Change how the current search text is matched and refresh.'''
+        self._state.searchMode = mode
+        self._applyAndRefreshUI(resetPage=True)
+
+    def setFuzzyLimit(self, limit: int) -> None:
+        '''Change how many rows a fuzzy search keeps and refresh.'''
+        self._state.fuzzyLimit = limit
         self._applyAndRefreshUI(resetPage=True)
 
     def setTypeFilter(self, dataType: Optional[DataType]) -> None:
@@ -52,16 +79,63 @@ class FilterFacade:
         self._state.dataTypeFilter = dataType
         self._applyAndRefreshUI(resetPage=True)
 
+    def addColumnFilters(self, filters: List[Tuple[str, str, Any]]) -> None:
+        '''Add structured comparison filters (columnKey, op, value) and refresh once.'''
+        for columnKey, op, value in filters:
+            self._state.addColumnFilter(columnKey, op, value)
+        self._applyAndRefreshUI(resetPage=True)
+
+    def removeColumnFilters(self, columnKey: str) -> None:
+        '''Remove the structured filters on a column and refresh.'''
+        self._state.removeColumnFilters(columnKey)
+        self._applyAndRefreshUI(resetPage=True)
+
+    def clearColumnFilters(self) -> None:
+        '''Remove every structured filter and refresh.'''
+        self._state.clearColumnFilters()
+        self._applyAndRefreshUI(resetPage=True)
+
+    def setFacetFilter(self, columnKey: str, values: Optional[Iterable[str]]) -> None:
+        '''Replace the selected facet values of a column (None/empty clears) and refresh.'''
+        self._state.setFacetFilter(columnKey, values)
+        self._applyAndRefreshUI(resetPage=True)
+
+    def clearFacetFilters(self) -> None:
+        '''Remove every facet selection and refresh.'''
+        self._state.clearFacetFilters()
+        self._applyAndRefreshUI(resetPage=True)
+
+    def setFilterExpression(self, expression: Optional['FilterExpression']) -> None:
+        '''Replace the compiled filter expression (None clears it) and refresh.'''
+        self._state.filterExpression = expression
+        self._applyAndRefreshUI(resetPage=True)
+
     def setPage(self, page: int) -> None:
-        '''Navigate to a specific page.'''
+        '''Navigate to a specific page (re-slices the cached result set only).'''
         self._state.currentPage = page
-        self._invalidateProxy()
+        self._invalidatePagination()
         self._onStateChanged()
 
     def setItemsPerPage(self, count: int) -> None:
-        '''Change items per page and refresh.'''
+        '''Change items per page and refresh (re-slices the cached result set only).'''
         self._state.itemsPerPage = count
-        self._applyAndRefreshUI(resetPage=True)
+        self._state.currentPage = 1
+        self._invalidatePagination()
+        self._onStateChanged()
+
+    def setScrollMode(self, mode: ScrollMode, fetchSize: Optional[int] = None) -> None:
+        '''Switch between page buttons and infinite scroll (fetchSize rows per chunk).'''
+        self._state.scrollMode = mode
+        if fetchSize is not None:
+            self._state.fetchSize = fetchSize
+        self._state.resetPage()
+        self._invalidatePagination()
+        self._onStateChanged()
+
+    def refreshPage(self) -> None:
+        '''Re-slice the page window from the cached result set (e.g. after rows were spliced into it).'''
+        self._invalidatePagination()
+        self._onStateChanged()
 
     def refresh(self) -> None:
         '''Force full recalculation from current state.'''
@@ -69,7 +143,24 @@ class FilterFacade:
 
     def _applyAndRefreshUI(self, resetPage: bool = False) -> None:
         '''Internal: invalidate proxy, optionally reset page, then update UI.'''
+        if self._backgroundFiltering:
+            if self._filterInBackground(lambda: self._onBackgroundResult(resetPage)):
+                return
         self._invalidateProxy()
+        # The proxy sliced the old page window; re-slice once if going back to the first page moves it
+        if resetPage and self._state.resetPage():
+            self._invalidatePagination()
+        self._onStateChanged()
+        self._notifyApplied()
+
+    def _onBackgroundResult(self, resetPage: bool) -> None:
+        '''Internal: a background result is installed — swap it in and update UI.'''
         if resetPage:
-            self._state.currentPage = 1
+            self._state.resetPage()
+        self._invalidatePagination()
         self._onStateChanged()
+        self._notifyApplied()
+
+    def _notifyApplied(self) -> None:
+        if self._onApplied is not None:
+            self._onApplied()
@@ -0,0 +1,328 @@
+#                      M""""""""`M            dP
+#                      Mmmmmm   .M            88
+#                      MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                      MMP  .MMMMM  88    88  88888"    88'  `88
+#                      M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                      M         M  `88888P'  dP   `YP  `88888P'
+#                      MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                      * * * * * * * * * * * * * * * * * * * * *
+#                      * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                      * -  Copyright © 2026 (Z) Programing  - *
+#                      *    -  -  All Rights Reserved  -  -    *
+#                      * * * * * * * * * * * * * * * * * * * * *
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional, Pattern, Sequence, Set, Tuple
+
+from ..models.datatable_model import DataTableModel, DataType, SearchMode
+from .SearchQuery import FuzzyPattern, SearchQuery, compileFuzzyPattern, compileSearchPattern, fuzzyDistance
+
+if TYPE_CHECKING:
+    from .FilterState import FilterState
+
+
+class FilterSnapshot:
+    '''Everything one filter evaluation needs, detached from the Qt model.
+
+    Captured on the GUI thread from DataTableModel + FilterState. With
+    copy=True the row list and text columns are copied, so the snapshot can be
+    evaluated on a worker thread while the model keeps changing. Evaluation
+    never touches QModelIndex/data(): built-in search columns read the model's
+    cached display text and the type filter reads the model's precomputed
+    non-empty bitmaps; custom search functions get the column formatter applied
+    to the raw value (what data(DisplayRole) would return). Column-scoped
+    terms (see SearchQuery) test only their column; exact and prefix terms are
+    answered up front from the model's sorted per-column index. In regex mode
+    the pattern runs on every visible column's cached display text, behind a
+    substring check for its literal prefix. In fuzzy mode rows are scored by
+    edit distance into a bounded heap of the fuzzyLimit best; once it is full,
+    the edit budget (and so the pruning) tightens to beat its worst entry. Structured
+    column filters are evaluated to a row mask up front (vectorized when NumPy
+    is available) and AND-ed with the filter expression mask and the type bitmap.
+    Facet selections are resolved to row sets through the model's value -> rows
+    hash index and intersected with set operations.
+    '''
+
+    CHUNK_SIZE = 5000
+
+    def __init__(
+        self,
+        model: DataTableModel,
+        state: 'FilterState',
+        version: Hashable,
+        searchText: Optional[str] = None,
+        searchBase: Optional[List[int]] = None,
+        copy: bool = False,
+        perRow: bool = False,
+    ):
+        self.version = version
+        self.fingerprint = state.filterFingerprint
+        self.searchText = state.searchText if searchText is None else searchText
+        self.searchMode: SearchMode = state.searchMode
+        self.searchKey = state.searchMatchKey(version)
+        self.dataTypeFilter: Optional[DataType] = state.dataTypeFilter
+        self.cancelled = False
+        # Output: search-only matches, set by evaluate() when a search ran
+        self.searchMatches: Optional[List[int]] = None
+
+        self._rows: List[Dict[str, Any]] = list(model._data) if copy else model._data
+        self._cachedSearch = state.cachedSearchMatches(version, self.searchText) if self.searchText else None
+        self._searchBase = searchBase
+
+        self._freeText = ''
+        self._textColumns: List[List[str]] = []
+        self._customColumns: List[Tuple[str, Callable, Optional[Callable]]] = []
+        # Scoped contains terms: (value, column texts) or (value, (key, search func, formatter))
+        self._scopedTexts: List[Tuple[str, List[str]]] = []
+        self._scopedCustom: List[Tuple[str, Tuple[str, Callable, Optional[Callable]]]] = []
+        # Rows allowed by the exact/prefix terms (None = no such term)
+        self._indexedRows: Optional[Set[int]] = None
+        # Regex mode: compiled pattern and the literal every match contains
+        self._pattern: Optional[Pattern[str]] = None
+        self._patternPrefix = ''
+        # Fuzzy mode: prepared term, top-K size and the best rows so far as (-distance, -row)
+        self._fuzzy: Optional[FuzzyPattern] = None
+        self._fuzzyLimit = state.fuzzyLimit
+        self._fuzzyHeap: List[Tuple[int, int]] = []
+        if self.searchText and self._cachedSearch is None:
+            if self.searchMode in (SearchMode.REGEX, SearchMode.FUZZY):
+                if self.searchMode == SearchMode.REGEX:
+                    self._pattern, self._patternPrefix = compileSearchPattern(self.searchText)
+                elif self.searchText.strip():
+                    self._fuzzy = compileFuzzyPattern(self.searchText)
+                for colKey in model._visible_columns:
+                    texts = model.searchTextColumn(colKey)
+                    self._textColumns.append(list(texts) if copy else texts)
+            else:
+                self._prepareQuery(model, copy)
+
+        # perRow (a few inserted rows, see filterRows): test each row instead of building whole-table sets and masks
+        self._rowTests: List[Callable[[List[int]], List[int]]] = self._perRowTests(model, state) if perRow else []
+        self._facetRows: Optional[Set[int]] = None
+        self._rowMask: Optional[bytes] = None
+        if perRow:
+            return
+
+        # Facets: OR of the selected values' row sets per column, intersected across columns
+        for colKey, values in sorted(state.facetFilters.items()):
+            rows = model.facetRows(colKey, values)
+            self._facetRows = rows if self._facetRows is None else self._facetRows & rows
+
+        # Rows passing every structured column filter and the filter expression, AND-ed
+        # with the bitmap of rows having a non-blank value in a visible column of the filtered type
+        self._rowMask = model.columnFilterMask(state.columnFilters)
+        if state.filterExpression is not None:
+            self._rowMask = self._andMasks(self._rowMask, state.filterExpression.mask())
+        if self.dataTypeFilter is not None:
+            mask = model.typePresenceMask(self.dataTypeFilter)
+            self._rowMask = self._andMasks(self._rowMask, bytes(mask) if copy else mask)
+
+    def _perRowTests(self, model: DataTableModel, state: 'FilterState') -> List[Callable[[List[int]], List[int]]]:
+        '''Facet, column filter, expression and type tests that only look at the rows given to them.'''
+        data = model._data
+        tests: List[Callable[[List[int]], List[int]]] = []
+        for colKey, values in sorted(state.facetFilters.items()):
+            tests.append(lambda rows, colKey=colKey, values=values: [row for row in rows if model._displayText(colKey, data[row].get(colKey)) in values])
+        if state.columnFilters:
+            filters = state.columnFilters
+            tests.append(lambda rows: model.columnFilterRows(filters, rows))
+        if state.filterExpression is not None:
+            predicate = state.filterExpression.predicate
+            tests.append(lambda rows: [row for row in rows if predicate(data[row])])
+        if self.dataTypeFilter is not None:
+            typed = [key for key in model._visible_columns if model._column_types.get(key) == self.dataTypeFilter]
+            tests.append(lambda rows: [row for row in rows if any(model._toSearchText(key, data[row].get(key)).strip() for key in typed)])
+        return tests
+
+    def _prepareQuery(self, model: DataTableModel, copy: bool) -> None:
+        '''Resolve the free text and column-scoped terms of a TEXT-mode search.'''
+        query = SearchQuery.parse(self.searchText, model.resolveSearchColumn)
+        self._freeText = query.free
+        if query.free:
+            for colKey in model._visible_columns:
+                column = self._searchColumn(model, colKey, copy)
+                if isinstance(column, list):
+                    self._textColumns.append(column)
+                else:
+                    self._customColumns.append(column)
+        for term in query.scoped:
+            if term.mode == SearchQuery.CONTAINS:
+                column = self._searchColumn(model, term.columnKey, copy)
+                if isinstance(column, list):
+                    self._scopedTexts.append((term.value, column))
+                else:
+                    self._scopedCustom.append((term.value, column))
+            else:
+                rows = set(model.searchColumnIndex(term.columnKey, term.value, prefix=term.mode == SearchQuery.PREFIX))
+                self._indexedRows = rows if self._indexedRows is None else self._indexedRows & rows
+
+    @staticmethod
+    def _andMasks(mask: Optional[bytes], other: bytes) -> bytes:
+        if mask is None:
+            return other
+        # Bytes are 0/1, so AND-ing the little-endian integers ANDs row by row
+        combined = int.from_bytes(mask, 'little') & int.from_bytes(other, 'little')
+        return combined.to_bytes(len(other), 'little')
+
+    @staticmethod
+    def _searchColumn(model: DataTableModel, colKey: str, copy: bool) -> Any:
+        '''Cached lowercased texts for a built-in search column, else (key, func, formatter).'''
+        func = model._search_funcs.get(colKey)
+        if func is not None and not model.isDefaultSearchColumn(colKey):
+            return (colKey, func, model._formatting_funcs.get(colKey))
+        texts = model.searchTextColumn(colKey)
+        return list(texts) if copy else texts
+
+    def cancel(self) -> None:
+        '''Ask a running evaluate() to stop at the next chunk boundary.'''
+        self.cancelled = True
+
+    def evaluate(self) -> Optional[List[int]]:
+        '''Compute the search + facet + type + column filter + expression result set, or None if cancelled.'''
+        rows: Optional[List[int]] = None  # None = every row
+        if self.searchText:
+            if self._cachedSearch is not None:
+                rows = self._cachedSearch
+            else:
+                base = self._searchBase
+                if base is None:
+                    base = sorted(self._indexedRows) if self._indexedRows is not None else range(len(self._rows))
+                rows = self._inChunks(base, self.filterSearch)
+                if rows is None:
+                    return None
+                rows = self.rankMatches(rows)
+            self.searchMatches = rows
+        if self._facetRows is not None:
+            facetRows = self._facetRows
+            rows = sorted(facetRows) if rows is None else [row for row in rows if row in facetRows]
+        if self._rowMask is not None:
+            rows = DataTableModel.maskedRows(self._rowMask, rows)
+        return rows if rows is not None else list(range(len(self._rows)))
+
+    def filterRows(self, rows: List[int]) -> List[int]:
+        '''Keep the rows (ascending) passing every filter, e.g. rows just inserted into the model.
+
+        Build the snapshot with perRow=True to test only these rows. Not for
+        fuzzy mode, whose result depends on the rows it is ranked against.
+        '''
+        if self._cachedSearch is not None:
+            matches = set(self._cachedSearch)
+            rows = [row for row in rows if row in matches]
+        elif self.searchText:
+            rows = self.filterSearch(rows)
+        if self._facetRows is not None:
+            rows = [row for row in rows if row in self._facetRows]
+        if self._rowMask is not None:
+            rows = DataTableModel.maskedRows(self._rowMask, rows)
+        for test in self._rowTests:
+            rows = test(rows)
+        return list(rows)
+
+    def filterSearch(self, rows: List[int]) -> List[int]:
+        '''Keep the rows matching every scoped term and, if any, the free text.'''
+        if self._pattern is not None:
+            return self._filterPattern(rows)
+        if self._fuzzy is not None:
+            return self._filterFuzzy(rows)
+        if self._indexedRows is not None:
+            indexedRows = self._indexedRows
+            rows = [row for row in rows if row in indexedRows]
+        data = self._rows
+        for value, texts in self._scopedTexts:
+            rows = [row for row in rows if value in texts[row]]
+        for value, (colKey, func, formatter) in self._scopedCustom:
+            rows = [row for row in rows if func(self._display(data[row].get(colKey), formatter), value)]
+        if not self._freeText:
+            return list(rows)
+        searchTerm = self._freeText
+        termLower = searchTerm.lower()
+        textColumns = self._textColumns
+        customColumns = self._customColumns
+        matched = []
+        for row in rows:
+            for texts in textColumns:
+                if termLower in texts[row]:
+                    matched.append(row)
+                    break
+            else:
+                for colKey, func, formatter in customColumns:
+                    if func(self._display(data[row].get(colKey), formatter), searchTerm):
+                        matched.append(row)
+                        break
+        return matched
+
+    def _filterPattern(self, rows: List[int]) -> List[int]:
+        '''Keep the rows where the regex matches any visible column's display text.'''
+        search = self._pattern.search
+        prefix = self._patternPrefix
+        textColumns = self._textColumns
+        matched = []
+        for row in rows:
+            for texts in textColumns:
+                text = texts[row]
+                # Cheap substring test first: most rows never reach the regex engine
+                if prefix in text and search(text):
+                    matched.append(row)
+                    break
+        return matched
+
+    def _filterFuzzy(self, rows: List[int]) -> List[int]:
+        '''Score rows into the top-K heap; returns the rows it accepted (they may be evicted later).
+
+        Rows must arrive in ascending order: a later row never wins a tie, so
+        once the heap is full a row needs fewer edits than its worst entry.
+        '''
+        pattern = self._fuzzy
+        textColumns = self._textColumns
+        heap = self._fuzzyHeap
+        limit = self._fuzzyLimit
+        budget = pattern.maxEdits if len(heap) < limit else -heap[0][0] - 1
+        accepted = []
+        for row in rows:
+            if budget < 0:
+                break
+            hasPiece = pattern.pieceSearch[budget]
+            minLength = len(pattern.term) - budget
+            best = budget + 1
+            for texts in textColumns:
+                text = texts[row]
+                # Length filter + pigeonhole pieces: only plausible texts reach the distance computation
+                if len(text) < minLength or not hasPiece(text):
+                    continue
+                distance = fuzzyDistance(pattern, text)
+                if distance < best:
+                    best = distance
+                    if not best:
+                        break
+            if best > budget:
+                continue
+            accepted.append(row)
+            if len(heap) < limit:
+                heapq.heappush(heap, (-best, -row))
+            else:
+                heapq.heapreplace(heap, (-best, -row))
+            if len(heap) == limit:
+                budget = -heap[0][0] - 1
+        return accepted
+
+    def rankMatches(self, rows: List[int]) -> List[int]:
+        '''Fuzzy mode: the fuzzyLimit best rows, best first (other modes: rows unchanged).'''
+        if self._fuzzy is None:
+            return rows
+        return [-negRow for _, negRow in sorted(self._fuzzyHeap, key=lambda entry: (-entry[0], -entry[1]))]
+
+    @staticmethod
+    def _display(value: Any, formatter: Optional[Callable]) -> Any:
+        return formatter(value) if formatter is not None else value
+
+    def _inChunks(self, rows: Sequence[int], step: Callable[[List[int]], List[int]]) -> Optional[List[int]]:
+        if len(rows) <= self.CHUNK_SIZE:
+            return step(rows)
+        matched: List[int] = []
+        for start in range(0, len(rows), self.CHUNK_SIZE):
+            if self.cancelled:
+                return None
+            matched.extend(step(rows[start:start + self.CHUNK_SIZE]))
+        return matched
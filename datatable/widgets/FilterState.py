@@ -14,9 +14,13 @@
 from __future__ import annotations
 
 import math
-from typing import Any, Dict, List, Optional
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Hashable, Iterable, List, Optional, Tuple
 
-from ..models.datatable_model import DataType
+from ..models.datatable_model import DataType, ScrollMode, SearchMode, SortOrder
+
+if TYPE_CHECKING:
+    from ..models.filter_expression import FilterExpression
 
 
 class FilterState:
@@ -30,13 +34,45 @@ class FilterState:
     def __init__(self):
         self._rawData: List[Dict[str, Any]] = []
         self._searchText: str = ''
+        self._searchMode: SearchMode = SearchMode.TEXT
+        self._fuzzyLimit: int = 100  # top-K rows kept by a fuzzy search
         self._dataTypeFilter: Optional[DataType] = None
+        # Structured filters, AND-ed: (columnKey, operator, value)
+        self._columnFilters: Tuple[Tuple[str, str, Any], ...] = ()
+        self._filterExpression: Optional['FilterExpression'] = None
+        # Facets: columnKey -> display values to keep (OR within a column, AND across columns)
+        self._facetFilters: Dict[str, FrozenSet[str]] = {}
         self._currentPage: int = 1
         self._itemsPerPage: int = 25
+        # Infinite scroll: the window is the first _loadedRows filtered rows, grown by _fetchSize
+        self._scrollMode: ScrollMode = ScrollMode.PAGED
+        self._fetchSize: int = 100
+        self._loadedRows: int = 100
         # Cache for filtered count (invalidated on filter change)
         self._filteredCountCache: Optional[int] = None
         # Callback to count filtered rows (set by FilterFacade)
         self._filteredCountFn: Optional[callable] = None
+        # Cached search+type result set: matching source rows (in order) + reverse lookup.
+        # Keyed by (dataVersion, filterFingerprint) so page moves never re-run the filters.
+        # Reverse lookups are None after rows are spliced in, and rebuilt on first use.
+        self._resultKey: Optional[Hashable] = None
+        self._resultRows: List[int] = []
+        self._resultPos: Optional[Dict[int, int]] = {}
+        # Sort spec (columnKey, order), most significant first, and the result set sorted by it.
+        # The permutation is keyed by (result key, sort spec): paging never re-sorts.
+        # While _orderComplete is False it holds only the first rows (top-K for the first pages).
+        self._sortSpec: Tuple[Tuple[str, SortOrder], ...] = ()
+        self._orderKey: Optional[Hashable] = None
+        self._orderRows: List[int] = []
+        self._orderPos: Optional[Dict[int, int]] = {}
+        self._orderComplete: bool = True
+        # Previous search-only match set, reused when the next term narrows it (e.g. 'ab' -> 'abc')
+        self._incrementalSearch: bool = True
+        self._searchMatchKey: Optional[Hashable] = None
+        self._searchMatchTerm: str = ''
+        self._searchMatchRows: List[int] = []
+        # Facet counts per column: (resultKey, result rows they were counted over, value -> count)
+        self._facetCounts: Dict[str, Tuple[Hashable, List[int], Dict[str, int]]] = {}
 
     # --- Raw data ---
 
@@ -61,6 +97,26 @@ class FilterState:
             self._searchText = value
             self._invalidateCache()
 
+    @property
+    def searchMode(self) -> SearchMode:
+        return self._searchMode
+
+    @searchMode.setter
+    def searchMode(self, value: SearchMode) -> None:
+        if self._searchMode != value:
+            self._searchMode = value
+            self._invalidateCache()
+
+    @property
+    def fuzzyLimit(self) -> int:
+        return self._fuzzyLimit
+
+    @fuzzyLimit.setter
+    def fuzzyLimit(self, value: int) -> None:
+        if value > 0 and self._fuzzyLimit != value:
+            self._fuzzyLimit = value
+            self._invalidateCache()
+
     # --- Type filter ---
 
     @property
@@ -73,6 +129,67 @@ class FilterState:
             self._dataTypeFilter = value
             self._invalidateCache()
 
+    # --- Column filters ---
+
+    @property
+    def columnFilters(self) -> Tuple[Tuple[str, str, Any], ...]:
+        return self._columnFilters
+
+    def addColumnFilter(self, columnKey: str, op: str, value: Any) -> None:
+        '''Add a comparison filter (AND-ed with every other filter).'''
+        self._columnFilters = self._columnFilters + ((columnKey, op, value),)
+        self._invalidateCache()
+
+    def removeColumnFilters(self, columnKey: str) -> None:
+        '''Remove every structured filter on columnKey.'''
+        remaining = tuple(f for f in self._columnFilters if f[0] != columnKey)
+        if remaining != self._columnFilters:
+            self._columnFilters = remaining
+            self._invalidateCache()
+
+    def clearColumnFilters(self) -> None:
+        if self._columnFilters:
+            self._columnFilters = ()
+            self._invalidateCache()
+
+    # --- Facets ---
+
+    @property
+    def facetFilters(self) -> Dict[str, FrozenSet[str]]:
+        return dict(self._facetFilters)
+
+    def setFacetFilter(self, columnKey: str, values: Optional[Iterable[str]]) -> None:
+        '''Keep only rows whose display value in columnKey is one of values (None/empty clears).'''
+        selected = frozenset(values) if values else frozenset()
+        if selected == self._facetFilters.get(columnKey, frozenset()):
+            return
+        if selected:
+            self._facetFilters[columnKey] = selected
+        else:
+            del self._facetFilters[columnKey]
+        self._invalidateCache()
+
+    def clearFacetFilters(self) -> None:
+        if self._facetFilters:
+            self._facetFilters = {}
+            self._invalidateCache()
+
+    # --- Filter expression ---
+
+    @property
+    def filterExpression(self) -> Optional['FilterExpression']:
+        return self._filterExpression
+
+    @filterExpression.setter
+    def filterExpression(self, value: Optional['FilterExpression']) -> None:
+        if self._expressionText(self._filterExpression) != self._expressionText(value):
+            self._filterExpression = value
+            self._invalidateCache()
+
+    @staticmethod
+    def _expressionText(expression: Optional['FilterExpression']) -> Optional[str]:
+        return expression.text if expression is not None else None
+
     # --- Pagination ---
 
     @property
@@ -92,10 +209,47 @@ class FilterState:
     def itemsPerPage(self, value: int) -> None:
         if value > 0 and self._itemsPerPage != value:
             self._itemsPerPage = value
-            self._invalidateCache()
+            # Filtered count does not depend on page size, so the cache stays valid.
             # Clamp current page after items-per-page change
             self._currentPage = max(1, min(self._currentPage, self.totalPages))
 
+    def resetPage(self) -> bool:
+        '''Go back to the first page (first chunk when scrolling); True if the window moved.'''
+        moved = self._currentPage != 1 or (self._scrollMode == ScrollMode.INFINITE and self._loadedRows != self._fetchSize)
+        self._currentPage = 1
+        self._loadedRows = self._fetchSize
+        return moved
+
+    # --- Infinite scroll ---
+
+    @property
+    def scrollMode(self) -> ScrollMode:
+        return self._scrollMode
+
+    @scrollMode.setter
+    def scrollMode(self, value: ScrollMode) -> None:
+        self._scrollMode = value
+        self.resetPage()
+
+    @property
+    def fetchSize(self) -> int:
+        '''Rows added to the window per fetch in infinite scroll mode.'''
+        return self._fetchSize
+
+    @fetchSize.setter
+    def fetchSize(self, value: int) -> None:
+        if value > 0:
+            self._fetchSize = value
+            self._loadedRows = max(self._loadedRows, value)
+
+    def canFetchMore(self) -> bool:
+        '''Whether infinite scroll has filtered rows past the loaded window.'''
+        return self._scrollMode == ScrollMode.INFINITE and self._loadedRows < self.filteredCount
+
+    def fetchMore(self) -> None:
+        '''Grow the infinite scroll window by one chunk.'''
+        self._loadedRows = min(self._loadedRows + self._fetchSize, self.filteredCount)
+
     # --- Computed properties ---
 
     @property
@@ -107,7 +261,7 @@ class FilterState:
     def filteredCount(self) -> int:
         '''Number of rows passing search + type filter.
 
-        Uses proxy model rowCount when available, falls back to totalItems.
+        Reads the proxy's filtered-row mapping when available, falls back to totalItems.
         '''
         if self._filteredCountCache is not None:
             return self._filteredCountCache
@@ -120,28 +274,251 @@ class FilterState:
     def totalPages(self) -> int:
         '''Total pages based on filtered count and items per page.'''
         count = self.filteredCount
-        if count == 0:
+        if count == 0 or self._scrollMode == ScrollMode.INFINITE:
             return 1
         return math.ceil(count / self._itemsPerPage)
 
     @property
     def paginationRange(self) -> tuple[int, int]:
         '''(start, end) indices for the current page (0-based, end exclusive).'''
+        if self._scrollMode == ScrollMode.INFINITE:
+            return (0, min(self._loadedRows, self.filteredCount))
         start = (self._currentPage - 1) * self._itemsPerPage
         end = min(start + self._itemsPerPage, self.filteredCount)
         return (start, end)
 
+    # --- Filter result cache ---
+
+    @property
+    def filterFingerprint(self) -> Hashable:
+        '''Hashable snapshot of every setting that affects which rows match (not pagination).'''
+        return (
+            self._searchText,
+            self._searchMode,
+            self._fuzzyLimit if self._searchMode == SearchMode.FUZZY else None,
+            self._dataTypeFilter,
+            self._columnFilters,
+            self._expressionText(self._filterExpression),
+            tuple(sorted(self._facetFilters.items())),
+        )
+
+    def hasFilterResult(self, dataVersion: Hashable) -> bool:
+        '''Whether the cached result set is valid for this data version and the current filters.'''
+        return self._resultKey == (dataVersion, self.filterFingerprint)
+
+    def setFilterResult(self, dataVersion: Hashable, rows: List[int]) -> None:
+        '''Store the matching source rows computed for dataVersion and the current filters.'''
+        self._resultKey = (dataVersion, self.filterFingerprint)
+        self._resultRows = rows
+        self._resultPos = {sourceRow: idx for idx, sourceRow in enumerate(rows)}
+        self._filteredCountCache = len(rows)
+
+    def clearFilterResult(self) -> None:
+        '''Drop the cached result set so the next read recomputes it.'''
+        self._resultKey = None
+        self._resultRows = []
+        self._resultPos = {}
+        self._orderKey = None
+        self._orderRows = []
+        self._orderPos = {}
+        self._invalidateCache()
+
+    @property
+    def filteredRows(self) -> List[int]:
+        '''Cached matching source rows (search + type, ignoring pagination).'''
+        return self._resultRows
+
+    def filteredPosition(self, sourceRow: int) -> Optional[int]:
+        '''Position of sourceRow within the cached result set, or None if it does not match.'''
+        return self._resultPositions().get(sourceRow)
+
+    def isFilteredRow(self, sourceRow: int) -> bool:
+        '''Whether sourceRow is in the cached result set.'''
+        return sourceRow in self._resultPositions()
+
+    def _resultPositions(self) -> Dict[int, int]:
+        if self._resultPos is None:
+            self._resultPos = {sourceRow: idx for idx, sourceRow in enumerate(self._resultRows)}
+        return self._resultPos
+
+    def spliceSourceRows(self, dataVersion: Hashable, first: int, count: int) -> None:
+        '''Renumber the cached result for count source rows inserted at first.
+
+        The result (and its sorted order, if current) is re-keyed to dataVersion
+        without re-running the filters; matching inserted rows are then added
+        with insertResultRow. Only valid for results in source order (not fuzzy).
+        '''
+        ordered = bool(self._sortSpec) and self.hasOrderedResult()
+        # Result rows are in source order: nothing to renumber when rows were appended after the last match
+        shift = bool(self._resultRows) and self._resultRows[-1] >= first
+        # New lists: the old ones may still be referenced by the search and facet caches
+        self._resultRows = [row + count if row >= first else row for row in self._resultRows] if shift else list(self._resultRows)
+        if shift:
+            self._resultPos = None
+        self._resultKey = (dataVersion, self._resultKey[1])
+        if ordered:
+            self._orderRows = [row + count if row >= first else row for row in self._orderRows] if shift else list(self._orderRows)
+            if shift:
+                self._orderPos = None
+            self._orderKey = (self._resultKey, self._sortSpec)
+        self._invalidateCache()
+
+    def insertResultRow(self, sourceRow: int, orderPosition: Optional[int] = None) -> None:
+        '''Add an inserted source row that matches the filters to the cached result.
+
+        orderPosition is its index in orderedRows when a sorted order is cached
+        (None when it sorts past a partial order). In infinite scroll mode a row landing inside the loaded window grows
+        the window, so no loaded row is pushed out of it.
+        '''
+        position = bisect_left(self._resultRows, sourceRow)
+        self._resultRows.insert(position, sourceRow)
+        self._resultPos = self._insertPosition(self._resultPos, self._resultRows, sourceRow, position)
+        windowPosition = position
+        if self._sortSpec and self.hasOrderedResult():
+            windowPosition = len(self._orderRows)
+            if orderPosition is not None:
+                self._orderRows.insert(orderPosition, sourceRow)
+                self._orderPos = self._insertPosition(self._orderPos, self._orderRows, sourceRow, orderPosition)
+                windowPosition = orderPosition
+        if self._scrollMode == ScrollMode.INFINITE and windowPosition < self._loadedRows:
+            self._loadedRows += 1
+        self._filteredCountCache = len(self._resultRows)
+
+    @staticmethod
+    def _insertPosition(positions: Optional[Dict[int, int]], rows: List[int], sourceRow: int, position: int) -> Optional[Dict[int, int]]:
+        # Appending keeps every other position; otherwise the lookup is rebuilt lazily
+        if positions is not None and position == len(rows) - 1:
+            positions[sourceRow] = position
+            return positions
+        return None
+
+    # --- Sort ---
+
+    @property
+    def sortSpec(self) -> Tuple[Tuple[str, SortOrder], ...]:
+        return self._sortSpec
+
+    @sortSpec.setter
+    def sortSpec(self, value: Iterable[Tuple[str, SortOrder]]) -> None:
+        value = tuple(value)
+        if value != self._sortSpec and self._scrollMode == ScrollMode.INFINITE:
+            # A new order starts again from the first chunk, like a new filter
+            self._loadedRows = self._fetchSize
+        self._sortSpec = value
+
+    def hasOrderedResult(self, count: int = 0) -> bool:
+        '''Whether orderedRows is the current result set sorted by the current sort spec.
+
+        A partial order counts when it holds at least count rows.
+        '''
+        if not self._sortSpec:
+            return True
+        return self._orderKey == (self._resultKey, self._sortSpec) and (self._orderComplete or len(self._orderRows) >= count)
+
+    def setOrderedResult(self, rows: List[int], complete: bool = True) -> None:
+        '''Store the current result set sorted by the current sort spec.
+
+        With complete=False rows are only its first rows in sorted order; a
+        window reaching past them needs a new (longer or full) order.
+        '''
+        self._orderKey = (self._resultKey, self._sortSpec)
+        self._orderRows = rows
+        self._orderPos = None
+        self._orderComplete = complete
+
+    @property
+    def orderComplete(self) -> bool:
+        '''Whether orderedRows holds the whole result set (False for a top-K order).'''
+        return not self._sortSpec or self._orderComplete
+
+    @property
+    def orderedRows(self) -> List[int]:
+        '''Cached result set in display order: sorted by the sort spec, else as filtered.
+
+        Only the first rows while the order is partial (see orderComplete).
+        '''
+        return self._orderRows if self._sortSpec else self._resultRows
+
+    def orderedPosition(self, sourceRow: int) -> Optional[int]:
+        '''Position of sourceRow within orderedRows, or None if it does not match.'''
+        if not self._sortSpec:
+            return self._resultPositions().get(sourceRow)
+        if self._orderPos is None:
+            self._orderPos = {sourceRow: idx for idx, sourceRow in enumerate(self._orderRows)}
+        return self._orderPos.get(sourceRow)
+
+    def narrowsFingerprint(self, old: Hashable, new: Hashable, narrows: Callable[[str, str], bool]) -> bool:
+        '''Whether new only differs from old by a search text that narrows it (so its rows are a subset).'''
+        # filterFingerprint starts with the search text; every other setting must be unchanged
+        return old[1:] == new[1:] and self._searchMode == SearchMode.TEXT and narrows(old[0], new[0])
+
+    # --- Facet counts ---
+
+    def cachedFacetCounts(self, columnKey: str) -> Optional[Tuple[Hashable, List[int], Dict[str, int]]]:
+        '''Last facet counts of columnKey as (resultKey, rows, counts), possibly for an older result.'''
+        return self._facetCounts.get(columnKey)
+
+    def rememberFacetCounts(self, columnKey: str, resultKey: Hashable, rows: List[int], counts: Dict[str, int]) -> None:
+        self._facetCounts[columnKey] = (resultKey, rows, counts)
+
+    # --- Incremental search ---
+
+    @property
+    def incrementalSearch(self) -> bool:
+        return self._incrementalSearch
+
+    @incrementalSearch.setter
+    def incrementalSearch(self, value: bool) -> None:
+        self._incrementalSearch = bool(value)
+
+    def searchCandidates(
+        self, dataVersion: Hashable, term: str, narrows: Optional[Callable[[str, str], bool]] = None
+    ) -> Optional[List[int]]:
+        '''Rows worth testing for term, or None for a full scan.
+
+        When term narrows the previous term (by default: contains it), its
+        matches can only be a subset of the previous matches, so only those
+        rows need testing. narrows(previous, term) overrides the test for
+        query syntaxes where containment is not enough.
+        '''
+        if not self._incrementalSearch or self._searchMatchKey != self.searchMatchKey(dataVersion):
+            return None
+        previous = self._searchMatchTerm
+        if previous and (narrows(previous, term) if narrows is not None else previous in term):
+            return self._searchMatchRows
+        return None
+
+    def cachedSearchMatches(self, dataVersion: Hashable, term: str) -> Optional[List[int]]:
+        '''Search-only matches already computed for exactly this term, mode and data version.'''
+        if self._searchMatchKey == self.searchMatchKey(dataVersion) and self._searchMatchTerm == term:
+            return self._searchMatchRows
+        return None
+
+    def searchMatchKey(self, dataVersion: Hashable) -> Hashable:
+        '''Data version + every search setting besides the term that changes the matches.'''
+        return (dataVersion, self._searchMode, self._fuzzyLimit if self._searchMode == SearchMode.FUZZY else None)
+
+    def rememberSearchMatches(self, searchKey: Hashable, term: str, rows: List[int]) -> None:
+        '''Keep the search-only matches for term (under searchMatchKey at evaluation time) as the next refinement base.'''
+        self._searchMatchKey = searchKey
+        self._searchMatchTerm = term
+        self._searchMatchRows = rows
+
     # --- Helpers ---
 
     def reset(self) -> None:
         '''Reset all filters to defaults.'''
         self._searchText = ''
+        self._searchMode = SearchMode.TEXT
         self._dataTypeFilter = None
-        self._currentPage = 1
+        self._columnFilters = ()
+        self._filterExpression = None
+        self._facetFilters = {}
+        self.resetPage()
         self._invalidateCache()
 
     def setFilteredCountFn(self, fn: callable) -> None:
-        '''Set callback to compute filtered row count (typically proxy.rowCount).'''
+        '''Set callback to compute filtered row count (typically proxy.countFilteredRows).'''
         self._filteredCountFn = fn
 
     def _invalidateCache(self) -> None:
@@ -0,0 +1,99 @@
+#                      M""""""""`M            dP
+#                      Mmmmmm   .M            88
+#                      MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                      MMP  .MMMMM  88    88  88888"    88'  `88
+#                      M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                      M         M  `88888P'  dP   `YP  `88888P'
+#                      MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                      * * * * * * * * * * * * * * * * * * * * *
+#                      * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                      * -  Copyright © 2026 (Z) Programing  - *
+#                      *    -  -  All Rights Reserved  -  -    *
+#                      * * * * * * * * * * * * * * * * * * * * *
+from __future__ import annotations
+
+from typing import List, Optional
+
+from PySide6.QtCore import QSize, Signal
+from PySide6.QtWidgets import QHBoxLayout, QPushButton, QWidget
+
+
+class Paginator(QWidget):
+    '''Page number bar backed by a fixed pool of buttons.
+
+    Shows the first and last page, `window` pages on each side of the current
+    one and an ellipsis for every gap. The buttons are created once and only
+    relabelled/shown/hidden on update, so refreshing the bar costs the same
+    for 3 pages as for 100,000.
+    '''
+
+    pageClicked = Signal(int)
+
+    CURRENT_STYLE = 'background-color: #007acc;'
+    ELLIPSIS = '...'
+
+    def __init__(self, parent: Optional[QWidget] = None, window: int = 3):
+        super().__init__(parent)
+        self._window = window
+        self._currentPage = 0
+        self._totalPages = 0
+        layout = QHBoxLayout(self)
+        layout.setSpacing(3)
+        layout.setContentsMargins(0, 0, 0, 0)
+        # first, ellipsis, 2*window+1 pages around the current one, ellipsis, last
+        self._buttons: List[QPushButton] = []
+        for _ in range(2 * window + 5):
+            button = QPushButton(self)
+            button.setMaximumSize(QSize(50, 16777215))
+            button.clicked.connect(lambda _=False, button=button: self._onButtonClicked(button))
+            button.setVisible(False)
+            layout.addWidget(button)
+            self._buttons.append(button)
+
+    def currentPage(self) -> int:
+        return self._currentPage
+
+    def totalPages(self) -> int:
+        return self._totalPages
+
+    def setPages(self, currentPage: int, totalPages: int) -> None:
+        '''Relabel the pool for currentPage of totalPages (no-op when unchanged).'''
+        if (currentPage, totalPages) == (self._currentPage, self._totalPages):
+            return
+        self._currentPage = currentPage
+        self._totalPages = totalPages
+        slots = self.pageSlots(currentPage, totalPages, self._window)
+        for i, button in enumerate(self._buttons):
+            if i >= len(slots):
+                button.setVisible(False)
+                continue
+            page = slots[i]
+            button.setProperty('page', page)
+            button.setText(self.ELLIPSIS if page is None else str(page))
+            button.setEnabled(page is not None and page != currentPage)
+            button.setStyleSheet(self.CURRENT_STYLE if page == currentPage else '')
+            button.setVisible(True)
+
+    @staticmethod
+    def pageSlots(currentPage: int, totalPages: int, window: int = 3) -> List[Optional[int]]:
+        '''Page numbers to show, None marking an ellipsis; at most 2*window+5 entries.'''
+        if totalPages <= 2 * window + 5:
+            return list(range(1, totalPages + 1))
+        # Keep the window inside [2, totalPages-1] so the slot count stays constant
+        start = min(max(currentPage - window, 2), totalPages - 2 * window - 1)
+        end = start + 2 * window
+        slots: List[Optional[int]] = [1]
+        # A gap of a single page shows that page instead of an ellipsis
+        if start > 2:
+            slots.append(2 if start == 3 else None)
+        slots.extend(range(start, end + 1))
+        if end < totalPages - 1:
+            slots.append(totalPages - 1 if end == totalPages - 2 else None)
+        slots.append(totalPages)
+        return slots
+
+    def _onButtonClicked(self, button: QPushButton) -> None:
+        page = button.property('page')
+        if page is not None:
+            self.pageClicked.emit(page)
@@ -0,0 +1,124 @@
+#                      M""""""""`M            dP
+#                      Mmmmmm   .M            88
+#                      MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                      MMP  .MMMMM  88    88  88888"    88'  `88
+#                      M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                      M         M  `88888P'  dP   `YP  `88888P'
+#                      MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                      * * * * * * * * * * * * * * * * * * * * *
+#                      * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                      * -  Copyright © 2026 (Z) Programing  - *
+#                      *    -  -  All Rights Reserved  -  -    *
+#                      * * * * * * * * * * * * * * * * * * * * *
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+if TYPE_CHECKING:
+    from .FilterFacade import FilterFacade
+    from .handlers.DataTableHandler import DataTableProxyModel
+
+
+class SearchPipeline(QObject):
+    '''Debounce/coalescing stage between the search input and FilterFacade.setSearch.
+
+    With a debounce of 0 every term is applied immediately (synchronous).
+    Otherwise keystrokes restart a single-shot timer; when it fires, the latest
+    term is evaluated in chunks on the event loop. A newer term abandons the
+    running evaluation at the next chunk boundary, so only the latest term is
+    ever applied. `settled` is emitted once that term's result is live: for
+    background filtering, when the table reports it swapped in (resultApplied)
+    and only if the term is still the current search text.
+    '''
+
+    settled = Signal(str)
+
+    CHUNK_SIZE = 5000
+
+    def __init__(self, facade: 'FilterFacade', proxy: 'DataTableProxyModel', parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._facade = facade
+        self._proxy = proxy
+        self._pendingTerm: Optional[str] = None
+        self._job: Optional[Iterator[None]] = None
+        self._jobTerm = ''
+        # Applied term whose result is not live yet (background filtering)
+        self._unsettledTerm: Optional[str] = None
+
+        self._debounceTimer = QTimer(self)
+        self._debounceTimer.setSingleShot(True)
+        self._debounceTimer.timeout.connect(self._startPending)
+
+        # Zero-interval timer drives one chunk per event-loop pass
+        self._stepTimer = QTimer(self)
+        self._stepTimer.setInterval(0)
+        self._stepTimer.timeout.connect(self._step)
+
+    def debounce(self) -> int:
+        return self._debounceTimer.interval()
+
+    def setDebounce(self, ms: int) -> None:
+        '''Set the quiet period (milliseconds) before a typed term is evaluated; 0 disables.'''
+        self._debounceTimer.setInterval(max(0, int(ms)))
+
+    def isBusy(self) -> bool:
+        '''Whether a term is waiting for the debounce timer or being evaluated.'''
+        return self._debounceTimer.isActive() or self._job is not None
+
+    def submit(self, term: str) -> None:
+        '''Queue term as the latest search, abandoning any older pending/running one.'''
+        self._cancel()
+        if self.debounce() <= 0:
+            self._apply(term)
+            return
+        self._pendingTerm = term
+        self._debounceTimer.start()
+
+    def flush(self) -> None:
+        '''Apply the latest queued term right away (synchronously).'''
+        term = self._pendingTerm if self._pendingTerm is not None else (self._jobTerm if self._job is not None else None)
+        self._cancel()
+        if term is not None:
+            self._apply(term)
+
+    def resultApplied(self, searchText: str) -> None:
+        '''A filter result is live: settle the applied term if it is still the current search text.'''
+        term = self._unsettledTerm
+        if term is None or term != searchText:
+            return
+        self._unsettledTerm = None
+        self.settled.emit(term)
+
+    def _cancel(self) -> None:
+        self._unsettledTerm = None
+        self._debounceTimer.stop()
+        self._stepTimer.stop()
+        self._pendingTerm = None
+        if self._job is not None:
+            self._job.close()
+            self._job = None
+
+    def _startPending(self) -> None:
+        term, self._pendingTerm = self._pendingTerm, None
+        if term is None:
+            return
+        self._job = self._proxy.iterSearchMatches(term, self.CHUNK_SIZE)
+        self._jobTerm = term
+        self._stepTimer.start()
+
+    def _step(self) -> None:
+        try:
+            next(self._job)
+        except StopIteration:
+            self._stepTimer.stop()
+            self._job = None
+            # Matches are cached in FilterState — applying the term does not rescan
+            self._apply(self._jobTerm)
+
+    def _apply(self, term: str) -> None:
+        self._unsettledTerm = term
+        # Settles through resultApplied: synchronously, or once a background result is swapped in
+        self._facade.setSearch(term)
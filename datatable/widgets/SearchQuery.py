@@ -0,0 +1,198 @@
+#                      M""""""""`M            dP
+#                      Mmmmmm   .M            88
+#                      MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                      MMP  .MMMMM  88    88  88888"    88'  `88
+#                      M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                      M         M  `88888P'  dP   `YP  `88888P'
+#                      MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                      * * * * * * * * * * * * * * * * * * * * *
+#                      * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                      * -  Copyright © 2026 (Z) Programing  - *
+#                      *    -  -  All Rights Reserved  -  -    *
+#                      * * * * * * * * * * * * * * * * * * * * *
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any, Callable, List, NamedTuple, Optional, Pattern, Tuple
+
+# column:term, column:=term (exact), column:term* (prefix), values may be "quoted"
+_SCOPED_TOKEN = re.compile(r'(?<!\S)(?P<column>[^\s:"]+):(?P<value>"[^"]*"?|\S*)')
+
+
+class ScopedTerm(NamedTuple):
+    columnKey: str
+    mode: str  # 'contains' | 'exact' | 'prefix'
+    value: str  # lowercased
+
+
+class SearchQuery:
+    '''Parsed search box text: free text plus column-scoped terms.
+
+    Syntax (tokens are AND-ed with the free text):
+        status:act      column display text contains "act"
+        status:=active  column display text equals "active"
+        owner:ngu*      column display text starts with "ngu"
+        city:"new york" quoted values may contain spaces
+
+    A token whose column name does not resolve (e.g. "12:30") stays free text.
+    '''
+
+    CONTAINS = 'contains'
+    EXACT = 'exact'
+    PREFIX = 'prefix'
+
+    def __init__(self, free: str = '', scoped: Optional[List[ScopedTerm]] = None):
+        self.free = free
+        self.scoped: List[ScopedTerm] = scoped or []
+
+    @classmethod
+    def parse(cls, text: str, resolveColumn: Callable[[str], Optional[str]]) -> 'SearchQuery':
+        if ':' not in text:
+            return cls(text)
+        scoped: List[ScopedTerm] = []
+        freeParts: List[str] = []
+        last = 0
+        for match in _SCOPED_TOKEN.finditer(text):
+            columnKey = resolveColumn(match.group('column'))
+            if columnKey is None:
+                continue
+            freeParts.append(text[last:match.start()])
+            last = match.end()
+            value = match.group('value').strip('"')
+            mode = cls.CONTAINS
+            if value.startswith('='):
+                mode, value = cls.EXACT, value[1:]
+            elif value.endswith('*'):
+                mode, value = cls.PREFIX, value.rstrip('*')
+            # An empty value (still typing "status:") constrains nothing
+            if value or mode == cls.EXACT:
+                scoped.append(ScopedTerm(columnKey, mode, value.lower()))
+        if not scoped and last == 0:
+            return cls(text)
+        freeParts.append(text[last:])
+        free = ' '.join(part.strip() for part in freeParts if part.strip())
+        return cls(free, scoped)
+
+    @property
+    def isScoped(self) -> bool:
+        return bool(self.scoped)
+
+    def narrows(self, previous: 'SearchQuery') -> bool:
+        '''True if every row matching self also matches previous.'''
+        if previous.free and previous.free not in self.free:
+            return False
+        return all(any(self._implies(term, prev) for term in self.scoped) for prev in previous.scoped)
+
+    @classmethod
+    def _implies(cls, term: ScopedTerm, prev: ScopedTerm) -> bool:
+        if term.columnKey != prev.columnKey:
+            return False
+        if prev.mode == cls.CONTAINS:
+            return prev.value in term.value
+        if prev.mode == cls.PREFIX:
+            return term.mode in (cls.PREFIX, cls.EXACT) and term.value.startswith(prev.value)
+        return term.mode == cls.EXACT and term.value == prev.value
+
+
+_REGEX_META = set('.^$*+?{}[]\\|()')
+_QUANTIFIERS = set('*?{')
+
+
+@lru_cache(maxsize=32)
+def compileSearchPattern(term: str) -> Tuple[Pattern[str], str]:
+    '''Compile a regex search term (case-insensitive) and extract its literal prefix.
+
+    Returns (pattern, prefix): prefix is a lowercased literal every match must
+    contain ('' when none can be extracted), so rows can be pre-filtered with a
+    plain substring test before the regex runs. An invalid pattern is searched
+    as literal text.
+    '''
+    try:
+        pattern = re.compile(term, re.IGNORECASE)
+    except re.error:
+        return re.compile(re.escape(term), re.IGNORECASE), term.lower()
+    return pattern, _literalPrefix(term).lower()
+
+
+def _literalPrefix(term: str) -> str:
+    '''Leading literal characters that every match of term must contain.'''
+    if '|' in term:
+        return ''  # a top-level alternative may match without the prefix
+    chars: List[str] = []
+    i = 1 if term.startswith('^') else 0
+    while i < len(term):
+        char = term[i]
+        if char == '\\' and i + 1 < len(term) and not term[i + 1].isalnum():
+            chars.append(term[i + 1])
+            i += 2
+            continue
+        if char in _REGEX_META:
+            if char in _QUANTIFIERS and chars:
+                chars.pop()  # the quantified character is optional
+            break
+        chars.append(char)
+        i += 1
+    return ''.join(chars)
+
+
+class FuzzyPattern(NamedTuple):
+    term: str  # lowercased
+    maxEdits: int
+    pieces: Tuple[Tuple[str, ...], ...]  # per budget b: any match within b edits contains one of pieces[b]
+    pieceSearch: Tuple[Callable[[str], Any], ...]  # per budget b: finds any of pieces[b] in one C call
+    peq: dict  # char -> bitmask of its positions in term
+
+
+@lru_cache(maxsize=32)
+def compileFuzzyPattern(term: str) -> FuzzyPattern:
+    '''Prepare a fuzzy search term: edit budget, pruning pieces and Myers bitmasks.
+
+    The budget grows with the term (1 edit per 3 characters, none below 4).
+    For each budget b <= maxEdits the term is cut into b + 1 pieces: by the
+    pigeonhole principle, a text within b edits of the term contains one
+    piece unchanged.
+    '''
+    term = term.strip().lower()
+    maxEdits = len(term) // 3 if len(term) >= 4 else 0
+    pieces = tuple(_splitPieces(term, budget + 1) for budget in range(maxEdits + 1))
+    pieceSearch = tuple(re.compile('|'.join(map(re.escape, budgetPieces))).search for budgetPieces in pieces)
+    peq: dict = {}
+    for position, char in enumerate(term):
+        peq[char] = peq.get(char, 0) | (1 << position)
+    return FuzzyPattern(term, maxEdits, pieces, pieceSearch, peq)
+
+
+def _splitPieces(term: str, count: int) -> Tuple[str, ...]:
+    size = len(term) // count
+    return tuple(term[i * size:(i + 1) * size if i < count - 1 else len(term)] for i in range(count))
+
+
+def fuzzyDistance(pattern: FuzzyPattern, text: str) -> int:
+    '''Fewest edits turning pattern.term into any substring of text (Myers' bit-vector algorithm).'''
+    length = len(pattern.term)
+    if pattern.term in text:
+        return 0
+    peq = pattern.peq
+    mask = (1 << length) - 1
+    high = 1 << (length - 1)
+    pv, mv = mask, 0
+    score = best = length
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+            if score < best:
+                best = score
+        ph = (ph << 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+    return best
@@ -11,19 +11,23 @@
 #                      * -  Copyright © 2026 (Z) Programing  - *
 #                      *    -  -  All Rights Reserved  -  -    *
 #                      * * * * * * * * * * * * * * * * * * * * *
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-from PySide6.QtCore import QPoint, Qt, Signal, QTimer, QItemSelectionModel, QEvent
+from PySide6.QtCore import QLocale, QPoint, Qt, Signal, QTimer, QItemSelectionModel, QEvent
 from PySide6.QtGui import QAction, QColor, QCursor
-from PySide6.QtWidgets import QAbstractItemView, QComboBox, QFrame, QHBoxLayout, QHeaderView, QLabel, QLineEdit, QMenu, QPushButton, QSpinBox, QStyle, QTableView, QVBoxLayout
+from PySide6.QtWidgets import QAbstractItemView, QApplication, QComboBox, QFrame, QHBoxLayout, QHeaderView, QLabel, QLineEdit, QMenu, QSpinBox, QStyle, QTableView, QVBoxLayout
 
 from ..core.BaseController import BaseController
-from ..models.datatable_model import DataTableModel, DataType, SortOrder
+from ..models.datatable_model import COMPARISON_OPERATORS, DataTableModel, DataType, ScrollMode, SearchMode, SortOrder
+from ..models.filter_expression import FilterExpression
 from ..models.delegates import BooleanDelegate, DateDelegate, NumericDelegate, ProgressDelegate, ProgressBarDelegate, IconBooleanDelegate, ActionButtonsDelegate
 from ..ui.untitled import Ui_DataTable
 from ..widgets.FilterState import FilterState
 from ..widgets.FilterFacade import FilterFacade
-from ..widgets.handlers.DataTableHandler import DataTableProxyModel
+from ..widgets.SearchPipeline import SearchPipeline
+from ..widgets.BackgroundFilter import BackgroundFilter
+from ..widgets.Paginator import Paginator
+from ..widgets.handlers.DataTableHandler import DataTableIndexProxyModel, DataTableProxyModel
 
 
 class DataTable(Ui_DataTable, BaseController):
@@ -38,6 +42,10 @@ class DataTable(Ui_DataTable, BaseController):
     sortChanged = Signal(str, SortOrder)
     selectionChanged = Signal(QItemSelectionModel, QItemSelectionModel)
     rowActionClicked = Signal(str, str, dict)  # column_key, action_key, row_data
+    searchSettled = Signal(str)  # latest search term, once its result is shown
+    filteringBusyChanged = Signal(bool)  # background filter evaluation started/finished
+    # Columns with more distinct values than this get no value list in the header "Filter" submenu
+    FACET_MENU_LIMIT = 200
     # Slot map
     slot_map = {
         'search_text_changed': ['searchInput', 'textChanged'],
@@ -57,9 +65,9 @@ class DataTable(Ui_DataTable, BaseController):
         # 'select_inverse': ['selectInverseButton', 'clicked']
     }
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, indexProxy: bool = False):
         super().__init__(parent)
-        self._setupProxyAndModel()
+        self._setupProxyAndModel(indexProxy)
         self.tableView.setModel(self._proxyModel)
 
         # Column configurations for delegates
@@ -78,28 +86,50 @@ class DataTable(Ui_DataTable, BaseController):
         self._show_integers_without_decimals = True
     def getModelInstance(self) -> 'DataTableModel':
         return self._model
-    def getProxyModelInstance(self) -> 'DataTableProxyModel':
+    def getProxyModelInstance(self) -> 'DataTableProxyModel | DataTableIndexProxyModel':
         return self._proxyModel
     def getFilterStateInstance(self):
         return self._filterState
-    def _setupProxyAndModel(self):
+    def _setupProxyAndModel(self, indexProxy: bool = False):
         self._model = DataTableModel(self)
 
         # Filter system: FilterState (single source of truth) + FilterFacade (orchestrator)
         self._filterState = FilterState()
-        self._proxyModel = DataTableProxyModel(self._filterState, self)
-        self._proxyModel.setSourceModel(self._model)
-        self._proxyModel.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self._proxyModel.setDynamicSortFilter(False)  # Disable auto-sort to preserve grouping
+        if indexProxy:
+            # Page rows as an index array: no per-source-row filterAcceptsRow callbacks
+            self._proxyModel = DataTableIndexProxyModel(self._filterState, self)
+            self._proxyModel.setSourceModel(self._model)
+        else:
+            self._proxyModel = DataTableProxyModel(self._filterState, self)
+            self._proxyModel.setSourceModel(self._model)
+            self._proxyModel.setFilterCaseSensitivity(Qt.CaseInsensitive)
+            self._proxyModel.setDynamicSortFilter(False)  # Disable auto-sort to preserve grouping
 
         # Wire filteredCount to proxy's search+type-only count (excludes pagination)
         self._filterState.setFilteredCountFn(self._proxyModel.countFilteredRows)
+        # Infinite scroll adds rows without a filter state change
+        self._proxyModel.rowsInserted.connect(self._updateEntriesLabels)
+        self._proxyModel.modelReset.connect(self._updateEntriesLabels)
+
+        # Off-thread evaluation, used when setBackgroundFiltering(True)
+        self._backgroundFilter = BackgroundFilter(self._proxyModel, self)
+        self._backgroundFilter.busyChanged.connect(self.filteringBusyChanged)
 
         self._filterFacade = FilterFacade(
             state=self._filterState,
             invalidateProxy=self._proxyModel.invalidateAndRefresh,
             onStateChanged=self._onFilterStateChanged,
+            invalidatePagination=self._proxyModel.invalidatePagination,
+            filterInBackground=self._backgroundFilter.start,
+            onApplied=self._onFilterApplied,
         )
+        # Debounce/coalescing stage for the search input (synchronous until setSearchDebounce)
+        self._searchPipeline = SearchPipeline(self._filterFacade, self._proxyModel, self)
+        self._searchPipeline.settled.connect(self.searchSettled)
+    def _onFilterApplied(self) -> None:
+        """A recomputed filter result is live: let the search pipeline settle its term"""
+        self._searchPipeline.resultApplied(self._filterState.searchText)
+
     def _connectModelSignals(self):
         self._model.modelReset.connect(self._onModelReset)
         self._model.rowExpandedCollapsed.connect(self._onRowExpandedCollapsed)
@@ -109,8 +139,15 @@ class DataTable(Ui_DataTable, BaseController):
         # Setup UI elements right after initializing self._model
         self._setupHeaderContextMenu()
         self._setupRowContextMenu()
+        self._setupPaginator()
         # Configure the view
-        self.tableView.setSortingEnabled(True)
+        # Header clicks sort the whole filtered set through sortBy (shift-click adds a sort column),
+        # so the view's own single-column sorting stays off. Start unsorted (rows in data order).
+        self.tableView.setSortingEnabled(False)
+        self.tableView.horizontalHeader().setSectionsClickable(True)
+        self.tableView.horizontalHeader().setSortIndicatorShown(True)
+        self.tableView.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.tableView.horizontalHeader().sortIndicatorChanged.connect(self._onSortIndicatorChanged)
         self.tableView.setSelectionBehavior(QTableView.SelectRows)
         self.tableView.setSelectionMode(QTableView.ExtendedSelection)  # Enable multi-selection
         self.tableView.verticalHeader().setVisible(False)
@@ -292,7 +329,44 @@ class DataTable(Ui_DataTable, BaseController):
         if self.searchInput.text() != term:
             self.searchInput.setText(term)
         else:
-            self._filterFacade.setSearch(term)
+            self._searchPipeline.submit(term)
+        return self
+
+    def setSearchDebounce(self, ms: int) -> 'DataTable':
+        """Coalesce fast typing in the search box
+
+        With ms > 0, a term is only evaluated after the input has been quiet for
+        ms milliseconds, in chunks that a newer term abandons. searchSettled is
+        emitted when the latest term has been applied.
+
+        Args:
+            ms: Quiet period in milliseconds (0 applies every keystroke immediately)
+        """
+        self._searchPipeline.setDebounce(ms)
+        return self
+
+    def setSearchMode(self, mode: SearchMode) -> 'DataTable':
+        """Choose how the search box text is matched
+
+        SearchMode.REGEX treats the text as a case-insensitive regular
+        expression over the visible columns' display text (an invalid pattern
+        is searched literally). Compiled patterns are cached.
+        SearchMode.FUZZY tolerates typos (1 edit per 3 characters) and keeps
+        only the best-scoring rows, best first (see setFuzzyLimit).
+
+        Args:
+            mode: SearchMode.TEXT (default), SearchMode.REGEX or SearchMode.FUZZY
+        """
+        self._filterFacade.setSearchMode(mode)
+        return self
+
+    def setFuzzyLimit(self, limit: int) -> 'DataTable':
+        """Set how many best-matching rows a fuzzy search keeps
+
+        Args:
+            limit: Number of rows (top-K), default 100
+        """
+        self._filterFacade.setFuzzyLimit(limit)
         return self
 
     def applyFilters(self, search_term: Optional[str] = None, data_type: Optional[DataType] = None) -> 'DataTable':
@@ -304,6 +378,147 @@ class DataTable(Ui_DataTable, BaseController):
         self._filterFacade.refresh()
         return self
 
+    def addRangeFilter(self, column_key: str, lo: Any = None, hi: Any = None) -> 'DataTable':
+        """Keep only rows whose value in a numeric/progress/date column lies in [lo, hi]
+
+        Structured filters are AND-ed with each other, the search and the type filter.
+
+        Args:
+            column_key: Column key (NUMERIC, PROGRESS, PROGRESS_BAR or DATE column)
+            lo: Inclusive lower bound, or None for no lower bound
+            hi: Inclusive upper bound, or None for no upper bound
+        """
+        filters = [(column_key, op, value) for op, value in (('>=', lo), ('<=', hi)) if value is not None]
+        for column_filter in filters:
+            self._validateColumnFilter(*column_filter)
+        if filters:
+            self._filterFacade.addColumnFilters(filters)
+        return self
+
+    def addComparisonFilter(self, column_key: str, op: str, value: Any) -> 'DataTable':
+        """Keep only rows whose value in a numeric/progress/date column compares true against value
+
+        Args:
+            column_key: Column key (NUMERIC, PROGRESS, PROGRESS_BAR or DATE column)
+            op: One of '<', '<=', '>', '>=', '==', '!='
+            value: Number, or date / ISO date string for DATE columns
+        """
+        self._validateColumnFilter(column_key, op, value)
+        self._filterFacade.addColumnFilters([(column_key, op, value)])
+        return self
+
+    def _validateColumnFilter(self, column_key: str, op: str, value: Any) -> None:
+        if not self._model.isNumericFilterColumn(column_key):
+            raise ValueError(f'Column {column_key} is not a numeric, progress or date column')
+        if op not in COMPARISON_OPERATORS:
+            raise ValueError(f'Invalid comparison operator: {op}')
+        if self._model.toFilterNumber(column_key, value) is None:
+            raise ValueError(f'Invalid filter value for column {column_key}: {value!r}')
+
+    def removeColumnFilter(self, column_key: str) -> 'DataTable':
+        """Remove every range/comparison filter on a column
+
+        Args:
+            column_key: Column key
+        """
+        self._filterFacade.removeColumnFilters(column_key)
+        return self
+
+    def clearColumnFilters(self) -> 'DataTable':
+        """Remove every range/comparison filter"""
+        self._filterFacade.clearColumnFilters()
+        return self
+
+    def setFacetFilter(self, column_key: str, values: Optional[Iterable[str]]) -> 'DataTable':
+        """Keep only rows whose displayed value in a column is one of values
+
+        Same as ticking values in the header menu's "Filter" submenu. Values
+        of one column are OR-ed; facets of different columns are AND-ed with
+        each other and with every other filter. Rows are looked up in the
+        model's value -> rows hash index, so no row is scanned.
+
+        Args:
+            column_key: Column key
+            values: Display values to keep, or None / empty to remove the facet
+        """
+        self._filterFacade.setFacetFilter(column_key, values)
+        return self
+
+    def clearFacetFilters(self) -> 'DataTable':
+        """Remove every facet filter"""
+        self._filterFacade.clearFacetFilters()
+        return self
+
+    def facetCounts(self, column_key: str) -> Dict[str, int]:
+        """Count the filtered rows per displayed value of a column
+
+        Counts cover the rows matching every current filter (not just the
+        current page). Results are cached until the data or a filter changes;
+        after a narrowing search the removed rows are subtracted instead of
+        recounting.
+
+        Args:
+            column_key: Column key
+
+        Returns:
+            Dict of display value -> number of filtered rows showing it
+        """
+        return self._proxyModel.facetCounts(column_key)
+
+    def setFilterExpression(self, expression: Optional[str]) -> 'DataTable':
+        """Filter rows with a boolean expression over column keys
+
+        e.g. "amount > 1000 and status == 'open' and not archived". The
+        expression is parsed and compiled once; numeric/date comparisons run
+        as vectorized masks when NumPy is installed. It is AND-ed with the
+        search, type and column filters.
+
+        Args:
+            expression: Expression source, or None / '' to remove it
+
+        Raises:
+            FilterExpressionError: If the expression is invalid or references unknown columns
+        """
+        compiled = FilterExpression(expression, self._model) if expression and expression.strip() else None
+        self._filterFacade.setFilterExpression(compiled)
+        return self
+
+    def setBackgroundFiltering(self, enabled: bool = True) -> 'DataTable':
+        """Evaluate search and type filters on a worker thread
+
+        The table keeps showing the previous result while the worker runs
+        (filteringBusyChanged reports it) and swaps the new rows in at once.
+        Custom search/formatting functions must then be safe to call off the GUI thread.
+
+        Args:
+            enabled: Whether filtering runs in the background
+        """
+        self._filterFacade.setBackgroundFiltering(enabled)
+        if not enabled:
+            self._backgroundFilter.cancel()
+        return self
+
+    def enableSearchIndex(self, enabled: bool = True) -> 'DataTable':
+        """Enable or disable the trigram search index (faster substring search on large tables)
+
+        Args:
+            enabled: Whether the index is built and maintained
+        """
+        self._model.enableSearchIndex(enabled)
+        return self
+
+    def setIncrementalSearch(self, enabled: bool = True) -> 'DataTable':
+        """Enable or disable narrowing search (only re-test previous matches when the term grows)
+
+        Searches over a column with a custom search function always test every
+        row, whatever this setting.
+
+        Args:
+            enabled: Whether narrowing search is enabled
+        """
+        self._filterState.incrementalSearch = enabled
+        return self
+
     def sort(self, column_key: str, order: SortOrder = SortOrder.ASCENDING) -> 'DataTable':
         """Sort the table
 
@@ -314,10 +529,60 @@ class DataTable(Ui_DataTable, BaseController):
         if column_key not in self._model._visible_columns:
             return self
 
-        col_index = self._model._visible_columns.index(column_key)
-        self.tableView.sortByColumn(col_index, order.value)
+        return self.sortBy([(column_key, order)])
+
+    def sortBy(self, spec: Iterable[Tuple[str, SortOrder]]) -> 'DataTable':
+        """Sort the table by several columns
+
+        Rows are ordered by the first column, ties by the second, and so on.
+        Shift-clicking a header adds that column to the current sort (or flips
+        its direction).
+
+        Args:
+            spec: (column_key, SortOrder) pairs, most significant first, example:
+                [('region', SortOrder.ASCENDING), ('amount', SortOrder.DESCENDING)].
+                An empty list restores the data order
+        """
+        sortSpec = []
+        for column_key, order in spec:
+            if column_key in self._model._column_keys and order != SortOrder.NONE and column_key not in dict(sortSpec):
+                sortSpec.append((column_key, order))
+        self._proxyModel.setSortSpec(tuple(sortSpec))
+        self._showSortIndicator()
         return self
 
+    def _onSortIndicatorChanged(self, section: int, order: Qt.SortOrder) -> None:
+        if not 0 <= section < len(self._model._visible_columns):
+            self.sortBy([])
+            return
+        column_key = self._model._visible_columns[section]
+        spec = list(self._filterState.sortSpec)
+        if QApplication.keyboardModifiers() & Qt.ShiftModifier and spec:
+            keys = [key for key, _ in spec]
+            if column_key in keys:
+                # Flip an existing sort column in place
+                position = keys.index(column_key)
+                flipped = SortOrder.ASCENDING if spec[position][1] == SortOrder.DESCENDING else SortOrder.DESCENDING
+                spec[position] = (column_key, flipped)
+            else:
+                spec.append((column_key, SortOrder.ASCENDING))
+        else:
+            spec = [(column_key, SortOrder.DESCENDING if order == Qt.DescendingOrder else SortOrder.ASCENDING)]
+        self.sortBy(spec)
+
+    def _showSortIndicator(self) -> None:
+        """Point the header sort indicator at the primary sort column"""
+        header = self.tableView.horizontalHeader()
+        spec = self._filterState.sortSpec
+        section, order = -1, Qt.AscendingOrder
+        if spec and spec[0][0] in self._model._visible_columns:
+            section = self._model._visible_columns.index(spec[0][0])
+            order = spec[0][1].value
+        header.blockSignals(True)
+        header.setSortIndicator(section, order)
+        header.blockSignals(False)
+        header.viewport().update()
+
     def setPage(self, page: int) -> 'DataTable':
         """Set the current page
 
@@ -327,6 +592,26 @@ class DataTable(Ui_DataTable, BaseController):
         self._filterFacade.setPage(page)
         return self
 
+    def setScrollMode(self, mode: Union[ScrollMode, str], chunkSize: Optional[int] = None) -> 'DataTable':
+        """Choose between page buttons and infinite scrolling
+
+        In infinite mode the pagination controls are hidden and the view shows
+        the first chunk of filtered rows, fetching the next chunk when it is
+        scrolled to the end. Search, filters and sorting still apply to all rows;
+        changing them starts again from the first chunk.
+
+        Args:
+            mode: ScrollMode.PAGED / ScrollMode.INFINITE, or 'paged' / 'infinite'
+            chunkSize: Rows per fetched chunk (default 100)
+        """
+        mode = ScrollMode(mode)
+        paged = mode == ScrollMode.PAGED
+        # rowsPerPageLabel stays as the UI sets it up (hidden)
+        for widget in (self.pagesLayout, self.rowsPerPageCombo):
+            widget.setVisible(paged)
+        self._filterFacade.setScrollMode(mode, chunkSize)
+        return self
+
     def setRowsPerPage(self, rows: int) -> 'DataTable':
         """Set rows per page
 
@@ -406,8 +691,7 @@ class DataTable(Ui_DataTable, BaseController):
         """
         success = self._model._insertRow(row_index, row_data)
         if success:
-            self._filterState.setRawData(self._model._data)
-            self._filterFacade.refresh()
+            self._refreshInsertedRows()
         return success
 
     def appendRow(self, row_data: Dict[str, Any]) -> bool:
@@ -421,10 +705,18 @@ class DataTable(Ui_DataTable, BaseController):
         """
         success = self._model.appendRow(row_data)
         if success:
-            self._filterState.setRawData(self._model._data)
-            self._filterFacade.refresh()
+            self._refreshInsertedRows()
         return success
 
+    def _refreshInsertedRows(self) -> None:
+        """Update the view after a row insert"""
+        self._filterState.setRawData(self._model._data)
+        if self._filterState.hasFilterResult(self._proxyModel.dataVersion()):
+            # The proxy spliced the row into its cached (sorted) result: only the page is re-sliced
+            self._filterFacade.refreshPage()
+        else:
+            self._filterFacade.refresh()
+
     def setIntegerDisplay(self, show_without_decimals: bool) -> 'DataTable':
         """Set whether to display integers without decimal places
 
@@ -454,6 +746,24 @@ class DataTable(Ui_DataTable, BaseController):
         self._model.setFormattingFunction(column_key, func)
         return self
 
+    def enableSortCollation(self, column_key: str, enabled: bool = True, locale: Union[QLocale, str, None] = None, numeric: bool = False) -> 'DataTable':
+        """Sort a column in the collation order of a locale (e.g. Vietnamese, accented text)
+
+        Collation keys are computed once per row and cached, so sorting
+        compares precomputed keys instead of collating strings pair by pair.
+
+        Args:
+            column_key: Column key
+            enabled: False restores the default sort of the column type
+            locale: QLocale or locale name, example: 'vi_VN' (default: the system locale)
+            numeric: Compare digit runs by value ('item2' before 'item10')
+        """
+        self._model.enableSortCollation(column_key, enabled, locale, numeric)
+        if column_key in dict(self._filterState.sortSpec):
+            # The data version changed: the page is re-sorted with the new keys
+            self._filterFacade.refreshPage()
+        return self
+
     # Delegate Configuration Methods
     def setProgressBarColor(self, column_key: str, color: Union[str, Any]) -> 'DataTable':
         """Set base color for a progress bar column"""
@@ -659,32 +969,25 @@ class DataTable(Ui_DataTable, BaseController):
                     self.clearLayout(sub_layout)
 
     def _onFilterStateChanged(self) -> None:
-        '''Unified UI callback: rebuild pagination buttons and update labels.
+        '''Unified UI callback: relabel pagination buttons and update labels.
 
         Called by FilterFacade whenever state changes.
         '''
         state = self._filterState
         totalPages = state.totalPages
         currentPage = state.currentPage
-        filteredCount = state.filteredCount
 
         self.pageSpinBox.setMaximum(totalPages)
 
-        # Rebuild page buttons
-        self.clearLayout(self._pagesLayout)
-
-        for pageNum in range(currentPage - 3, totalPages + currentPage + 3):
-            if pageNum < 1 or pageNum > totalPages:
-                continue
-
-            self.__setattr__(f'page{pageNum}Button', QPushButton(str(pageNum)))
-            self._pagesLayout.addWidget(self.__getattribute__(f'page{pageNum}Button'))
-            if pageNum == currentPage:
-                self.__getattribute__(f'page{pageNum}Button').setEnabled(False)
-            if pageNum == currentPage + 3 and pageNum < totalPages:
-                self._pagesLayout.addWidget(QPushButton('...'))
+        self._paginator.setPages(currentPage, totalPages)
+        self._updateEntriesLabels()
+        self._updateFirstLastVisible()
+        self.pageChanged.emit(currentPage)
 
-        # Update entries labels
+    def _updateEntriesLabels(self, *args) -> None:
+        '''Show the displayed row range and the filtered total (also as infinite scroll loads rows).'''
+        state = self._filterState
+        filteredCount = state.filteredCount
         if filteredCount == 0:
             self.displayingEntriesLbl.setText('0')
             self.totalEntriesLbl.setText('0')
@@ -693,26 +996,12 @@ class DataTable(Ui_DataTable, BaseController):
             self.displayingEntriesLbl.setText(f'{start + 1} - {end}')
             self.totalEntriesLbl.setText(str(filteredCount))
 
-        self._updateFirstLastVisible()
-        self._updateCurrentPageButton()
-        self.pageChanged.emit(currentPage)
-
-    def _updateCurrentPageButton(self):
-        '''Update current page button styling and connections.'''
-        state = self._filterState
-        for i in range(1, state.totalPages + 1):
-            btn = getattr(self, f'page{i}Button', None)
-            if btn is None:
-                continue
-            if not btn.property('isChangePageConnected'):
-                btn.setProperty('isChangePageConnected', True)
-                btn.clicked.connect(lambda _, page=i: self._filterFacade.setPage(page))
-            if i == state.currentPage:
-                btn.setStyleSheet('background-color: #007acc;')
-                btn.setEnabled(False)
-            else:
-                btn.setStyleSheet('')
-                btn.setEnabled(True)
+    def _setupPaginator(self) -> None:
+        '''Replace the designer page buttons with a fixed pool that is relabelled per page change.'''
+        self.clearLayout(self._pagesLayout)
+        self._paginator = Paginator(self.pagesLayout)
+        self._paginator.pageClicked.connect(self._filterFacade.setPage)
+        self._pagesLayout.addWidget(self._paginator)
 
     def _updateFirstLastVisible(self):
         state = self._filterState
@@ -759,6 +1048,10 @@ class DataTable(Ui_DataTable, BaseController):
 
             self._header_menu.addSeparator()
 
+            # Facet (value) filter actions
+            self._addFacetMenu(column_key, column_name)
+            self._header_menu.addSeparator()
+
         # Column visibility actions
         vis_menu = self._header_menu.addMenu('Column Visibility')
         # Create mapping from column_keys to headers to avoid index issues
@@ -774,6 +1067,42 @@ class DataTable(Ui_DataTable, BaseController):
         global_pos = header.mapToGlobal(pos)
         self._header_menu.popup(global_pos)
     
+    def _addFacetMenu(self, column_key: str, column_name: str) -> None:
+        """Add the multi-select value filter submenu of a column to the header menu
+
+        Args:
+            column_key: Column key
+            column_name: Header text
+        """
+        facet_menu = self._header_menu.addMenu(f'Filter {column_name}')
+        selected = self._filterState.facetFilters.get(column_key, frozenset())
+        values = self._model.facetValues(column_key)
+        if len(values) > self.FACET_MENU_LIMIT:
+            action = QAction(f'Too many values ({len(values)})', facet_menu)
+            action.setEnabled(False)
+            facet_menu.addAction(action)
+        else:
+            counts = self.facetCounts(column_key)
+            for value in values:
+                action = QAction(f"{value if value.strip() else '(Blank)'} ({counts.get(value, 0)})", facet_menu)
+                action.setCheckable(True)
+                action.setChecked(value in selected)
+                action.triggered.connect(lambda checked, v=value: self._toggleFacetValue(column_key, v, checked))
+                facet_menu.addAction(action)
+        facet_menu.addSeparator()
+        clear_action = QAction('Clear Filter', facet_menu)
+        clear_action.setEnabled(bool(selected))
+        clear_action.triggered.connect(lambda: self.setFacetFilter(column_key, None))
+        facet_menu.addAction(clear_action)
+
+    def _toggleFacetValue(self, column_key: str, value: str, checked: bool) -> None:
+        selected = set(self._filterState.facetFilters.get(column_key, ()))
+        if checked:
+            selected.add(value)
+        else:
+            selected.discard(value)
+        self.setFacetFilter(column_key, selected)
+
     def eventFilter(self, obj, event):
         """Event filter for handling mouse hover tooltips"""
         if obj == self.tableView.viewport() and event.type() == QEvent.Type.ToolTip:
@@ -13,21 +13,22 @@
 #                      * * * * * * * * * * * * * * * * * * * * *
 from __future__ import annotations
 
-from typing import Any, Dict, TYPE_CHECKING, Tuple, Union
+from typing import Any, Dict, List, Optional, TYPE_CHECKING, Tuple
 
-from PySide6.QtCore import QItemSelectionModel, QModelIndex, Qt, QSortFilterProxyModel, QAbstractItemModel
+from PySide6.QtCore import QItemSelectionModel, QModelIndex, Qt, QSortFilterProxyModel, QAbstractItemModel, QAbstractProxyModel
 from PySide6.QtWidgets import QHeaderView, QMenu
 
 
 from ...core.Observer import Subscriber
 from ...core.WidgetManager import WidgetManager
 from ...models.datatable_model import DataTableModel, DataType, SortOrder
+from ..FilterEngine import FilterEngineMixin
 
 if TYPE_CHECKING:
     from ..FilterState import FilterState
 
 
-class DataTableProxyModel(QSortFilterProxyModel):
+class DataTableProxyModel(FilterEngineMixin, QSortFilterProxyModel):
     '''Proxy model that reads filter criteria from FilterState.
 
     Does NOT hold its own filter state — everything is delegated to FilterState.
@@ -36,98 +37,330 @@ class DataTableProxyModel(QSortFilterProxyModel):
 
     def __init__(self, filterState: 'FilterState', parent=None):
         super().__init__(parent)
-        self._filterState = filterState
+        self._initFilterEngine(filterState)
+
+    def setSourceModel(self, sourceModel: QAbstractItemModel) -> None:
+        '''Attach source model and track its changes to keep the cached result set fresh.'''
+        oldModel = self.sourceModel()
+        # Connected first: inserted rows are spliced into the cached result before Qt filters them
+        self._trackSourceModel(oldModel, sourceModel)
+        super().setSourceModel(sourceModel)
 
     def invalidateAndRefresh(self) -> None:
-        '''Trigger re-evaluation of filterAcceptsRow for all rows.'''
-        self._filterState._invalidateCache()
+        '''Recompute the filter result set, then re-evaluate filterAcceptsRow for all rows.'''
+        self._holdResult = False
+        self._swapPending = False
+        self._filterState.clearFilterResult()
         self.invalidateFilter()
+        self._sortPage()
 
-    def countFilteredRows(self) -> int:
-        '''Count rows matching search + type filters ONLY (ignoring pagination).
+    def invalidatePagination(self) -> None:
+        '''Re-slice the cached result set for the current page window.
 
-        Used by FilterState.filteredCountFn to compute totalPages correctly.
+        Search/type matching is not re-run while the data version and filter
+        fingerprint are unchanged; each filterAcceptsRow call is a dict lookup.
+        QSortFilterProxyModel still calls it for every source row when the window
+        moves, so a page change stays O(rows) here; DataTableIndexProxyModel
+        re-slices in O(rows per page). A result installed by a background worker
+        is swapped in with a single layout change instead.
         '''
-        model = self.sourceModel()
-        if model is None:
-            return 0
-        count = 0
-        emptyParent = QModelIndex()
-        for row in range(model.rowCount()):
-            if self._matchesSearchAndType(row, emptyParent):
-                count += 1
-        return count
+        if self._swapPending:
+            self._swapPending = False
+            self.invalidate()
+            return
+        if not self._showsWindow():
+            self.invalidateFilter()
+        self._sortPage()
+
+    def _showsWindow(self) -> bool:
+        '''Whether the accepted rows already are the page window (e.g. a row was spliced in off the page).'''
+        self._ensureOrderedRows()
+        start, end = self._filterState.paginationRange
+        if self.rowCount() != end - start:
+            return False
+        window = set(self._filterState.orderedRows[start:end])
+        return all(self.mapToSource(self.index(row, 0)).row() in window for row in range(self.rowCount()))
+
+    def _sortPage(self) -> None:
+        # Rows accepted by a re-filter are not placed in order while dynamicSortFilter is off.
+        # Rows are compared by their position in the result order, so the direction is already applied
+        column = self._sortColumn(self._filterState.sortSpec)
+        if column < 0 and self._resultIsRanked():
+            column = 0  # unsorted fuzzy result: best match first, not source order
+        if column >= 0 or self.sortColumn() >= 0:
+            QSortFilterProxyModel.sort(self, column, Qt.AscendingOrder)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        '''Infinite scroll: grow the window by one chunk and accept its rows.'''
+        if not self.canFetchMore(parent):
+            return
+        self._filterState.fetchMore()
+        self.invalidateFilter()
+        self._sortPage()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        '''Sort the whole result set by column; the page then shows its slice of that order.'''
+        self.setSortSpec(self._sortSpecFor(column, order))
+
+    def setSortSpec(self, sortSpec: Tuple[Tuple[str, SortOrder], ...]) -> None:
+        '''Sort the whole result set by (columnKey, SortOrder) pairs, most significant first.'''
+        self._filterState.sortSpec = sortSpec
+        self.invalidateFilter()
+        self._sortPage()
 
     def filterAcceptsRow(self, sourceRow: int, sourceParent: QModelIndex) -> bool:
         '''Combined filter: search + type + pagination. Reads from FilterState.'''
-        # 1. Search + Type filter
-        if not self._matchesSearchAndType(sourceRow, sourceParent):
+        self._ensureOrderedRows()
+        state = self._filterState
+        # Pagination — applied AFTER search+type filtering and sorting, via the row's sorted index
+        filteredIdx = state.orderedPosition(sourceRow)
+        if filteredIdx is None:
             return False
+        start, end = state.paginationRange
+        return start <= filteredIdx < end
+
+    def lessThan(self, sourceLeft: QModelIndex, sourceRight: QModelIndex) -> bool:
+        '''Compare rows by their position in the globally sorted (or fuzzy-ranked) result set.
 
-        # 2. Pagination — applied AFTER search+type filtering
-        #    We need to count which "filtered index" this row is at,
-        #    then check if that index falls within the current page range.
+        Falls back to the rank under the column's sort function (keys are
+        precomputed once) when no sort spec is set.
+        '''
         state = self._filterState
-        start, end = state.paginationRange
-        filteredIdx = self._getFilteredIndex(sourceRow, sourceParent)
-        if filteredIdx < start or filteredIdx >= end:
-            return False
+        if state.sortSpec or self._resultIsRanked():
+            left, right = state.orderedPosition(sourceLeft.row()), state.orderedPosition(sourceRight.row())
+            if left is not None and right is not None:
+                # orderedRows is already in the requested direction; Qt inverts lessThan for descending
+                return (left < right) != (self.sortOrder() == Qt.DescendingOrder)
+        model = self.sourceModel()
+        if isinstance(model, DataTableModel) and 0 <= sourceLeft.column() < len(model._visible_columns):
+            ranks = model.sortRanks(model._visible_columns[sourceLeft.column()])
+            return bool(ranks[sourceLeft.row()] < ranks[sourceRight.row()])
+        return super().lessThan(sourceLeft, sourceRight)
+
+
+class DataTableIndexProxyModel(FilterEngineMixin, QAbstractProxyModel):
+    '''Proxy model exposing the current page as an array of source rows.
+
+    Filters exactly like DataTableProxyModel, but instead of answering a
+    filterAcceptsRow callback for every source row it keeps one list of the
+    source rows on screen (filter + sort + page window) and its inverse.
+    mapToSource/mapFromSource are list lookups, and every refresh emits a
+    single reset (row count changed) or layout change. Source rows inserted
+    while the result is cached are emitted as rowsInserted at their spot.
+    '''
 
-        return True
+    def __init__(self, filterState: 'FilterState', parent=None):
+        super().__init__(parent)
+        self._initFilterEngine(filterState)
+        # Source row per proxy row, and proxy row per source row (-1 = not on the page)
+        self._rows: List[int] = []
+        self._inverse: List[int] = []
+        self._resetting = False
+
+    def setSourceModel(self, sourceModel: QAbstractItemModel) -> None:
+        '''Attach source model; structural source changes reset this proxy.'''
+        oldModel = self.sourceModel()
+        self.beginResetModel()
+        if oldModel is not None:
+            for signal, slot in self._sourceStructureSignals(oldModel):
+                try:
+                    signal.disconnect(slot)
+                except (RuntimeError, TypeError):
+                    pass
+        super().setSourceModel(sourceModel)
+        # Cache invalidation first: it must run before the rows are rebuilt
+        self._trackSourceModel(oldModel, sourceModel)
+        if sourceModel is not None:
+            for signal, slot in self._sourceStructureSignals(sourceModel):
+                signal.connect(slot)
+        self._setRows(self._windowRows())
+        self.endResetModel()
+
+    def _sourceStructureSignals(self, model: QAbstractItemModel) -> list:
+        return [
+            (model.modelAboutToBeReset, self._beginSourceChange),
+            (model.modelReset, self._endSourceChange),
+            (model.rowsAboutToBeRemoved, self._beginSourceChange),
+            (model.rowsRemoved, self._endSourceChange),
+            (model.columnsAboutToBeInserted, self._beginSourceChange),
+            (model.columnsInserted, self._endSourceChange),
+            (model.columnsAboutToBeRemoved, self._beginSourceChange),
+            (model.columnsRemoved, self._endSourceChange),
+            (model.layoutAboutToBeChanged, self._beginSourceChange),
+            (model.layoutChanged, self._endSourceChange),
+            (model.dataChanged, self._onSourceDataChanged),
+            (model.headerDataChanged, self._onSourceHeaderDataChanged),
+        ]
+
+    def _beginSourceChange(self, *args) -> None:
+        if not self._resetting:
+            self._resetting = True
+            self.beginResetModel()
+
+    def _endSourceChange(self, *args) -> None:
+        self._setRows(self._windowRows())
+        if self._resetting:
+            self._resetting = False
+            self.endResetModel()
+
+    def _sourceRowsInserted(self, first: int, last: int, spliced: bool) -> None:
+        '''Show rows inserted in the source as one rowsInserted (plus the row pushed off a full page).'''
+        count = last - first + 1
+        # Renumber the page for the shifted source rows; their inverse entries shift along
+        oldRows = [row + count if row >= first else row for row in self._rows]
+        self._inverse[first:first] = [-1] * count
+        self._rows = oldRows
+        rows = self._windowRows()
+        if self._resetting or not spliced:
+            self._applyRows(rows)
+            return
+        # The new rows form one block at position; the rows after it keep their order
+        position = 0
+        while position < min(len(rows), len(oldRows)) and rows[position] == oldRows[position]:
+            position += 1
+        size = 0
+        while position + size < len(rows) and first <= rows[position + size] <= last:
+            size += 1
+        kept = len(rows) - size
+        if rows[position + size:] != oldRows[position:kept]:
+            self._applyRows(rows)
+            return
+        if kept < len(oldRows):
+            self.beginRemoveRows(QModelIndex(), kept, len(oldRows) - 1)
+            self._setRows(oldRows[:kept])
+            self.endRemoveRows()
+        if size:
+            self.beginInsertRows(QModelIndex(), position, position + size - 1)
+            self._setRows(rows)
+            self.endInsertRows()
+
+    def _onSourceDataChanged(self, topLeft: QModelIndex, bottomRight: QModelIndex, roles: list = ()) -> None:
+        '''Forward dataChanged for the part of the changed range that is on the page.'''
+        first, last = topLeft.row(), bottomRight.row()
+        if last - first < len(self._rows):
+            positions = [self._inverse[row] for row in range(first, min(last + 1, len(self._inverse))) if self._inverse[row] >= 0]
+        else:
+            positions = [position for position, row in enumerate(self._rows) if first <= row <= last]
+        if positions:
+            self.dataChanged.emit(self.createIndex(min(positions), topLeft.column()), self.createIndex(max(positions), bottomRight.column()), list(roles))
+
+    def _onSourceHeaderDataChanged(self, orientation: Qt.Orientation, first: int, last: int) -> None:
+        if orientation == Qt.Horizontal:
+            self.headerDataChanged.emit(orientation, first, last)
 
-    def _matchesSearchAndType(self, sourceRow: int, sourceParent: QModelIndex) -> bool:
-        '''Check if a row matches search text and data type filters.'''
-        model: Union[DataTableModel, QAbstractItemModel] = self.sourceModel()
+    def invalidateAndRefresh(self) -> None:
+        '''Recompute the filter result set and rebuild the page rows.'''
+        self._holdResult = False
+        self._swapPending = False
+        self._filterState.clearFilterResult()
+        self._applyRows(self._windowRows())
+
+    def invalidatePagination(self) -> None:
+        '''Rebuild the page rows from the cached result set (or one installed in the background).'''
+        self._swapPending = False
+        self._applyRows(self._windowRows())
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        '''Infinite scroll: append the next chunk of filtered rows.'''
+        if not self.canFetchMore(parent):
+            return
+        self._filterState.fetchMore()
+        rows = self._windowRows()
+        count = len(self._rows)
+        if len(rows) <= count or rows[:count] != self._rows:
+            # The loaded rows changed underneath (e.g. a held background result was swapped in)
+            self._applyRows(rows)
+            return
+        self.beginInsertRows(QModelIndex(), count, len(rows) - 1)
+        self._setRows(rows)
+        self.endInsertRows()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        '''Sort the whole result set by column (column < 0 restores filter order).'''
+        self.setSortSpec(self._sortSpecFor(column, order))
+
+    def setSortSpec(self, sortSpec: Tuple[Tuple[str, SortOrder], ...]) -> None:
+        '''Sort the whole result set by (columnKey, SortOrder) pairs, most significant first.'''
+        self._filterState.sortSpec = sortSpec
+        self._applyRows(self._windowRows())
+
+    def _windowRows(self) -> List[int]:
+        '''Source rows of the current page, in display order.'''
+        model = self.sourceModel()
+        if model is None:
+            return []
+        self._ensureOrderedRows()
         state = self._filterState
+        start, end = state.paginationRange
+        rows = state.orderedRows[start:end]
+        if self._holdResult:
+            # A held result may predate rows being removed
+            count = model.rowCount()
+            rows = [row for row in rows if row < count]
+        return rows
+
+    def _applyRows(self, rows: List[int]) -> None:
+        '''Install rows with one reset (row count changed) or one layout change.'''
+        if self._resetting:
+            self._setRows(rows)
+            return
+        if len(rows) != len(self._rows):
+            self.beginResetModel()
+            self._setRows(rows)
+            self.endResetModel()
+            return
+        if rows == self._rows:
+            return
+        self.layoutAboutToBeChanged.emit()
+        oldIndexes = self.persistentIndexList()
+        sourceCells = [(self._rows[index.row()], index.column()) for index in oldIndexes]
+        self._setRows(rows)
+        newIndexes = [self.createIndex(self._inverse[row], column) if self._inverse[row] >= 0 else QModelIndex() for row, column in sourceCells]
+        self.changePersistentIndexList(oldIndexes, newIndexes)
+        self.layoutChanged.emit()
+
+    def _setRows(self, rows: List[int]) -> None:
+        model = self.sourceModel()
+        count = model.rowCount() if model is not None else 0
+        if len(self._inverse) != count:
+            self._inverse = [-1] * count
+        else:
+            for row in self._rows:
+                self._inverse[row] = -1
+        for position, row in enumerate(rows):
+            self._inverse[row] = position
+        self._rows = rows
+
+    # QAbstractItemModel interface
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if parent.isValid() or not (0 <= row < len(self._rows)) or not (0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, child: Optional[QModelIndex] = None):
+        if child is None:
+            # QObject.parent()
+            return super().parent()
+        return QModelIndex()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        model = self.sourceModel()
+        return 0 if parent.isValid() or model is None else model.columnCount()
 
-        # Type filter — row-level: show row only if it has a non-null value
-        # in at least one column whose DataType matches the filter.
-        if state.dataTypeFilter is not None:
-            typeMatch = False
-            for colIdx, colKey in enumerate(model._visible_columns):
-                if model._column_types.get(colKey) != state.dataTypeFilter:
-                    continue
-                # Column type matches — check if this row has a value
-                index = model.index(sourceRow, colIdx, sourceParent)
-                value = model.data(index, Qt.DisplayRole)
-                if value is not None and str(value).strip() != '':
-                    typeMatch = True
-                    break
-            if not typeMatch:
-                return False
-
-        # Search filter
-        if state.searchText:
-            searchMatch = False
-            searchTerm = state.searchText
-
-            for colIdx, colKey in enumerate(model._visible_columns):
-                index = model.index(sourceRow, colIdx, sourceParent)
-                value = model.data(index, Qt.DisplayRole)
-
-                if colKey in model._search_funcs:
-                    if model._search_funcs[colKey](value, searchTerm):
-                        searchMatch = True
-                        break
-                elif value is not None and searchTerm.lower() in str(value).lower():
-                    searchMatch = True
-                    break
-
-            if not searchMatch:
-                return False
-
-        return True
-
-    def _getFilteredIndex(self, sourceRow: int, sourceParent: QModelIndex) -> int:
-        '''Get the position of sourceRow among all search+type-matched rows.
-
-        This gives us the "filtered index" so we can apply pagination correctly.
-        '''
-        count = 0
-        for row in range(sourceRow):
-            if self._matchesSearchAndType(row, sourceParent):
-                count += 1
-        return count
+    def mapToSource(self, proxyIndex: QModelIndex) -> QModelIndex:
+        if not proxyIndex.isValid() or proxyIndex.row() >= len(self._rows):
+            return QModelIndex()
+        return self.sourceModel().index(self._rows[proxyIndex.row()], proxyIndex.column())
+
+    def mapFromSource(self, sourceIndex: QModelIndex) -> QModelIndex:
+        if not sourceIndex.isValid() or sourceIndex.row() >= len(self._inverse):
+            return QModelIndex()
+        position = self._inverse[sourceIndex.row()]
+        return self.createIndex(position, sourceIndex.column()) if position >= 0 else QModelIndex()
 
 
 class DataTableHandler(Subscriber):
@@ -158,8 +391,8 @@ class DataTableHandler(Subscriber):
         self.table.selectionChanged.emit(selected, deselected)
 
     def on_search_text_changed(self, text: str, data: Dict[str, Any] = None):
-        '''Handle search text changed → delegate to Facade.'''
-        self.table._filterFacade.setSearch(text)
+        '''Handle search text changed → delegate to Facade (through the debounce stage).'''
+        self.table._searchPipeline.submit(text)
 
     def on_type_filter_changed(self, index: int, data: Dict[str, Any] = None):
         '''Handle type filter changed → parse index, delegate to Facade.'''
@@ -232,13 +465,12 @@ class DataTableHandler(Subscriber):
             return
 
         column_key = self.table._model._visible_columns[section]
-        header = self.table.tableView.horizontalHeader()
-        sort_order = header.sortIndicatorOrder()
+        # The clicked column's direction in the (possibly multi-column) sort spec
+        sort_order = dict(self.table._filterState.sortSpec).get(column_key)
+        if sort_order is None:
+            return
 
-        self.table.sortChanged.emit(
-            column_key,
-            SortOrder.ASCENDING if sort_order == 0 else SortOrder.DESCENDING,
-        )
+        self.table.sortChanged.emit(column_key, sort_order)
 
     def on_column_visibility_changed(self, data: Dict[str, Any] = None):
         '''Handle column visibility button clicked.'''
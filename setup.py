@@ -41,4 +41,5 @@ setup(
     include_package_data=True,
     python_requires='>=3.10',
     install_requires=['PySide6>=6.1.0', 'better-exceptions', 'loguru'],
+    extras_require={'fast': ['numpy']},
 )
@@ -0,0 +1,150 @@
+#                      M""""""""`M            dP
+#                      Mmmmmm   .M            88
+#                      MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                      MMP  .MMMMM  88    88  88888"    88'  `88
+#                      M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                      M         M  `88888P'  dP   `YP  `88888P'
+#                      MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                      * * * * * * * * * * * * * * * * * * * * *
+#                      * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                      * -  Copyright © 2026 (Z) Programing  - *
+#                      *    -  -  All Rights Reserved  -  -    *
+#                      * * * * * * * * * * * * * * * * * * * * *
+
+import datetime
+import random
+
+import pytest
+
+import datatable.models.datatable_model as datatable_model
+import datatable.models.filter_expression as filter_expression
+from datatable import DataTableModel, DataType, FilterExpression, FilterExpressionError
+
+COLUMNS = [
+    ('name', 'Name', DataType.STRING),
+    ('amount', 'Amount', DataType.NUMERIC),
+    ('progress', 'Progress', DataType.PROGRESS),
+    ('due', 'Due', DataType.DATE),
+    ('status', 'Status', DataType.STRING),
+    ('archived', 'Archived', DataType.BOOLEAN),
+]
+
+
+def makeModel(count: int = 400, seed: int = 11) -> DataTableModel:
+    rnd = random.Random(seed)
+    model = DataTableModel()
+    model.setColumns(COLUMNS)
+    # Missing and non-numeric values in every comparable column
+    model.setModelData([{
+        'name': f'row{i}',
+        'amount': rnd.choice([None, 'n/a', -2, 0, 1, 2.5, 3, 5, 8, '13']),
+        'progress': rnd.choice([None, 0, 3, 5, 50, 100]),
+        'due': rnd.choice([None, 'someday', '2024-01-01', '2024-03-15', datetime.date(2023, 12, 31)]),
+        'status': rnd.choice([None, 'open', 'closed', 'pending']),
+        'archived': rnd.choice([True, False, None]),
+    } for i in range(count)])
+    return model
+
+
+def number(row, key):
+    '''Oracle conversion: the number a comparable cell filters as, or None.'''
+    value = row.get(key)
+    if isinstance(value, datetime.date):
+        return float(value.toordinal())
+    if value is None or isinstance(value, bool):
+        return None
+    if key == 'due':
+        try:
+            return float(datetime.date.fromisoformat(value).toordinal())
+        except ValueError:
+            return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def both(a, b):
+    return a is not None and b is not None
+
+
+JAN_1 = float(datetime.date(2024, 1, 1).toordinal())
+
+# Expression -> independent row oracle; a missing value never satisfies a comparison
+EXPRESSIONS = [
+    ('amount > 2', lambda r: both(number(r, 'amount'), 0) and number(r, 'amount') > 2),
+    ('2 < amount', lambda r: both(number(r, 'amount'), 0) and number(r, 'amount') > 2),
+    ('amount != 3', lambda r: both(number(r, 'amount'), 0) and number(r, 'amount') != 3),
+    ('amount == -2', lambda r: both(number(r, 'amount'), 0) and number(r, 'amount') == -2),
+    ('1 < amount <= 5', lambda r: both(number(r, 'amount'), 0) and 1 < number(r, 'amount') <= 5),
+    ('0 <= progress < 50', lambda r: both(number(r, 'progress'), 0) and 0 <= number(r, 'progress') < 50),
+    ('amount < progress', lambda r: both(number(r, 'amount'), number(r, 'progress')) and number(r, 'amount') < number(r, 'progress')),
+    ('amount != progress', lambda r: both(number(r, 'amount'), number(r, 'progress')) and number(r, 'amount') != number(r, 'progress')),
+    ("due < '2024-01-01'", lambda r: both(number(r, 'due'), 0) and number(r, 'due') < JAN_1),
+    ("status == 'open'", lambda r: r['status'] == 'open'),
+    ("status != 'open'", lambda r: r['status'] is not None and r['status'] != 'open'),
+    ("status in ('open', 'pending')", lambda r: r['status'] in ('open', 'pending')),
+    ("status not in ['open', 'pending']", lambda r: r['status'] not in ('open', 'pending')),
+    ('status in (None,)', lambda r: r['status'] is None),
+    ('amount in (3, 5)', lambda r: r['amount'] in (3, 5)),
+    ('archived', lambda r: bool(r['archived'])),
+    ('not archived', lambda r: not r['archived']),
+    ("amount > 1 and status == 'open' or not archived",
+     lambda r: (both(number(r, 'amount'), 0) and number(r, 'amount') > 1 and r['status'] == 'open') or not r['archived']),
+    ("not (amount >= 3 or due >= '2024-03-15')",
+     lambda r: not ((both(number(r, 'amount'), 0) and number(r, 'amount') >= 3) or (both(number(r, 'due'), 0) and number(r, 'due') >= JAN_1 + 74))),
+]
+
+
+@pytest.mark.parametrize('text, oracle', EXPRESSIONS, ids=[text for text, _ in EXPRESSIONS])
+def test_mask_and_predicate_agree(app, text, oracle):
+    model = makeModel()
+    expression = FilterExpression(text, model)
+    expected = bytes(1 if oracle(row) else 0 for row in model._data)
+    assert any(expected) and not all(expected)
+
+    assert bytes(1 if expression.predicate(row) else 0 for row in model._data) == expected
+    if datatable_model.np is not None:
+        assert expression._maskFn is not None
+    assert expression.mask() == expected
+
+
+@pytest.mark.parametrize('text, oracle', EXPRESSIONS, ids=[text for text, _ in EXPRESSIONS])
+def test_mask_without_numpy(app, monkeypatch, text, oracle):
+    monkeypatch.setattr(datatable_model, 'np', None)
+    monkeypatch.setattr(filter_expression, 'np', None)
+    model = makeModel()
+    expression = FilterExpression(text, model)
+    assert expression._maskFn is None
+    assert expression.mask() == bytes(1 if oracle(row) else 0 for row in model._data)
+
+
+@pytest.mark.parametrize('text', [
+    "__import__('os')",
+    'len(name) > 3',
+    'name.upper() == "ROW1"',
+    'amount.real > 1',
+    "name[0] == 'r'",
+    'amount + 1 > 2',
+    'lambda: 1',
+    '[row for row in name]',
+    'amount is None',
+    'status in status',
+])
+def test_unsafe_syntax_is_rejected(app, text):
+    with pytest.raises(FilterExpressionError):
+        FilterExpression(text, makeModel(5))
+
+
+@pytest.mark.parametrize('text, message', [
+    ('missing > 1', 'Unknown column: missing'),
+    ("status == 'open' and owner", 'Unknown column: owner'),
+    ("owner in ('a',)", 'Unknown column: owner'),
+    ('1 < 2', 'needs a column name'),
+    ("due < 'notadate'", "Invalid value for column due: 'notadate'"),
+    ('amount >', 'Invalid filter expression'),
+])
+def test_invalid_expressions_raise(app, text, message):
+    with pytest.raises(FilterExpressionError, match=message):
+        FilterExpression(text, makeModel(5))
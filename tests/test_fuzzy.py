@@ -0,0 +1,98 @@
+#                      M""""""""`M            dP
+#                      Mmmmmm   .M            88
+#                      MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                      MMP  .MMMMM  88    88  88888"    88'  `88
+#                      M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                      M         M  `88888P'  dP   `YP  `88888P'
+#                      MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                      * * * * * * * * * * * * * * * * * * * * *
+#                      * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                      * -  Copyright © 2026 (Z) Programing  - *
+#                      *    -  -  All Rights Reserved  -  -    *
+#                      * * * * * * * * * * * * * * * * * * * * *
+
+import random
+
+import pytest
+
+from datatable import DataTable, DataType, SearchMode
+from datatable.widgets.SearchQuery import compileFuzzyPattern, fuzzyDistance
+
+
+def substringEditDistance(term: str, text: str) -> int:
+    '''Plain DP: fewest edits turning term into any substring of text.'''
+    previous = [0] * (len(text) + 1)  # the match may start anywhere in text
+    for i, char in enumerate(term, 1):
+        current = [i] + [0] * len(text)
+        for j, other in enumerate(text, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char != other))
+        previous = current
+    return min(previous)
+
+
+def randomWord(rnd: random.Random, low: int, high: int, alphabet: str = 'abcd') -> str:
+    return ''.join(rnd.choice(alphabet) for _ in range(rnd.randint(low, high)))
+
+
+def test_distance_matches_dynamic_programming():
+    rnd = random.Random(11)
+    for _ in range(3000):
+        term = randomWord(rnd, 1, 12)
+        text = randomWord(rnd, 0, 20)
+        assert fuzzyDistance(compileFuzzyPattern(term), text) == substringEditDistance(term, text), (term, text)
+
+
+def test_distance_handles_terms_longer_than_a_machine_word():
+    rnd = random.Random(5)
+    for _ in range(50):
+        term = randomWord(rnd, 60, 90, 'ab')
+        text = randomWord(rnd, 40, 120, 'ab')
+        assert fuzzyDistance(compileFuzzyPattern(term), text) == substringEditDistance(term, text)
+
+
+@pytest.mark.parametrize('term, maxEdits', [('a', 0), ('abc', 0), ('abcd', 1), ('abcdef', 2), ('abcdefghi', 3), ('  AbCd  ', 1)])
+def test_edit_budget_grows_with_the_term(term, maxEdits):
+    pattern = compileFuzzyPattern(term)
+    assert pattern.term == term.strip().lower()
+    assert pattern.maxEdits == maxEdits
+    assert [len(pieces) for pieces in pattern.pieces] == list(range(1, maxEdits + 2))
+    assert all(''.join(pieces) == pattern.term for pieces in pattern.pieces)
+
+
+def test_pieces_prune_no_match_within_budget():
+    '''Pigeonhole: a text within b edits of the term contains one of pieces[b] unchanged.'''
+    rnd = random.Random(17)
+    for _ in range(3000):
+        pattern = compileFuzzyPattern(randomWord(rnd, 4, 12))
+        text = randomWord(rnd, 0, 16)
+        distance = substringEditDistance(pattern.term, text)
+        for budget in range(distance, pattern.maxEdits + 1):
+            assert pattern.pieceSearch[budget](text), (pattern.term, text, budget)
+
+
+def rankedByBruteForce(names, term: str, limit: int):
+    pattern = compileFuzzyPattern(term)
+    scored = [(substringEditDistance(pattern.term, name), row) for row, name in enumerate(names)]
+    return [row for distance, row in sorted(scored) if distance <= pattern.maxEdits][:limit]
+
+
+@pytest.mark.parametrize('indexProxy', [False, True])
+@pytest.mark.parametrize('limit', [1, 5, 40, 1000])
+def test_top_k_is_best_first(app, indexProxy, limit):
+    rnd = random.Random(limit)
+    names = [randomWord(rnd, 3, 10, 'abcde') for _ in range(600)]
+    table = DataTable(indexProxy=indexProxy)
+    table.setColumns([('name', 'Name', DataType.STRING)])
+    table.setData([{'name': name} for name in names])
+    table.setRowsPerPage(100)
+    table.setSearchMode(SearchMode.FUZZY).setFuzzyLimit(limit)
+
+    for term in ('abcde', 'cabbed', 'eeaadd'):
+        table.search(term)
+        expected = rankedByBruteForce(names, term, limit)
+        state = table.getFilterStateInstance()
+        # Fewest edits first, ties by row
+        assert list(state.filteredRows) == expected
+        proxy = table._proxyModel
+        assert [proxy.mapToSource(proxy.index(row, 0)).row() for row in range(proxy.rowCount())] == expected[:100]
@@ -0,0 +1,64 @@
+#                      M""""""""`M            dP
+#                      Mmmmmm   .M            88
+#                      MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                      MMP  .MMMMM  88    88  88888"    88'  `88
+#                      M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                      M         M  `88888P'  dP   `YP  `88888P'
+#                      MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                      * * * * * * * * * * * * * * * * * * * * *
+#                      * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                      * -  Copyright © 2026 (Z) Programing  - *
+#                      *    -  -  All Rights Reserved  -  -    *
+#                      * * * * * * * * * * * * * * * * * * * * *
+
+import pytest
+
+from datatable import DataTable, DataType, SearchMode
+
+ROWS = [
+    {'name': 'alpha', 'flag': True},
+    {'name': 'beta', 'flag': False},
+    {'name': 'gamma', 'flag': True},
+]
+
+
+def visibleNames(table: DataTable):
+    proxy = table._proxyModel
+    return sorted(proxy.index(row, 0).data() for row in range(proxy.rowCount()))
+
+
+@pytest.mark.parametrize('indexProxy', [False, True])
+@pytest.mark.parametrize('dataType', [DataType.BOOLEAN, DataType.ICON_BOOLEAN])
+def test_boolean_columns_search_yes_no(app, dataType, indexProxy):
+    table = DataTable(indexProxy=indexProxy)
+    table.setColumns([('name', 'Name', DataType.STRING), ('flag', 'Flag', dataType)])
+    table.setData([dict(row) for row in ROWS])
+
+    assert visibleNames(table.search('yes')) == ['alpha', 'gamma']
+    assert visibleNames(table.search('no')) == ['beta']
+    assert visibleNames(table.search('true')) == []
+
+
+@pytest.mark.parametrize('indexProxy', [False, True])
+def test_custom_search_function_is_not_narrowed(app, indexProxy):
+    table = DataTable(indexProxy=indexProxy)
+    table.setColumns([('name', 'Name', DataType.STRING)])
+    table.setData([{'name': 'ab'}, {'name': 'abc'}, {'name': 'x'}])
+    table.getModelInstance().setSearchFunction('name', lambda value, term: str(value).lower() == term.lower())
+
+    assert visibleNames(table.search('ab')) == ['ab']
+    # 'abc' contains 'ab', but an exact match on 'abc' is not among the 'ab' matches
+    assert visibleNames(table.search('abc')) == ['abc']
+    assert visibleNames(table.search('name:abc')) == ['abc']
+
+
+@pytest.mark.parametrize('indexProxy', [False, True])
+def test_fuzzy_results_are_shown_best_first(app, indexProxy):
+    table = DataTable(indexProxy=indexProxy)
+    table.setColumns([('name', 'Name', DataType.STRING)])
+    table.setData([{'name': name} for name in ('kiwi', 'bandana', 'banan', 'bananas', 'banana')])
+    table.setSearchMode(SearchMode.FUZZY).search('banana')
+
+    proxy = table._proxyModel
+    assert [proxy.index(row, 0).data() for row in range(proxy.rowCount())] == ['bananas', 'banana', 'bandana', 'banan']
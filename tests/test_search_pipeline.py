@@ -0,0 +1,86 @@
+#                      M""""""""`M            dP
+#                      Mmmmmm   .M            88
+#                      MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                      MMP  .MMMMM  88    88  88888"    88'  `88
+#                      M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                      M         M  `88888P'  dP   `YP  `88888P'
+#                      MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                      * * * * * * * * * * * * * * * * * * * * *
+#                      * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                      * -  Copyright © 2026 (Z) Programing  - *
+#                      *    -  -  All Rights Reserved  -  -    *
+#                      * * * * * * * * * * * * * * * * * * * * *
+
+import time
+
+import pytest
+
+from datatable import DataTable, DataType
+
+NAMES = [f'name{i}' for i in range(2000)]
+
+
+def matching(term: str):
+    return sorted(name for name in NAMES if term in name)
+
+
+def visibleNames(table: DataTable):
+    proxy = table._proxyModel
+    return sorted(proxy.index(row, 0).data() for row in range(proxy.rowCount()))
+
+
+def backgroundTable(indexProxy: bool, events: list) -> DataTable:
+    table = DataTable(indexProxy=indexProxy)
+    table.setColumns([('name', 'Name', DataType.STRING)])
+    table.setData([{'name': name} for name in NAMES])
+    table.setRowsPerPage(100)  # larger than any result below
+    table.setBackgroundFiltering(True)
+    table.searchSettled.connect(lambda term: events.append(('settled', term, visibleNames(table))))
+    table.filteringBusyChanged.connect(lambda busy: events.append(('busy', busy, visibleNames(table))))
+    return table
+
+
+def waitIdle(app, table: DataTable, timeout: float = 10.0) -> None:
+    deadline = time.time() + timeout
+    while (table._backgroundFilter.isBusy() or table._searchPipeline.isBusy()) and time.time() < deadline:
+        app.processEvents()
+    app.processEvents()
+
+
+@pytest.mark.parametrize('indexProxy', [False, True])
+def test_settled_waits_for_background_result(app, indexProxy):
+    events = []
+    table = backgroundTable(indexProxy, events)
+    table.search('name199')
+    assert not any(event[0] == 'settled' for event in events)
+    waitIdle(app, table)
+
+    settled = [event for event in events if event[0] == 'settled']
+    assert settled == [('settled', 'name199', matching('name199'))]
+
+
+@pytest.mark.parametrize('indexProxy', [False, True])
+def test_superseded_term_does_not_settle(app, indexProxy):
+    events = []
+    table = backgroundTable(indexProxy, events)
+    table.search('name1')
+    table.search('name42')
+    waitIdle(app, table)
+
+    settled = [event for event in events if event[0] == 'settled']
+    assert settled == [('settled', 'name42', matching('name42'))]
+    assert visibleNames(table) == matching('name42')
+
+
+@pytest.mark.parametrize('indexProxy', [False, True])
+def test_idle_follows_swap_and_settle(app, indexProxy):
+    events = []
+    table = backgroundTable(indexProxy, events)
+    table.search('name77')
+    waitIdle(app, table)
+
+    expected = matching('name77')
+    assert [event[:2] for event in events] == [('busy', True), ('settled', 'name77'), ('busy', False)]
+    # Listeners of either signal already see the new rows
+    assert events[1][2] == expected and events[2][2] == expected
@@ -0,0 +1,122 @@
+#                      M""""""""`M            dP
+#                      Mmmmmm   .M            88
+#                      MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                      MMP  .MMMMM  88    88  88888"    88'  `88
+#                      M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                      M         M  `88888P'  dP   `YP  `88888P'
+#                      MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                      * * * * * * * * * * * * * * * * * * * * *
+#                      * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                      * -  Copyright © 2026 (Z) Programing  - *
+#                      *    -  -  All Rights Reserved  -  -    *
+#                      * * * * * * * * * * * * * * * * * * * * *
+
+import random
+
+import pytest
+
+import datatable.models.datatable_model as datatable_model
+import datatable.widgets.FilterEngine as filter_engine
+from datatable import DataTable, DataType, SortOrder
+
+COLUMNS = [('name', 'Name', DataType.STRING), ('amount', 'Amount', DataType.NUMERIC), ('status', 'Status', DataType.STRING)]
+STATUSES = ['open', 'closed', 'pending']
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    '''Run with the NumPy sort path and with the pure-Python fallback.'''
+    if request.param == 'python':
+        monkeypatch.setattr(datatable_model, 'np', None)
+        monkeypatch.setattr(filter_engine, 'np', None)
+    elif datatable_model.np is None:
+        pytest.skip('NumPy is not installed')
+    return request.param
+
+
+def makeTable(count: int, seed: int = 7) -> DataTable:
+    rnd = random.Random(seed)
+    table = DataTable(indexProxy=True)
+    table.setColumns(COLUMNS)
+    # Few distinct amounts and statuses: plenty of ties; None sorts like the default sort function's 0
+    table.setData([{'name': f'row{i}', 'amount': rnd.choice([None, 0, 1, 2, 3, 5, 8]), 'status': rnd.choice(STATUSES)} for i in range(count)])
+    table.setRowsPerPage(10)
+    return table
+
+
+def stableSorted(table: DataTable, rows, sortSpec):
+    '''Brute force: stable sorts by each column's sort keys, least significant first.'''
+    model = table.getModelInstance()
+    rows = list(rows)
+    for columnKey, order in reversed(sortSpec):
+        keys = model.sortKeys(columnKey)
+        rows.sort(key=keys.__getitem__, reverse=order == SortOrder.DESCENDING)
+    return rows
+
+
+SPECS = [
+    (('amount', SortOrder.ASCENDING),),
+    (('amount', SortOrder.DESCENDING),),
+    (('status', SortOrder.ASCENDING),),
+    (('status', SortOrder.DESCENDING), ('amount', SortOrder.ASCENDING)),
+    (('amount', SortOrder.DESCENDING), ('name', SortOrder.DESCENDING)),
+]
+
+
+@pytest.mark.parametrize('sortSpec', SPECS)
+def test_partial_sort_is_a_prefix_of_the_full_stable_sort(app, backend, sortSpec):
+    table = makeTable(300)
+    proxy = table._proxyModel
+    # Filter order need not be source order (e.g. a ranked result): ties must keep it
+    rows = list(range(300))
+    random.Random(3).shuffle(rows)
+    rows = rows[:200]
+
+    expected = stableSorted(table, rows, sortSpec)
+    assert proxy._sortRows(rows, sortSpec) == expected
+    for limit in (1, 7, 10, 50, 199, 200, 500):
+        assert proxy._sortRows(rows, sortSpec, limit) == expected[:limit]
+
+
+def test_ties_keep_filter_order(app, backend):
+    table = makeTable(120)
+    table.sort('status', SortOrder.ASCENDING)
+    state = table.getFilterStateInstance()
+
+    data = table.getData()
+    for page in range(1, 13):
+        table.setPage(page)
+        rows = list(state.orderedRows)[(page - 1) * 10:page * 10]
+        proxy = table._proxyModel
+        assert [proxy.mapToSource(proxy.index(row, 0)).row() for row in range(proxy.rowCount())] == rows
+    ordered = list(state.orderedRows)
+    for status in STATUSES:
+        same = [row for row in ordered if data[row]['status'] == status]
+        assert same == sorted(same)
+
+
+def test_paging_past_the_prefix_extends_the_order(app, backend):
+    table = makeTable(400)
+    sortSpec = (('amount', SortOrder.DESCENDING), ('status', SortOrder.ASCENDING))
+    table.sortBy(sortSpec)
+    state = table.getFilterStateInstance()
+    expected = stableSorted(table, range(400), sortSpec)
+    assert not state.orderComplete
+    assert list(state.orderedRows) == expected[:10]
+
+    sizes = [len(state.orderedRows)]
+    for page in (2, 3, 5, 9, 10, 11, 40):
+        table.setPage(page)
+        ordered = list(state.orderedRows)
+        assert ordered == expected[:len(ordered)]
+        assert len(ordered) >= min(page * 10, 400)
+        if len(ordered) > sizes[-1]:
+            # Each re-selection at least doubles the sorted prefix
+            assert len(ordered) >= 2 * sizes[-1] or state.orderComplete
+        sizes.append(len(ordered))
+        proxy = table._proxyModel
+        shown = [proxy.mapToSource(proxy.index(row, 0)).row() for row in range(proxy.rowCount())]
+        assert shown == expected[(page - 1) * 10:page * 10]
+    # Past a quarter of the rows a full sort is cheaper than another selection
+    assert state.orderComplete and len(state.orderedRows) == 400
@@ -0,0 +1,204 @@
+#                      M""""""""`M            dP
+#                      Mmmmmm   .M            88
+#                      MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                      MMP  .MMMMM  88    88  88888"    88'  `88
+#                      M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                      M         M  `88888P'  dP   `YP  `88888P'
+#                      MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                      * * * * * * * * * * * * * * * * * * * * *
+#                      * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                      * -  Copyright © 2026 (Z) Programing  - *
+#                      *    -  -  All Rights Reserved  -  -    *
+#                      * * * * * * * * * * * * * * * * * * * * *
+
+import pytest
+from PySide6.QtCore import QModelIndex
+
+from datatable import DataTable, DataType, ScrollMode, SearchMode, SortOrder
+
+COLUMNS = [('name', 'Name', DataType.STRING), ('amount', 'Amount', DataType.NUMERIC), ('status', 'Status', DataType.STRING)]
+
+
+def makeRows(count: int):
+    return [{'name': f'row{i}', 'amount': (i * 37) % 50, 'status': 'open' if i % 3 else 'closed'} for i in range(count)]
+
+
+def makeTable(indexProxy: bool, count: int = 60) -> DataTable:
+    table = DataTable(indexProxy=indexProxy)
+    table.setColumns(COLUMNS)
+    table.setData(makeRows(count))
+    table.setRowsPerPage(10)
+    return table
+
+
+def visibleRows(table: DataTable):
+    proxy = table._proxyModel
+    return [proxy.mapToSource(proxy.index(row, 0)).row() for row in range(proxy.rowCount())]
+
+
+def expectedRows(table: DataTable, status=None, sortDescending=None):
+    '''Brute force: filter the source rows, then stable-sort them by amount.'''
+    data = table.getData()
+    rows = [row for row in range(len(data)) if status is None or data[row]['status'] == status]
+    if sortDescending is not None:
+        rows.sort(key=lambda row: data[row]['amount'], reverse=sortDescending)
+    return rows
+
+
+def spyOnSplice(table: DataTable) -> list:
+    '''Record the result of every splice attempt of the table's proxy.'''
+    proxy = table._proxyModel
+    calls = []
+    splice = proxy._spliceInsertedRows
+
+    def recorded(*args):
+        result = splice(*args)
+        calls.append(result)
+        return result
+
+    proxy._spliceInsertedRows = recorded
+    return calls
+
+
+def recordRowSignals(table: DataTable) -> list:
+    proxy = table._proxyModel
+    signals = []
+    proxy.rowsInserted.connect(lambda parent, first, last: signals.append(('inserted', first, last)))
+    proxy.rowsRemoved.connect(lambda parent, first, last: signals.append(('removed', first, last)))
+    proxy.modelReset.connect(lambda: signals.append(('reset',)))
+    return signals
+
+
+@pytest.mark.parametrize('indexProxy', [False, True])
+def test_append_while_sorted(app, indexProxy):
+    table = makeTable(indexProxy)
+    # A page of 25 out of 40 matches: the whole result is sorted, not just a prefix
+    table.setRowsPerPage(25).setFacetFilter('status', ['open']).sort('amount', SortOrder.DESCENDING)
+    state = table.getFilterStateInstance()
+    assert state.orderComplete
+    calls = spyOnSplice(table)
+
+    for amount in (49, 0, 25, 25, 12):
+        table.appendRow({'name': f'new{amount}', 'amount': amount, 'status': 'open'})
+        assert visibleRows(table) == expectedRows(table, 'open', True)[:25]
+    table.appendRow({'name': 'skipped', 'amount': 30, 'status': 'closed'})
+
+    assert calls == [True] * 6
+    # Equal amounts keep source order, like a full stable sort
+    assert list(state.orderedRows) == expectedRows(table, 'open', True)
+    assert state.filteredCount == len(expectedRows(table, 'open'))
+    table.setPage(2)
+    assert visibleRows(table) == expectedRows(table, 'open', True)[25:50]
+
+
+@pytest.mark.parametrize('indexProxy', [False, True])
+def test_append_around_a_partial_order(app, indexProxy):
+    table = makeTable(indexProxy)
+    table.sort('amount', SortOrder.DESCENDING)
+    state = table.getFilterStateInstance()
+    assert not state.orderComplete
+    calls = spyOnSplice(table)
+
+    table.appendRow({'name': 'top', 'amount': 100, 'status': 'open'})
+    table.appendRow({'name': 'bottom', 'amount': -1, 'status': 'open'})
+
+    assert calls == [True, True]
+    assert visibleRows(table) == expectedRows(table, sortDescending=True)[:10]
+    # Paging past the selected prefix extends the order over the spliced rows
+    table.setPage(7)
+    assert visibleRows(table) == expectedRows(table, sortDescending=True)[60:70]
+
+
+@pytest.mark.parametrize('indexProxy', [False, True])
+def test_mid_table_insert_renumbers_later_rows(app, indexProxy):
+    table = makeTable(indexProxy)
+    table.setFacetFilter('status', ['open'])
+    calls = spyOnSplice(table)
+
+    table.insertRow(4, {'name': 'inserted', 'amount': 1, 'status': 'open'})
+    table.insertRow(0, {'name': 'skipped', 'amount': 1, 'status': 'closed'})
+
+    assert calls == [True, True]
+    assert visibleRows(table) == expectedRows(table, 'open')[:10]
+    assert table.getData()[visibleRows(table)[2]]['name'] == 'inserted'
+    state = table.getFilterStateInstance()
+    assert list(state.filteredRows) == expectedRows(table, 'open')
+    proxy = table._proxyModel
+    model = table.getModelInstance()
+    for position, row in enumerate(visibleRows(table)):
+        assert proxy.mapFromSource(model.index(row, 0)).row() == position
+
+
+def test_insert_pushes_a_row_off_a_full_page(app):
+    table = makeTable(indexProxy=True)
+    table.sort('amount', SortOrder.DESCENDING)
+    before = visibleRows(table)
+    signals = recordRowSignals(table)
+
+    table.appendRow({'name': 'top', 'amount': 100, 'status': 'open'})
+
+    assert signals == [('removed', 9, 9), ('inserted', 0, 0)]
+    assert visibleRows(table) == [len(table.getData()) - 1] + before[:9]
+    assert visibleRows(table) == expectedRows(table, sortDescending=True)[:10]
+
+
+def test_insert_off_the_page_emits_nothing(app):
+    table = makeTable(indexProxy=True)
+    table.sort('amount', SortOrder.DESCENDING)
+    signals = recordRowSignals(table)
+
+    table.appendRow({'name': 'bottom', 'amount': -1, 'status': 'open'})
+
+    assert signals == []
+    assert visibleRows(table) == expectedRows(table, sortDescending=True)[:10]
+
+
+@pytest.mark.parametrize('indexProxy', [False, True])
+def test_insert_in_infinite_scroll_mode(app, indexProxy):
+    table = makeTable(indexProxy)
+    table.setScrollMode(ScrollMode.INFINITE, 10)
+    table._proxyModel.fetchMore(QModelIndex())
+    assert len(visibleRows(table)) == 20
+    signals = recordRowSignals(table)
+
+    # Inside the loaded window: the window grows by the new row
+    table.insertRow(5, {'name': 'inside', 'amount': 1, 'status': 'open'})
+    assert visibleRows(table) == expectedRows(table)[:21]
+    # Past the loaded window: nothing more is shown
+    table.appendRow({'name': 'outside', 'amount': 1, 'status': 'open'})
+    assert visibleRows(table) == expectedRows(table)[:21]
+    if indexProxy:
+        assert signals == [('inserted', 5, 5)]
+    table._proxyModel.fetchMore(QModelIndex())
+    assert visibleRows(table) == expectedRows(table)[:31]
+
+
+@pytest.mark.parametrize('indexProxy', [False, True])
+def test_fuzzy_search_is_not_spliced(app, indexProxy):
+    table = makeTable(indexProxy)
+    table.setSearchMode(SearchMode.FUZZY)
+    table.search('row12')
+    calls = spyOnSplice(table)
+
+    table.appendRow({'name': 'row12', 'amount': 1, 'status': 'open'})
+
+    # Fuzzy ranks rows against each other, so the result is recomputed instead
+    assert calls == []
+    names = [table.getData()[row]['name'] for row in visibleRows(table)]
+    assert names[:2] == ['row12', 'row12']
+
+
+@pytest.mark.parametrize('indexProxy', [False, True])
+def test_held_background_result_is_not_spliced(app, indexProxy):
+    table = makeTable(indexProxy)
+    table.setFacetFilter('status', ['open'])
+    calls = spyOnSplice(table)
+    # A background evaluation is pending: the shown result is about to be replaced
+    table._proxyModel.holdFilterResult()
+
+    table.appendRow({'name': 'held', 'amount': 1, 'status': 'open'})
+
+    assert calls == []
+    assert visibleRows(table) == expectedRows(table, 'open')[:10]
+    assert table.getFilterStateInstance().filteredCount == len(expectedRows(table, 'open'))